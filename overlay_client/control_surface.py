@@ -7,6 +7,7 @@ import sys
 import time
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QGuiApplication, QPainter
 
 from overlay_client.group_transform import GroupTransform
@@ -190,6 +191,7 @@ class ControlSurfaceMixin:
             _CLIENT_LOGGER.debug("Payload ID cycling disabled")
             self._cycle_payload_ids = []
             self._cycle_current_id = None
+        self._mark_legacy_cache_dirty()
         self.update()
 
     def set_cycle_payload_copy_enabled(self, enabled: Optional[bool]) -> None:
@@ -438,10 +440,21 @@ class ControlSurfaceMixin:
                 self._font_min_point,
                 self._font_max_point,
             )
-            self._update_label_fonts()
-            self._refresh_legacy_items()
-            self.update()
-            self._notify_font_bounds_changed()
+            self._schedule_font_refresh()
+
+    def _schedule_font_refresh(self) -> None:
+        """Coalesce bursts of font bound changes into a single refresh on the next loop turn."""
+        if self._font_refresh_pending:
+            return
+        self._font_refresh_pending = True
+        QTimer.singleShot(0, self._apply_pending_font_refresh)
+
+    def _apply_pending_font_refresh(self) -> None:
+        self._font_refresh_pending = False
+        self._update_label_fonts()
+        self._refresh_legacy_items()
+        self.update()
+        self._notify_font_bounds_changed()
 
     def set_legacy_font_step(self, step: Optional[float]) -> None:
         if step is None:
@@ -680,9 +693,8 @@ class ControlSurfaceMixin:
         if not self._repaint_debounce_log:
             return
         counts = getattr(self, "_repaint_metrics", {}).get("counts", {})
-        stats = getattr(self, "_paint_stats", {})
-        paint_count = stats.get("paint_count", 0) if isinstance(stats, dict) else 0
-        stats["paint_count"] = 0
+        paint_count = self._paint_count
+        self._paint_count = 0
         last_state = getattr(self, "_paint_log_state", {}) or {}
         ingest_total = counts.get("ingest", 0) if isinstance(counts, dict) else 0
         purge_total = counts.get("purge", 0) if isinstance(counts, dict) else 0
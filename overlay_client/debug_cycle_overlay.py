@@ -457,8 +457,8 @@ class CycleOverlayView:
                 info_lines.append("ttl: ∞")
             else:
                 monotonic_now = getattr(payload_model, "monotonic_now", None)
-                now = monotonic_now() if callable(monotonic_now) else time.monotonic()
-                remaining = max(0.0, current_item.expiry - now)
+                now = monotonic_now() if callable(monotonic_now) else time.monotonic_ns()
+                remaining = max(0.0, (current_item.expiry - now) / 1_000_000_000)
                 info_lines.append(f"ttl: {remaining:.1f}s")
         updated_iso = data.get("__mo_updated__") if isinstance(data, Mapping) else None
         if isinstance(updated_iso, str):
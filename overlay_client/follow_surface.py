@@ -414,18 +414,24 @@ class FollowSurfaceMixin:
         try:
             parent_window = QWindow.fromWinId(native_id)
         except Exception as exc:  # pragma: no cover - defensive guard
-            _CLIENT_LOGGER.debug("Failed to wrap native window %s: %s; %s", identifier, exc, self.format_scale_debug())
+            if _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+                _CLIENT_LOGGER.debug("Failed to wrap native window %s: %s; %s", identifier, exc, self.format_scale_debug())
             return
         if parent_window is None:
             return
         window_handle.setTransientParent(parent_window)
         self._transient_parent_window = parent_window
         self._transient_parent_id = identifier
-        _CLIENT_LOGGER.debug("Set overlay transient parent to Elite window %s; %s", identifier, self.format_scale_debug())
+        if _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+            _CLIENT_LOGGER.debug("Set overlay transient parent to Elite window %s; %s", identifier, self.format_scale_debug())
 
     def _handle_missing_follow_state(self) -> None:
         if not self._lost_window_logged:
-            _CLIENT_LOGGER.debug("Elite Dangerous window not found; waiting for window to appear; %s", self.format_scale_debug())
+            if _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+                _CLIENT_LOGGER.debug(
+                    "Elite Dangerous window not found; waiting for window to appear; %s",
+                    self.format_scale_debug(),
+                )
             self._lost_window_logged = True
         if self._last_follow_state is None:
             if self._force_render:
@@ -465,11 +471,12 @@ class FollowSurfaceMixin:
             return
         screen = self._screen_for_rect(rect)
         if screen is not None and window.screen() is not screen:
-            _CLIENT_LOGGER.debug(
-                "Moving overlay to screen %s; %s",
-                self._describe_screen(screen),
-                self.format_scale_debug(),
-            )
+            if _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+                _CLIENT_LOGGER.debug(
+                    "Moving overlay to screen %s; %s",
+                    self._describe_screen(screen),
+                    self.format_scale_debug(),
+                )
             window.setScreen(screen)
             self._last_screen_name = self._describe_screen(screen)
         elif screen is not None:
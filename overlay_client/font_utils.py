@@ -1,22 +1,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 from PyQt6.QtGui import QFont
 
 _LOGGER = logging.getLogger("EDMC.ModernOverlay.Fonts")
 
 
-def apply_font_fallbacks(font: QFont, fallback_families: Sequence[str] | None) -> None:
-    """Attach fallback families to a QFont so emoji glyphs can be resolved."""
-    if font is None or not fallback_families:
-        return
-
+@lru_cache(maxsize=64)
+def _composite_families(primary: str, fallback_families: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the de-duplicated family chain for ``primary`` plus its fallbacks."""
     families: list[str] = []
     seen: set[str] = set()
 
-    primary = font.family()
     if primary:
         families.append(primary)
         seen.add(primary.casefold())
@@ -30,6 +28,17 @@ def apply_font_fallbacks(font: QFont, fallback_families: Sequence[str] | None) -
             continue
         seen.add(lowered)
         families.append(name)
+    return tuple(families)
+
+
+def apply_font_fallbacks(font: QFont, fallback_families: Sequence[str] | None) -> None:
+    """Attach fallback families to a QFont so emoji glyphs can be resolved."""
+    if font is None or not fallback_families:
+        return
+
+    # The family chain only depends on the primary family and the fallback list,
+    # so it is memoised; only the setFamilies call below touches the QFont.
+    families = _composite_families(font.family() or "", tuple(fallback_families))
 
     if len(families) <= 1:
         return
@@ -37,12 +46,12 @@ def apply_font_fallbacks(font: QFont, fallback_families: Sequence[str] | None) -
     set_families = getattr(font, "setFamilies", None)
     if callable(set_families):
         try:
-            set_families(families)
+            set_families(list(families))
         except Exception as exc:  # pragma: no cover - defensive guard
             _LOGGER.warning("Failed to set composite font families: %s", exc)
         return
 
-    fallback_only = families[1:]
+    fallback_only = list(families[1:])
     set_fallback = getattr(font, "setFallbackFamilies", None)
     if callable(set_fallback) and fallback_only:
         try:
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupKey:
     plugin: str
     suffix: Optional[str] = None
@@ -14,7 +14,7 @@ class GroupKey:
         return self.plugin, self.suffix
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupTransform:
     dx: float = 0.0
     dy: float = 0.0
@@ -36,7 +36,7 @@ class GroupTransform:
     background_border_width: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupBounds:
     min_x: float = float("inf")
     min_y: float = float("inf")
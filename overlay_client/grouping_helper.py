@@ -48,7 +48,9 @@ class FillGroupingHelper:
         pixel_scale = 1.0
         settings = self._render_settings
 
-        def preset_point_size(label: str) -> float:
+        preset_sizes: Dict[str, float] = {}
+
+        def resolve_preset_point_size(label: str) -> float:
             if settings is not None:
                 try:
                     return settings.preset_point_size(label)
@@ -57,6 +59,14 @@ class FillGroupingHelper:
             state = self._owner._viewport_state()
             return self._owner._legacy_preset_point_size(label, state, mapper)
 
+        def preset_point_size(label: str) -> float:
+            # Items sharing a size preset resolve it once per pass.
+            size = preset_sizes.get(label)
+            if size is None:
+                size = resolve_preset_point_size(label)
+                preset_sizes[label] = size
+            return size
+
         store = getattr(self._owner, "_payload_model").store
         group_bounds: Dict[Tuple[str, Optional[str]], GroupBounds] = {}
         text_block_cache = getattr(self._owner, "_text_block_cache", None)
@@ -67,6 +77,8 @@ class FillGroupingHelper:
             device_ratio = 1.0
         if device_ratio <= 0.0 or not math.isfinite(device_ratio):
             device_ratio = 1.0
+        font_family = settings.font_family if settings is not None else self._owner._font_family
+        font_fallbacks = settings.font_fallbacks if settings is not None else self._owner._font_fallbacks
         for item_id, legacy_item in store.items():
             group_key = self.group_key_for(item_id, legacy_item.plugin)
             key_tuple = group_key.as_tuple()
@@ -75,9 +87,9 @@ class FillGroupingHelper:
                 bounds,
                 legacy_item,
                 pixel_scale,
-                settings.font_family if settings is not None else self._owner._font_family,
+                font_family,
                 preset_point_size,
-                font_fallbacks=settings.font_fallbacks if settings is not None else self._owner._font_fallbacks,
+                font_fallbacks=font_fallbacks,
                 text_block_cache=text_block_cache,
                 cache_generation=cache_generation,
                 device_ratio=device_ratio,
@@ -89,16 +89,18 @@ class InteractionSurfaceMixin:
         frame = self.frameGeometry()
         current = (frame.x(), frame.y())
         if current != self._last_move_log:
-            screen_desc = self._describe_screen(self.windowHandle().screen() if self.windowHandle() else None)
-            _CLIENT_LOGGER.debug(
-                "Overlay moveEvent: pos=(%d,%d) frame=%s last_set=%s monitor=%s; %s",
-                frame.x(),
-                frame.y(),
-                (frame.x(), frame.y(), frame.width(), frame.height()),
-                self._last_set_geometry,
-                screen_desc,
-                self.format_scale_debug(),
-            )
+            if _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+                # Screen description and scale summary are built eagerly, so skip them when muted.
+                screen_desc = self._describe_screen(self.windowHandle().screen() if self.windowHandle() else None)
+                _CLIENT_LOGGER.debug(
+                    "Overlay moveEvent: pos=(%d,%d) frame=%s last_set=%s monitor=%s; %s",
+                    frame.x(),
+                    frame.y(),
+                    (frame.x(), frame.y(), frame.width(), frame.height()),
+                    self._last_set_geometry,
+                    screen_desc,
+                    self.format_scale_debug(),
+                )
             if (
                 self._follow_enabled
                 and self._last_set_geometry is not None
@@ -4,14 +4,16 @@ import logging
 import time
 from datetime import datetime, timezone
 from collections.abc import Iterable, Sequence
-from typing import Any, Callable, Mapping, MutableMapping, Optional
+from typing import Any, Callable, Dict, Mapping, MutableMapping, Optional
 import json
 
 from overlay_client.legacy_store import LegacyItem, LegacyItemStore
 
 LOGGER = logging.getLogger("EDMC.ModernOverlay.LegacyProcessor")
+UTC = getattr(datetime, "UTC", timezone.utc)
 
 _MARKER_TEXT_SIZE_CHOICES = {"small", "normal", "large", "huge"}
+_SEC_NS = 1_000_000_000
 
 
 def _normalise_marker_text_size(value: Any) -> Optional[str]:
@@ -143,9 +145,18 @@ _LEGACY_CONTENT_KEYS = {
 def _is_id_only_mapping(payload: Optional[Mapping[str, Any]]) -> bool:
     if not isinstance(payload, Mapping):
         return False
-    for key in _LEGACY_CONTENT_KEYS:
-        if key not in payload:
-            continue
+    if not payload:
+        return True
+    # Fast paths for the most common content keys before the full scan.
+    for key in ("text", "shape"):
+        value = payload.get(key)
+        if isinstance(value, str) and value.strip():
+            return False
+    if len(payload) < len(_LEGACY_CONTENT_KEYS):
+        candidates = [key for key in payload if key in _LEGACY_CONTENT_KEYS]
+    else:
+        candidates = [key for key in _LEGACY_CONTENT_KEYS if key in payload]
+    for key in candidates:
         value = payload[key]
         if isinstance(value, str):
             if value.strip():
@@ -163,14 +174,39 @@ def _is_id_only_mapping(payload: Optional[Mapping[str, Any]]) -> bool:
     return True
 
 
+def _finalize(
+    store: LegacyItemStore,
+    item_id: str,
+    kind: str,
+    data: Dict[str, Any],
+    *,
+    ttl: int,
+    expiry: int,
+    plugin: Optional[str],
+    transform_meta: Any,
+    now_iso: str,
+) -> None:
+    """Stamp the shared bookkeeping keys onto ``data`` and store the item."""
+
+    data["__mo_ttl__"] = ttl
+    if transform_meta is not None:
+        data["__mo_transform__"] = transform_meta
+    data["__mo_updated__"] = now_iso
+    store.set(item_id, LegacyItem(item_id=item_id, kind=kind, data=data, expiry=expiry, plugin=plugin))
+
+
 def process_legacy_payload(
     store: LegacyItemStore,
     payload: Mapping[str, Any],
     trace_fn: Optional[TraceCallback] = None,
+    *,
+    _now: Callable[[timezone], datetime] = datetime.now,
+    _utc: timezone = UTC,
 ) -> bool:
     """Process a legacy payload and update the store.
 
-    Returns True when the caller should trigger a repaint.
+    Returns True when the caller should trigger a repaint. ``_now``/``_utc`` are
+    bound at definition time so the hot path reads them as locals.
     """
 
     item_type = payload.get("type")
@@ -187,24 +223,17 @@ def process_legacy_payload(
         return False
 
     ttl = max(int(payload.get("ttl", 4)), 0)
-    now = time.monotonic()
-    expiry = now + ttl if ttl > 0 else now
+    now = time.monotonic_ns()
+    expiry = now + ttl * _SEC_NS if ttl > 0 else now
     plugin_name = _extract_plugin(payload)
 
-    now_iso = datetime.now(UTC).isoformat()
+    now_iso = _now(_utc).isoformat()
 
     if item_type == "message":
         text = payload.get("text", "")
         if not text:
             store.remove(item_id)
             return True
-        if trace_fn:
-            snapshot = _hashable_payload_snapshot(item_type, payload)
-            trace_fn(
-                "legacy_processor:dedupe_snapshot",
-                payload,
-                {"item_id": item_id, "plugin": plugin_name, "snapshot": snapshot},
-            )
         data = {
             "text": text,
             "color": payload.get("color", "white"),
@@ -212,13 +241,28 @@ def process_legacy_payload(
             "y": int(payload.get("y", 0)),
             "size": payload.get("size", "normal"),
         }
-        data["__mo_ttl__"] = ttl
+        if trace_fn is not None:
+            # Reuse the normalised values rather than re-reading the payload.
+            snapshot = (
+                text,
+                data["color"],
+                data["x"],
+                data["y"],
+                data["size"],
+                payload.get("__mo_transform__"),
+            )
+            trace_fn(
+                "legacy_processor:dedupe_snapshot",
+                payload,
+                {"item_id": item_id, "plugin": plugin_name, "snapshot": snapshot},
+            )
         transform_meta = payload.get("__mo_transform__")
+        message_transform = None
         if isinstance(transform_meta, Mapping):
             try:
-                data["__mo_transform__"] = dict(transform_meta)
+                message_transform = dict(transform_meta)
             except Exception:
-                data["__mo_transform__"] = transform_meta
+                message_transform = transform_meta
             raw_payload = payload.get("raw")
             if isinstance(raw_payload, MutableMapping):
                 try:
@@ -226,8 +270,17 @@ def process_legacy_payload(
                 except Exception:
                     raw_copy = transform_meta
                 raw_payload.setdefault("__mo_transform__", {}).update(raw_copy if isinstance(raw_copy, Mapping) else {})
-        data["__mo_updated__"] = now_iso
-        store.set(item_id, LegacyItem(item_id=item_id, kind="message", data=data, expiry=expiry, plugin=plugin_name))
+        _finalize(
+            store,
+            item_id,
+            "message",
+            data,
+            ttl=ttl,
+            expiry=expiry,
+            plugin=plugin_name,
+            transform_meta=message_transform,
+            now_iso=now_iso,
+        )
         return True
 
     if item_type == "shape":
@@ -242,8 +295,7 @@ def process_legacy_payload(
                 "w": int(message.get("w", 0)),
                 "h": int(message.get("h", 0)),
             }
-            data["__mo_ttl__"] = ttl
-            if trace_fn:
+            if trace_fn is not None:
                 snapshot = _hashable_payload_snapshot("shape", payload)
                 trace_fn(
                     "legacy_processor:dedupe_snapshot",
@@ -256,18 +308,22 @@ def process_legacy_payload(
                     transform_meta = dict(transform_meta)
                 except Exception:
                     transform_meta = None
-            if transform_meta is not None:
-                data["__mo_transform__"] = transform_meta
-            data["__mo_updated__"] = now_iso
-            store.set(
+            _finalize(
+                store,
                 item_id,
-                LegacyItem(item_id=item_id, kind="rect", data=data, expiry=expiry, plugin=plugin_name),
+                "rect",
+                data,
+                ttl=ttl,
+                expiry=expiry,
+                plugin=plugin_name,
+                transform_meta=transform_meta,
+                now_iso=now_iso,
             )
             return True
         if shape_name == "vect":
             vector = message.get("vector")
             if not isinstance(vector, list):
-                if trace_fn:
+                if trace_fn is not None:
                     trace_fn(
                         "legacy_processor:vector_drop",
                         payload,
@@ -284,11 +340,18 @@ def process_legacy_payload(
             for entry in vector:
                 if not isinstance(entry, Mapping):
                     continue
-                try:
-                    x_val = int(entry.get("x", 0))
-                    y_val = int(entry.get("y", 0))
-                except (TypeError, ValueError):
-                    continue
+                raw_x = entry.get("x", 0)
+                raw_y = entry.get("y", 0)
+                if type(raw_x) is int and type(raw_y) is int:  # noqa: E721 - bools must still go through int()
+                    # Common case: skip int() and the exception machinery entirely.
+                    x_val = raw_x
+                    y_val = raw_y
+                else:
+                    try:
+                        x_val = int(raw_x)
+                        y_val = int(raw_y)
+                    except (TypeError, ValueError):
+                        continue
                 point = {
                     "x": x_val,
                     "y": y_val,
@@ -305,7 +368,7 @@ def process_legacy_payload(
                         point["size"] = size_token
                 points.append(point)
             if not points:
-                if trace_fn:
+                if trace_fn is not None:
                     trace_fn(
                         "legacy_processor:vector_drop",
                         payload,
@@ -318,7 +381,7 @@ def process_legacy_payload(
                 LOGGER.warning("Dropping vect payload with insufficient points: id=%s vector=%s", item_id, vector)
                 return False
             if len(points) == 1 and not _point_has_marker_or_text(points[0]):
-                if trace_fn:
+                if trace_fn is not None:
                     trace_fn(
                         "legacy_processor:vector_drop",
                         payload,
@@ -336,8 +399,7 @@ def process_legacy_payload(
             }
             if payload_size:
                 data["text_size"] = payload_size
-            data["__mo_ttl__"] = ttl
-            if trace_fn:
+            if trace_fn is not None:
                 snapshot = _hashable_payload_snapshot("shape", payload)
                 trace_fn(
                     "legacy_processor:dedupe_snapshot",
@@ -350,10 +412,7 @@ def process_legacy_payload(
                     transform_meta = dict(transform_meta)
                 except Exception:
                     transform_meta = None
-            if transform_meta is not None:
-                data["__mo_transform__"] = transform_meta
-            data["__mo_updated__"] = now_iso
-            if trace_fn:
+            if trace_fn is not None:
                 trace_fn(
                     "legacy_processor:vector_normalised",
                     payload,
@@ -364,22 +423,23 @@ def process_legacy_payload(
                         "base_color": data["base_color"],
                     },
                 )
-            store.set(
+            _finalize(
+                store,
                 item_id,
-                LegacyItem(
-                    item_id=item_id,
-                    kind="vector",
-                    data=data,
-                    expiry=expiry,
-                    plugin=plugin_name,
-                ),
+                "vector",
+                data,
+                ttl=ttl,
+                expiry=expiry,
+                plugin=plugin_name,
+                transform_meta=transform_meta,
+                now_iso=now_iso,
             )
             return True
 
         # For other shapes we keep the payload for future support/logging
         enriched = dict(message)
         enriched["__mo_ttl__"] = ttl
-        enriched.setdefault("timestamp", datetime.now(UTC).isoformat())
+        enriched.setdefault("timestamp", _now(_utc).isoformat())
         store.set(
             item_id,
             LegacyItem(
@@ -400,4 +460,3 @@ def process_legacy_payload(
         return False
 
     return False
-UTC = getattr(datetime, "UTC", timezone.utc)
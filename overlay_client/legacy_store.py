@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -9,7 +9,7 @@ class LegacyItem:
     item_id: str
     kind: str
     data: Dict[str, Any]
-    expiry: Optional[float] = None
+    expiry: Optional[int] = None  # time.monotonic_ns() deadline
     plugin: Optional[str] = None
 
 
@@ -39,17 +39,24 @@ class LegacyItemStore:
     def get(self, item_id: str) -> Optional[LegacyItem]:
         return self._items.get(item_id)
 
+    def __len__(self) -> int:
+        return len(self._items)
+
     def items(self) -> Iterable[Tuple[str, LegacyItem]]:
         return self._items.items()
 
     def values(self) -> Iterable[LegacyItem]:
         return self._items.values()
 
-    def purge_expired(self, now: float) -> bool:
+    def purge_expired(self, now: int) -> bool:
+        return bool(self.purge_expired_ids(now))
+
+    def purge_expired_ids(self, now: int) -> List[str]:
+        """Remove expired items and return their ids."""
         expired = [
             key for key, item in self._items.items()
             if item.expiry is not None and item.expiry < now
         ]
         for key in expired:
             self._items.pop(key, None)
-        return bool(expired)
+        return expired
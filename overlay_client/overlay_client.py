@@ -14,6 +14,11 @@ from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 CLIENT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = CLIENT_DIR.parent
 
+try:  # pragma: no cover - optional accelerated JSON parser
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson = None
+
 from PyQt6.QtGui import QPainter, QGuiApplication
 from PyQt6.QtWidgets import QWidget
 
@@ -77,7 +82,8 @@ _CLIENT_LOGGER = logging.getLogger(_LOGGER_NAME)
 _CLIENT_LOGGER.setLevel(logging.DEBUG if DEBUG_CONFIG_ENABLED else logging.INFO)
 _CLIENT_LOGGER.propagate = False
 # Opt-in propagation flag for environments/tests that want client logs upstream.
-if os.environ.get("EDMC_OVERLAY_PROPAGATE_LOGS", "").lower() in {"1", "true", "yes", "on"}:
+_PROPAGATE_LOGS = os.environ.get("EDMC_OVERLAY_PROPAGATE_LOGS", "").lower() in ("1", "true", "yes", "on")
+if _PROPAGATE_LOGS:
     _CLIENT_LOGGER.propagate = True
 _RELEASE_FILTER_ENABLED = not DEBUG_CONFIG_ENABLED
 _LOG_LEVEL_HINT: Optional[int] = None
@@ -100,7 +106,10 @@ class _ReleaseLogLevelFilter(logging.Filter):
         return True
 
 
-_CLIENT_LOGGER.addFilter(_ReleaseLogLevelFilter(release_mode=not DEBUG_CONFIG_ENABLED))
+_RELEASE_FILTER = _ReleaseLogLevelFilter(release_mode=not DEBUG_CONFIG_ENABLED)
+if _RELEASE_FILTER_ENABLED:
+    # Only installed while it can promote records; dev builds never pay for the callback.
+    _CLIENT_LOGGER.addFilter(_RELEASE_FILTER)
 
 
 def apply_log_level_hint(level: Optional[int], *, source: Optional[str] = None) -> None:
@@ -126,6 +135,7 @@ def apply_log_level_hint(level: Optional[int], *, source: Optional[str] = None)
     _LOG_LEVEL_HINT = numeric
     _LOG_LEVEL_HINT_SOURCE = hint_source
     _RELEASE_FILTER_ENABLED = False
+    _CLIENT_LOGGER.removeFilter(_RELEASE_FILTER)
     _CLIENT_LOGGER.setLevel(numeric)
     level_name = logging.getLevelName(numeric)
     log_level = numeric if numeric >= logging.INFO else logging.INFO
@@ -143,6 +153,9 @@ def apply_log_level_hint(level: Optional[int], *, source: Optional[str] = None)
             hint_source,
         )
 
+# NaN/inf in either coordinate propagates through addition, so one call checks a pair.
+_isfinite = math.isfinite
+
 DEFAULT_WINDOW_BASE_WIDTH = 1280
 DEFAULT_WINDOW_BASE_HEIGHT = 960
 
@@ -162,14 +175,17 @@ def _load_line_width_config() -> Dict[str, int]:
     config = dict(_LINE_WIDTH_DEFAULTS)
     path = CLIENT_DIR / "render_config.json"
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        if _orjson is not None:
+            data = _orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
     except FileNotFoundError:
         _CLIENT_LOGGER.debug("Line width config not found at %s; using defaults", path)
         return config
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:  # json.JSONDecodeError and orjson.JSONDecodeError
         _CLIENT_LOGGER.warning("Failed to parse %s; using default line widths (%s)", path, exc)
         return config
-    if isinstance(data, Mapping):
+    if isinstance(data, dict):  # JSON parsers only ever yield a plain dict for objects
         for key, value in data.items():
             if key not in _LINE_WIDTH_DEFAULTS:
                 continue
@@ -183,6 +199,41 @@ def _load_line_width_config() -> Dict[str, int]:
         _CLIENT_LOGGER.warning("Line width config at %s is not a JSON object; using defaults", path)
     return config
 
+
+_LINE_WIDTHS_CACHE: Optional[Tuple[Optional[int], Dict[str, int]]] = None
+
+
+def _cached_line_width_config() -> Dict[str, int]:
+    """Return the line width config, re-parsing only when render_config.json changes."""
+
+    global _LINE_WIDTHS_CACHE
+    path = CLIENT_DIR / "render_config.json"
+    try:
+        mtime_ns: Optional[int] = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    cached = _LINE_WIDTHS_CACHE
+    if cached is not None and cached[0] == mtime_ns:
+        return dict(cached[1])
+    config = _load_line_width_config()
+    _LINE_WIDTHS_CACHE = (mtime_ns, dict(config))
+    return config
+
+
+def _group_offsets_slow(offset_x: Any, offset_y: Any) -> Tuple[float, float]:
+    """Coerce non-float group offsets, treating missing/invalid values as zero."""
+
+    try:
+        offset_x = float(offset_x or 0.0)
+    except (TypeError, ValueError):
+        offset_x = 0.0
+    try:
+        offset_y = float(offset_y or 0.0)
+    except (TypeError, ValueError):
+        offset_y = 0.0
+    return offset_x, offset_y
+
+
 class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderSurfaceMixin, FollowSurfaceMixin, ControlSurfaceMixin):
     """Transparent overlay window that renders payloads and debug surfaces.
 
@@ -198,6 +249,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
     _REPAINT_DEBOUNCE_MS = 33  # coalesce ingest/purge repaint storms
     _TEXT_CACHE_MAX = 512
     _TEXT_BLOCK_CACHE_MAX = 256
+    _ANTIALIAS_HINT = QPainter.RenderHint.Antialiasing
 
     def __init__(self, initial: InitialClientSettings, debug_config: DebugConfig) -> None:
         QWidget.__init__(self)
@@ -205,22 +257,61 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
             initial,
             debug_config,
             root_dir=ROOT_DIR,
-            load_line_width_config=_load_line_width_config,
+            load_line_width_config=_cached_line_width_config,
             line_width_defaults=_LINE_WIDTH_DEFAULTS,
             payload_model_factory=lambda callback: PayloadModel(callback),
         )
 
     def _current_physical_size(self) -> Tuple[float, float]:
         frame = self.frameGeometry()
-        ratio = 1.0
+        return util_current_physical_size(frame.width(), frame.height(), self._device_pixel_ratio())
+
+    def _device_pixel_ratio(self) -> float:
+        ratio = self._cached_dpr
+        if ratio is not None:
+            return ratio
+        try:
+            ratio = self.devicePixelRatioF()
+        except (AttributeError, RuntimeError) as exc:
+            _CLIENT_LOGGER.debug("devicePixelRatioF unavailable, defaulting to 1.0: %s", exc)
+            return 1.0
+        # Only cache once the screen/DPI watchers can invalidate the value.
+        if self._dpr_window_connected:
+            self._cached_dpr = ratio
+        return ratio
+
+    def _invalidate_dpr(self, *_args: Any) -> None:
+        """Drop the cached device pixel ratio; wired to screen/DPI change signals."""
+        self._cached_dpr = None
+
+    def _watch_dpr_changes(self) -> None:
         window = self.windowHandle()
-        if window is not None:
-            try:
-                ratio = window.devicePixelRatio()
-            except (AttributeError, RuntimeError) as exc:
-                _CLIENT_LOGGER.debug("Failed to read devicePixelRatio, defaulting to 1.0: %s", exc)
-                ratio = 1.0
-        return util_current_physical_size(frame.width(), frame.height(), ratio)
+        if window is None:
+            return
+        if not self._dpr_window_connected:
+            window.screenChanged.connect(self._handle_dpr_screen_changed)
+            self._dpr_window_connected = True
+        self._watch_screen_dpi(window.screen())
+
+    def _watch_screen_dpi(self, screen: Any) -> None:
+        previous = self._dpr_screen
+        if screen is previous:
+            return
+        if previous is not None:
+            # Only the current screen stays connected (and referenced).
+            for signal in (previous.logicalDotsPerInchChanged, previous.physicalDotsPerInchChanged):
+                try:
+                    signal.disconnect(self._invalidate_dpr)
+                except (TypeError, RuntimeError):
+                    pass
+        self._dpr_screen = screen
+        if screen is not None:
+            screen.logicalDotsPerInchChanged.connect(self._invalidate_dpr)
+            screen.physicalDotsPerInchChanged.connect(self._invalidate_dpr)
+
+    def _handle_dpr_screen_changed(self, screen: Any) -> None:
+        self._invalidate_dpr()
+        self._watch_screen_dpi(screen)
 
     @staticmethod
     def _aspect_ratio_label(width: int, height: int) -> Optional[str]:
@@ -229,18 +320,28 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
     def _compute_legacy_mapper(self) -> LegacyMapper:
         width = max(float(self.width()), 1.0)
         height = max(float(self.height()), 1.0)
-        mode_value = (self._scale_mode or "fit").strip().lower()
-        return util_compute_legacy_mapper(mode_value, width, height)
+        mode_value = self._scale_mode
+        # Mapper/state are frozen and fully determined by their key, so a stale
+        # entry is never reused once the geometry, ratio, or scale mode moves.
+        key = (width, height, mode_value)
+        cached = self._legacy_mapper_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        mapper = util_compute_legacy_mapper((mode_value or "fit").strip().lower(), width, height)
+        self._legacy_mapper_cache = (key, mapper)
+        return mapper
 
     def _viewport_state(self) -> ViewportState:
         width = max(float(self.width()), 1.0)
         height = max(float(self.height()), 1.0)
-        try:
-            ratio = self.devicePixelRatioF()
-        except (AttributeError, RuntimeError) as exc:
-            _CLIENT_LOGGER.debug("devicePixelRatioF unavailable, defaulting to 1.0: %s", exc)
-            ratio = 1.0
-        return util_viewport_state(width, height, ratio)
+        ratio = self._device_pixel_ratio()
+        key = (width, height, ratio)
+        cached = self._viewport_state_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        state = util_viewport_state(width, height, ratio)
+        self._viewport_state_cache = (key, state)
+        return state
 
     def _build_fill_viewport(
         self,
@@ -269,7 +370,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
             mapped = cls._map_anchor_to_overlay_bounds(transform, anchor_override)
             if mapped is not None:
                 anchor_x = mapped[0]
-        if not (math.isfinite(anchor_x) and math.isfinite(anchor_y)):
+        if not _isfinite(anchor_x + anchor_y):
             return None
         offset_x, offset_y = cls._group_offsets(transform)
         if anchor_override is None:
@@ -292,7 +393,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
         else:
             base_x = remap_axis_value(transform.bounds_min_x, context.axis_x)
         base_y = remap_axis_value(transform.bounds_min_y, context.axis_y)
-        if not (math.isfinite(base_x) and math.isfinite(base_y)):
+        if not _isfinite(base_x + base_y):
             return None
         offset_x, offset_y = cls._group_offsets(transform)
         if not (use_overlay_bounds_x and overlay_bounds is not None and overlay_bounds.is_valid()):
@@ -304,17 +405,11 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
     def _group_offsets(transform: Optional[GroupTransform]) -> Tuple[float, float]:
         if transform is None:
             return 0.0, 0.0
-        offset_x = getattr(transform, "dx", 0.0) or 0.0
-        offset_y = getattr(transform, "dy", 0.0) or 0.0
-        try:
-            offset_x = float(offset_x)
-        except (TypeError, ValueError):
-            offset_x = 0.0
-        try:
-            offset_y = float(offset_y)
-        except (TypeError, ValueError):
-            offset_y = 0.0
-        return offset_x, offset_y
+        offset_x = getattr(transform, "dx", None)
+        offset_y = getattr(transform, "dy", None)
+        if isinstance(offset_x, float) and isinstance(offset_y, float):
+            return offset_x, offset_y
+        return _group_offsets_slow(offset_x, offset_y)
 
     @classmethod
     def _map_anchor_to_overlay_bounds(
@@ -337,7 +432,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
         except Exception:
             return None
         anchor_y = transform.band_anchor_y * BASE_HEIGHT
-        if not (math.isfinite(anchor_x) and math.isfinite(anchor_y)):
+        if not _isfinite(anchor_x + anchor_y):
             return None
         return anchor_x, anchor_y
 
@@ -542,9 +637,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
             self._show_overlay_status_message(self._status)
 
     def _refresh_legacy_items(self) -> None:
-        """Touch stored legacy items so repaints pick up new scaling bounds."""
-        for item_id, item in list(self._payload_model.store.items()):
-            self._payload_model.set(item_id, item)
+        """Invalidate the legacy render cache so repaints pick up new scaling bounds."""
         self._mark_legacy_cache_dirty()
 
     def _notify_font_bounds_changed(self) -> None:
@@ -598,7 +691,7 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
         mapper = self._compute_legacy_mapper()
         state = self._viewport_state()
         scale_x, scale_y = legacy_scale_components(mapper, state)
-        return "size={:.0f}x{:.0f}px scale_x={:.2f} scale_y={:.2f}".format(
+        return "size=%.0fx%.0fpx scale_x=%.2f scale_y=%.2f" % (
             width_px,
             height_px,
             scale_x,
@@ -607,17 +700,18 @@ class OverlayWindow(SetupSurfaceMixin, InteractionSurfaceMixin, QWidget, RenderS
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
+        # The native window (and therefore its screen) may be new; re-read the ratio.
+        self._invalidate_dpr()
+        self._watch_dpr_changes()
         self._handle_show_event()
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        # QWidget.paintEvent is a no-op for this transparent overlay, so it is not chained.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(self._ANTIALIAS_HINT)
         self._paint_overlay(painter)
         painter.end()
-        stats = getattr(self, "_paint_stats", None)
-        if isinstance(stats, dict):
-            stats["paint_count"] = stats.get("paint_count", 0) + 1
-        super().paintEvent(event)
+        self._paint_count += 1
 
     # External control -----------------------------------------------------
 
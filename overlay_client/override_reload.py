@@ -40,7 +40,7 @@ def force_reload_overrides(
     log_fn(
         "Override reload applied: generation=%d items=%d",
         getattr(override_manager, "generation", -1),
-        len(list(store.items())),
+        len(store),
     )
 
 
@@ -4,19 +4,154 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence, Tuple
 
-from PyQt6.QtCore import QPoint, Qt
-from PyQt6.QtGui import QColor, QBrush, QFont, QFontMetrics, QPainter, QPen
+from PyQt6.QtCore import QLine, QPoint, Qt
+from PyQt6.QtGui import QColor, QBrush, QFont, QFontMetrics, QPainter, QPen, QStaticText, QTransform
 
 from overlay_client.group_transform import GroupTransform  # type: ignore
 from overlay_client.grouping_adapter import GroupKey  # type: ignore
 from overlay_client.legacy_store import LegacyItem  # type: ignore
+from overlay_client.payload_transform import (  # type: ignore
+    _measure_text_block as util_measure_text_block,
+    _normalise_newlines,
+)
 from overlay_client.vector_renderer import render_vector, VectorPainterAdapter  # type: ignore
 
 if TYPE_CHECKING:
     from overlay_client.overlay_client import OverlayWindow  # type: ignore
 
+_MESSAGE_FONT_CACHE_LIMIT = 128
+_MESSAGE_FONTS: dict[tuple[str, Tuple[str, ...], float], QFont] = {}
 
-@dataclass
+
+def _message_font(window: "OverlayWindow", point_size: float) -> QFont:
+    """Return the text font for *point_size*, built once per family/fallback/size."""
+
+    family = window._font_family
+    key = (family, tuple(getattr(window, "_font_fallbacks", ())), point_size)
+    font = _MESSAGE_FONTS.get(key)
+    if font is None:
+        font = QFont(family)
+        window._apply_font_fallbacks(font)
+        font.setPointSizeF(point_size)
+        font.setWeight(QFont.Weight.Normal)
+        if len(_MESSAGE_FONTS) >= _MESSAGE_FONT_CACHE_LIMIT:
+            _MESSAGE_FONTS.clear()
+        _MESSAGE_FONTS[key] = font
+    return font
+
+
+_VECTOR_STYLE_CACHE_LIMIT = 256
+_VECTOR_COLORS: dict[tuple[str, int], QColor] = {}
+_VECTOR_PENS: dict[tuple[str, int, int], QPen] = {}
+_VECTOR_BRUSHES: dict[tuple[str, int], QBrush] = {}
+
+
+def _vector_color(window: "OverlayWindow", color: str, opacity: int) -> QColor:
+    """Return *color* parsed and adjusted for the global payload opacity."""
+
+    key = (color, opacity)
+    q_color = _VECTOR_COLORS.get(key)
+    if q_color is None:
+        q_color = QColor(color)
+        if not q_color.isValid():
+            q_color = QColor("white")
+        q_color = window._apply_payload_opacity_color(q_color)
+        if len(_VECTOR_COLORS) >= _VECTOR_STYLE_CACHE_LIMIT:
+            _VECTOR_COLORS.clear()
+        _VECTOR_COLORS[key] = q_color
+    return q_color
+
+
+def _vector_pen(window: "OverlayWindow", color: str, width: int) -> QPen:
+    """Return a reusable pen for a vector colour string at *width*."""
+
+    opacity = window._payload_opacity_percent()
+    key = (color, width, opacity)
+    pen = _VECTOR_PENS.get(key)
+    if pen is None:
+        pen = QPen(_vector_color(window, color, opacity))
+        pen.setWidth(width)
+        if len(_VECTOR_PENS) >= _VECTOR_STYLE_CACHE_LIMIT:
+            _VECTOR_PENS.clear()
+        _VECTOR_PENS[key] = pen
+    return pen
+
+
+def _vector_brush(window: "OverlayWindow", color: str) -> QBrush:
+    """Return a reusable solid brush for a vector colour string."""
+
+    opacity = window._payload_opacity_percent()
+    key = (color, opacity)
+    brush = _VECTOR_BRUSHES.get(key)
+    if brush is None:
+        brush = QBrush(_vector_color(window, color, opacity))
+        if len(_VECTOR_BRUSHES) >= _VECTOR_STYLE_CACHE_LIMIT:
+            _VECTOR_BRUSHES.clear()
+        _VECTOR_BRUSHES[key] = brush
+    return brush
+
+
+_MESSAGE_COLORS: dict[tuple[int, int], QColor] = {}
+_TEXT_BLOCK_CACHE_LIMIT = 512
+_TEXT_BLOCK_SIZES: dict[tuple[str, Tuple[str, ...], float, str], tuple[int, int]] = {}
+
+
+def _message_color(window: "OverlayWindow", color: QColor, opacity: int) -> QColor:
+    """Return the faded message colour, shared between commands of the same colour."""
+
+    key = (color.rgba(), opacity)
+    faded = _MESSAGE_COLORS.get(key)
+    if faded is None:
+        faded = window._apply_payload_opacity_color(color)
+        if len(_MESSAGE_COLORS) >= _VECTOR_STYLE_CACHE_LIMIT:
+            _MESSAGE_COLORS.clear()
+        _MESSAGE_COLORS[key] = faded
+    return faded
+
+
+class _PainterState:
+    """Font and pen last applied by the command pass, so repeats skip the Qt call.
+
+    Commands are still painted in their original z-order; only consecutive
+    commands sharing the same cached font or pen object avoid a state change.
+    """
+
+    __slots__ = ("font", "pen")
+
+    def __init__(self) -> None:
+        self.font: Optional[QFont] = None
+        self.pen: Any = None
+
+    def reset(self) -> None:
+        self.font = None
+        self.pen = None
+
+    def set_font(self, painter: QPainter, font: QFont) -> None:
+        if font is not self.font:
+            painter.setFont(font)
+            self.font = font
+
+    def set_pen(self, painter: QPainter, pen: Any) -> None:
+        if pen is not self.pen:
+            painter.setPen(pen)
+            self.pen = pen
+
+
+def _painter_state(window: "OverlayWindow") -> _PainterState:
+    state = getattr(window, "_painter_state", None)
+    return state if state is not None else _PainterState()
+
+
+def _static_text(line: str, font: QFont) -> QStaticText:
+    """Lay out *line* once so repeated paints skip Qt's per-call text shaping."""
+
+    static = QStaticText(line)
+    static.setTextFormat(Qt.TextFormat.PlainText)
+    static.prepare(QTransform(), font)
+    return static
+
+
+@dataclass(slots=True)
 class _LegacyPaintCommand:
     group_key: GroupKey
     group_transform: Optional[GroupTransform]
@@ -30,13 +165,15 @@ class _LegacyPaintCommand:
     reference_overlay_bounds: Optional[Tuple[float, float, float, float]] = None
     debug_vertices: Optional[Sequence[Tuple[int, int]]] = None
     raw_min_x: Optional[float] = None
+    # Only populated while payload cycling is enabled; None means paint skips anchor registration.
+    cycle_anchor: Optional[Tuple[int, int]] = None
     right_just_multiplier: int = 0
 
     def paint(self, window: "OverlayWindow", painter: QPainter, offset_x: int, offset_y: int) -> None:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class _MessagePaintCommand(_LegacyPaintCommand):
     text: str = ""
     color: QColor = field(default_factory=lambda: QColor("white"))
@@ -47,25 +184,45 @@ class _MessagePaintCommand(_LegacyPaintCommand):
     ascent: int = 0
     descent: int = 0
     line_spacing: int = 0
-    cycle_anchor: Optional[Tuple[int, int]] = None
     trace_fn: Optional[Callable[[str, Mapping[str, Any]], None]] = None
+    _lines: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _line_spacing_resolved: int = field(default=0, init=False, repr=False, compare=False)
+    _static_font: Optional[QFont] = field(default=None, init=False, repr=False, compare=False)
+    _static_lines: Tuple[QStaticText, ...] = field(default=(), init=False, repr=False, compare=False)
+    _static_ascent: int = field(default=0, init=False, repr=False, compare=False)
+    _faded: Optional[Tuple[int, QColor]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Text and metrics are fixed once built and commands outlive a frame
+        # (see the legacy render cache), so resolve them here rather than per paint.
+        text = _normalise_newlines(str(self.text))
+        self._lines = tuple(text.split("\n")) if "\n" in text else (text,)
+        self._line_spacing_resolved = max(0, self.line_spacing or (self.ascent + self.descent))
 
     def paint(self, window: "OverlayWindow", painter: QPainter, offset_x: int, offset_y: int) -> None:
-        font = QFont(window._font_family)
-        window._apply_font_fallbacks(font)
-        font.setPointSizeF(self.point_size)
-        font.setWeight(QFont.Weight.Normal)
-        painter.setFont(font)
-        painter.setPen(window._apply_payload_opacity_color(self.color))
+        font = _message_font(window, self.point_size)
+        state = _painter_state(window)
+        state.set_font(painter, font)
+        opacity = window._payload_opacity_percent()
+        faded = self._faded
+        if faded is None or faded[0] != opacity:
+            faded = self._faded = (opacity, _message_color(window, self.color, opacity))
+        state.set_pen(painter, faded[1])
         draw_x = int(round(self.x + offset_x))
         draw_baseline = int(round(self.baseline + offset_y))
-        normalised = str(self.text).replace("\r\n", "\n").replace("\r", "\n")
-        lines = normalised.split("\n") or [""]
-        line_spacing = self.line_spacing or (self.ascent + self.descent)
-        if line_spacing <= 0:
-            line_spacing = 0
-        for idx, line in enumerate(lines):
-            painter.drawText(draw_x, draw_baseline + (line_spacing * idx), line)
+        if self._static_font is not font:
+            self._static_lines = tuple(_static_text(line, font) for line in self._lines)
+            self._static_ascent = QFontMetrics(font).ascent()
+            self._static_font = font
+        # drawStaticText anchors at the top-left, drawText at the baseline.
+        top = draw_baseline - self._static_ascent
+        static_lines = self._static_lines
+        if len(static_lines) == 1:
+            painter.drawStaticText(draw_x, top, static_lines[0])
+        else:
+            line_spacing = self._line_spacing_resolved
+            for idx, static in enumerate(static_lines):
+                painter.drawStaticText(draw_x, top + (line_spacing * idx), static)
         if self.trace_fn:
             self.trace_fn(
                 "render_message:draw",
@@ -78,13 +235,17 @@ class _MessagePaintCommand(_LegacyPaintCommand):
                 },
             )
             self.trace_fn("trace:complete", {"kind": "message"})
-        if self.cycle_anchor:
-            anchor_x = int(round(self.cycle_anchor[0] + offset_x))
-            anchor_y = int(round(self.cycle_anchor[1] + offset_y))
-            window._register_cycle_anchor(self.legacy_item.item_id, anchor_x, anchor_y)
+        cycle_anchor = self.cycle_anchor
+        if cycle_anchor is not None:
+            anchor_x, anchor_y = cycle_anchor
+            window._register_cycle_anchor(
+                self.legacy_item.item_id,
+                int(round(anchor_x + offset_x)),
+                int(round(anchor_y + offset_y)),
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class _RectPaintCommand(_LegacyPaintCommand):
     pen: QPen = field(default_factory=lambda: QPen(Qt.PenStyle.NoPen))
     brush: QBrush = field(default_factory=lambda: QBrush(Qt.BrushStyle.NoBrush))
@@ -92,40 +253,50 @@ class _RectPaintCommand(_LegacyPaintCommand):
     y: int = 0
     width: int = 0
     height: int = 0
-    cycle_anchor: Optional[Tuple[int, int]] = None
     trace_fn: Optional[Callable[[str, Mapping[str, Any]], None]] = None
 
+    _faded: Optional[Tuple[int, QPen, QBrush]] = field(default=None, init=False, repr=False, compare=False)
+
     def paint(self, window: "OverlayWindow", painter: QPainter, offset_x: int, offset_y: int) -> None:
         pen = self.pen
         brush = self.brush
-        if window._payload_opacity_percent() < 100:
-            if pen.style() != Qt.PenStyle.NoPen:
-                pen = QPen(pen)
-                pen.setColor(window._apply_payload_opacity_color(pen.color()))
-            if brush.style() != Qt.BrushStyle.NoBrush:
-                brush = QBrush(brush)
-                brush.setColor(window._apply_payload_opacity_color(brush.color()))
-        painter.setPen(pen)
+        opacity = window._payload_opacity_percent()
+        if opacity < 100:
+            faded = self._faded
+            if faded is not None and faded[0] == opacity:
+                pen, brush = faded[1], faded[2]
+            else:
+                if pen.style() != Qt.PenStyle.NoPen:
+                    pen = QPen(pen)
+                    pen.setColor(window._apply_payload_opacity_color(pen.color()))
+                if brush.style() != Qt.BrushStyle.NoBrush:
+                    brush = QBrush(brush)
+                    brush.setColor(window._apply_payload_opacity_color(brush.color()))
+                self._faded = (opacity, pen, brush)
+        _painter_state(window).set_pen(painter, pen)
         painter.setBrush(brush)
         draw_x = int(round(self.x + offset_x))
         draw_y = int(round(self.y + offset_y))
         painter.drawRect(draw_x, draw_y, self.width, self.height)
         if self.trace_fn:
             self.trace_fn("trace:complete", {"kind": "rect"})
-        if self.cycle_anchor:
-            anchor_x = int(round(self.cycle_anchor[0] + offset_x))
-            anchor_y = int(round(self.cycle_anchor[1] + offset_y))
-            window._register_cycle_anchor(self.legacy_item.item_id, anchor_x, anchor_y)
+        cycle_anchor = self.cycle_anchor
+        if cycle_anchor is not None:
+            anchor_x, anchor_y = cycle_anchor
+            window._register_cycle_anchor(
+                self.legacy_item.item_id,
+                int(round(anchor_x + offset_x)),
+                int(round(anchor_y + offset_y)),
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class _VectorPaintCommand(_LegacyPaintCommand):
     vector_payload: Mapping[str, Any] = field(default_factory=dict)
     scale: float = 1.0
     base_offset_x: float = 0.0
     base_offset_y: float = 0.0
     trace_fn: Optional[Callable[[str, Mapping[str, Any]], None]] = None
-    cycle_anchor: Optional[Tuple[int, int]] = None
 
     def paint(self, window: "OverlayWindow", painter: QPainter, offset_x: int, offset_y: int) -> None:
         adapter = _QtVectorPainterAdapter(window, painter)
@@ -142,91 +313,103 @@ class _VectorPaintCommand(_LegacyPaintCommand):
             marker_label_position=marker_label_position,
             trace=self.trace_fn,
         )
+        # The adapter sets pens and fonts directly, so the tracked state is unknown now.
+        _painter_state(window).reset()
         if self.trace_fn:
             self.trace_fn("trace:complete", {"kind": "vector"})
-        if self.cycle_anchor:
-            anchor_x = int(round(self.cycle_anchor[0] + offset_x))
-            anchor_y = int(round(self.cycle_anchor[1] + offset_y))
-            window._register_cycle_anchor(self.legacy_item.item_id, anchor_x, anchor_y)
+        cycle_anchor = self.cycle_anchor
+        if cycle_anchor is not None:
+            anchor_x, anchor_y = cycle_anchor
+            window._register_cycle_anchor(
+                self.legacy_item.item_id,
+                int(round(anchor_x + offset_x)),
+                int(round(anchor_y + offset_y)),
+            )
 
 
 class _QtVectorPainterAdapter(VectorPainterAdapter):
     def __init__(self, window: "OverlayWindow", painter: QPainter) -> None:
         self._window = window
         self._painter = painter
+        # The adapter lives for a single vector paint, so the viewport and font
+        # settings cannot change underneath these per-label caches.
+        self._point_sizes: dict[Optional[str], float] = {}
+        self._fonts: dict[float, Tuple[QFont, QFontMetrics]] = {}
 
-    def _text_font(self, text_size: Optional[str] = None) -> QFont:
-        font = QFont(self._window._font_family)
-        self._window._apply_font_fallbacks(font)
-        mapper = self._window._compute_legacy_mapper()
-        state = self._window._viewport_state()
-        size_token = (text_size or "normal").strip().lower()
-        if size_token not in {"small", "normal", "large", "huge"}:
-            size_token = "normal"
-        font.setPointSizeF(self._window._legacy_preset_point_size(size_token, state, mapper))
-        font.setWeight(QFont.Weight.Normal)
-        return font
+    def _text_point_size(self, text_size: Optional[str] = None) -> float:
+        point_size = self._point_sizes.get(text_size)
+        if point_size is None:
+            mapper = self._window._compute_legacy_mapper()
+            state = self._window._viewport_state()
+            size_token = (text_size or "normal").strip().lower()
+            if size_token not in {"small", "normal", "large", "huge"}:
+                size_token = "normal"
+            point_size = self._window._legacy_preset_point_size(size_token, state, mapper)
+            self._point_sizes[text_size] = point_size
+        return point_size
+
+    def _text_font_metrics(
+        self, text_size: Optional[str] = None, point_size: Optional[float] = None
+    ) -> Tuple[QFont, QFontMetrics]:
+        if point_size is None:
+            point_size = self._text_point_size(text_size)
+        entry = self._fonts.get(point_size)
+        if entry is None:
+            # Same construction as message text, so share the cross-paint font cache.
+            font = _message_font(self._window, point_size)
+            entry = self._fonts[point_size] = (font, QFontMetrics(font))
+        return entry
+
+    def _text_font(self, text_size: Optional[str] = None, point_size: Optional[float] = None) -> QFont:
+        return self._text_font_metrics(text_size, point_size)[0]
 
     def measure_text_block(self, text: str, text_size: Optional[str] = None) -> tuple[int, int]:
-        font = self._text_font(text_size)
-        metrics = QFontMetrics(font)
-        normalised = str(text).replace("\r\n", "\n").replace("\r", "\n")
-        lines = normalised.split("\n") or [""]
-        max_width = 0
-        for line in lines:
-            try:
-                advance = metrics.horizontalAdvance(line)
-            except Exception:
-                advance = 0
-            if advance > max_width:
-                max_width = advance
-        line_spacing = max(metrics.lineSpacing(), metrics.height(), 0)
-        total_height = line_spacing * max(1, len(lines))
-        return max(0, max_width), max(0, total_height)
+        window = self._window
+        point_size = self._text_point_size(text_size)
+        key = (window._font_family, tuple(getattr(window, "_font_fallbacks", ())), point_size, text)
+        cached = _TEXT_BLOCK_SIZES.get(key)
+        if cached is not None:
+            return cached
+        size = util_measure_text_block(self._text_font_metrics(point_size=point_size)[1], text)
+        if len(_TEXT_BLOCK_SIZES) >= _TEXT_BLOCK_CACHE_LIMIT:
+            _TEXT_BLOCK_SIZES.clear()
+        _TEXT_BLOCK_SIZES[key] = size
+        return size
 
     def set_pen(self, color: str, *, width: Optional[int] = None) -> None:
-        q_color = QColor(color)
-        if not q_color.isValid():
-            q_color = QColor("white")
-        q_color = self._window._apply_payload_opacity_color(q_color)
-        pen = QPen(q_color)
         pen_width = self._window._line_width("vector_line") if width is None else max(0, int(width))
-        pen.setWidth(pen_width)
-        self._painter.setPen(pen)
+        self._painter.setPen(_vector_pen(self._window, color, pen_width))
         self._painter.setBrush(Qt.BrushStyle.NoBrush)
 
     def draw_line(self, x1: int, y1: int, x2: int, y2: int) -> None:
         self._painter.drawLine(x1, y1, x2, y2)
 
+    def draw_lines(self, segments: Sequence[Tuple[int, int, int, int]]) -> None:
+        self._painter.drawLines([QLine(x1, y1, x2, y2) for x1, y1, x2, y2 in segments])
+
     def draw_circle_marker(self, x: int, y: int, radius: int, color: str) -> None:
-        q_color = QColor(color)
-        if not q_color.isValid():
-            q_color = QColor("white")
-        q_color = self._window._apply_payload_opacity_color(q_color)
-        pen = QPen(q_color)
-        pen.setWidth(self._window._line_width("vector_marker"))
-        self._painter.setPen(pen)
-        self._painter.setBrush(QBrush(q_color))
+        self._painter.setPen(_vector_pen(self._window, color, self._window._line_width("vector_marker")))
+        self._painter.setBrush(_vector_brush(self._window, color))
         self._painter.drawEllipse(QPoint(x, y), radius, radius)
 
     def draw_cross_marker(self, x: int, y: int, size: int, color: str) -> None:
         self.set_pen(color, width=self._window._line_width("vector_cross"))
-        self._painter.drawLine(x - size, y - size, x + size, y + size)
-        self._painter.drawLine(x - size, y + size, x + size, y - size)
+        self._painter.drawLines(
+            [
+                QLine(x - size, y - size, x + size, y + size),
+                QLine(x - size, y + size, x + size, y - size),
+            ]
+        )
 
     def draw_text(self, x: int, y: int, text: str, color: str, text_size: Optional[str] = None) -> None:
-        q_color = QColor(color)
-        if not q_color.isValid():
-            q_color = QColor("white")
-        q_color = self._window._apply_payload_opacity_color(q_color)
-        pen = QPen(q_color)
-        self._painter.setPen(pen)
-        font = self._text_font(text_size)
+        self._painter.setPen(_vector_pen(self._window, color, 1))
+        font, metrics = self._text_font_metrics(text_size)
         self._painter.setFont(font)
-        metrics = QFontMetrics(font)
-        normalised = str(text).replace("\r\n", "\n").replace("\r", "\n")
-        lines = normalised.split("\n") or [""]
+        lines = _normalise_newlines(str(text)).split("\n")
         baseline = int(round(y + metrics.ascent()))
+        if len(lines) == 1:
+            self._painter.drawText(x, baseline, lines[0])
+            return
         line_spacing = max(metrics.lineSpacing(), metrics.height(), 0)
         if line_spacing <= 0:
             line_spacing = metrics.ascent() + metrics.descent()
@@ -10,9 +10,14 @@ from overlay_client.legacy_processor import (
     process_legacy_payload,
     _hashable_payload_snapshot,
     _extract_plugin,
+    _SEC_NS,
 )  # type: ignore
 from overlay_client.legacy_store import LegacyItem, LegacyItemStore  # type: ignore
 
+_CLIENT_LOGGER = logging.getLogger("EDMC.ModernOverlay.Client")
+_CONTROLLER_HEARTBEAT_IDS = frozenset({"overlay-controller-status", "edmcmodernoverlay-controller-status"})
+_NO_SNAPSHOT: Tuple[Any, Optional[int]] = (None, None)
+
 
 class PayloadModel:
     """Owns the legacy item store and handles ingest/TTL."""
@@ -55,58 +60,49 @@ class PayloadModel:
             except Exception:
                 snapshot = None
             if snapshot is not None:
-                last_entry = self._last_snapshots.get(item_id)
-                if last_entry is not None:
-                    last_snapshot, last_generation = last_entry
-                else:
-                    last_snapshot, last_generation = None, None
+                last_snapshot, last_generation = self._last_snapshots.get(item_id, _NO_SNAPSHOT)
                 if last_snapshot == snapshot and (last_generation == override_generation or override_generation is None):
-                    ttl = max(int(payload.get("ttl", 4)), 0)
-                    now = time.monotonic()
-                    expiry = now + ttl if ttl > 0 else now
                     existing = self._store.get(item_id)
                     if existing is not None:
-                        existing.expiry = expiry
+                        ttl = payload.get("ttl", 4)
+                        if not isinstance(ttl, int):
+                            ttl = int(ttl)
+                        now_ns = time.monotonic_ns()
+                        existing.expiry = now_ns + ttl * _SEC_NS if ttl > 0 else now_ns
                         plugin_name = _extract_plugin(payload) or "unknown"
                         item_id_token = item_id.casefold()
-                        reason = (
-                            "controller_heartbeat"
-                            if item_id_token in {"overlay-controller-status", "edmcmodernoverlay-controller-status"}
-                            else None
-                        )
-                        details = {
-                            "item_id": item_id,
-                            "plugin": plugin_name,
-                            "snapshot": snapshot,
-                            "group": group_label or "",
-                        }
-                        if reason:
-                            details["reason"] = reason
+                        reason = "controller_heartbeat" if item_id_token in _CONTROLLER_HEARTBEAT_IDS else None
                         if trace_fn:
+                            details = {
+                                "item_id": item_id,
+                                "plugin": plugin_name,
+                                "snapshot": snapshot,
+                                "group": group_label or "",
+                            }
+                            if reason:
+                                details["reason"] = reason
                             trace_fn("payload_model:dedupe_skipped", payload, details)
-                        else:
-                            logger = logging.getLogger("EDMC.ModernOverlay.Client")
-                            if logger.isEnabledFor(logging.DEBUG):
-                                now = time.monotonic()
-                                key = group_label or plugin_name
-                                state = self._dedupe_log_state.setdefault(key, {"count": 0, "last": now})
-                                state["count"] = int(state.get("count", 0)) + 1
-                                last_log = float(state.get("last", now))
-                                if now - last_log >= 5.0:
-                                    prefix = "payload_model:dedupe_skipped"
-                                    if reason:
-                                        prefix += f" ({reason})"
-                                    logger.debug(
-                                        "%s plugin=%s group=%s id=%s count=%d window=%.1fs",
-                                        prefix,
-                                        plugin_name,
-                                        group_label or "",
-                                        item_id,
-                                        state["count"],
-                                        now - last_log,
-                                    )
-                                    state["count"] = 0
-                                    state["last"] = now
+                        elif _CLIENT_LOGGER.isEnabledFor(logging.DEBUG):
+                            now = time.monotonic()
+                            key = group_label or plugin_name
+                            state = self._dedupe_log_state.setdefault(key, {"count": 0, "last": now})
+                            state["count"] = int(state.get("count", 0)) + 1
+                            last_log = float(state.get("last", now))
+                            if now - last_log >= 5.0:
+                                prefix = "payload_model:dedupe_skipped"
+                                if reason:
+                                    prefix += f" ({reason})"
+                                _CLIENT_LOGGER.debug(
+                                    "%s plugin=%s group=%s id=%s count=%d window=%.1fs",
+                                    prefix,
+                                    plugin_name,
+                                    group_label or "",
+                                    item_id,
+                                    state["count"],
+                                    now - last_log,
+                                )
+                                state["count"] = 0
+                                state["last"] = now
                         return False
 
         changed = process_legacy_payload(self._store, payload, trace_fn=trace_fn)
@@ -114,17 +110,13 @@ class PayloadModel:
             self._last_snapshots[item_id] = (snapshot, override_generation)
         return changed
 
-    def purge_expired(self, now: Optional[float] = None) -> bool:
-        """Purge expired items; returns True if any were removed."""
+    def purge_expired(self, now: Optional[int] = None) -> bool:
+        """Purge expired items; ``now`` is a ``time.monotonic_ns()`` timestamp."""
 
-        before_ids = {item_id for item_id, _ in self._store.items()}
-        changed = self._store.purge_expired(now or time.monotonic())
-        after_ids = {item_id for item_id, _ in self._store.items()}
-        removed = before_ids - after_ids
-        if removed:
-            for item_id in removed:
-                self._last_snapshots.pop(item_id, None)
-        return changed
+        removed = self._store.purge_expired_ids(now or time.monotonic_ns())
+        for item_id in removed:
+            self._last_snapshots.pop(item_id, None)
+        return bool(removed)
 
     # Convenience wrappers to match previous direct store access ----------------
 
@@ -141,4 +133,4 @@ class PayloadModel:
         return iter(self._store.items())
 
     def __len__(self):
-        return len(list(self._store.items()))
+        return len(self._store)
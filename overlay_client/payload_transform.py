@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from PyQt6.QtGui import QFont, QFontMetrics
@@ -16,21 +17,21 @@ if TYPE_CHECKING:  # pragma: no cover
     from overlay_client.group_transform import GroupBounds
 
 
+@dataclass(frozen=True, slots=True)
 class PayloadAxisContext:
-    __slots__ = ("overflow", "min_bound", "max_bound")
-
-    def __init__(self, overflow: bool, min_bound: float, max_bound: float) -> None:
-        self.overflow = overflow
-        self.min_bound = min_bound
-        self.max_bound = max_bound
+    overflow: bool
+    min_bound: float
+    max_bound: float
 
 
+@dataclass(frozen=True, slots=True)
 class PayloadTransformContext:
-    __slots__ = ("axis_x", "axis_y")
+    axis_x: PayloadAxisContext
+    axis_y: PayloadAxisContext
+
 
-    def __init__(self, axis_x: PayloadAxisContext, axis_y: PayloadAxisContext) -> None:
-        self.axis_x = axis_x
-        self.axis_y = axis_y
+# The clamp bounds are the fixed base canvas, so only the overflow flags vary.
+_TRANSFORM_CONTEXTS: Dict[Tuple[bool, bool], PayloadTransformContext] = {}
 
 
 def build_payload_transform_context(
@@ -39,17 +40,18 @@ def build_payload_transform_context(
     overflow_x: Optional[bool] = None,
     overflow_y: Optional[bool] = None,
 ) -> PayloadTransformContext:
-    axis_x = PayloadAxisContext(
-        overflow=fill.overflow_x if overflow_x is None else overflow_x,
-        min_bound=0.0,
-        max_bound=BASE_WIDTH,
-    )
-    axis_y = PayloadAxisContext(
-        overflow=fill.overflow_y if overflow_y is None else overflow_y,
-        min_bound=0.0,
-        max_bound=BASE_HEIGHT,
+    key = (
+        bool(fill.overflow_x if overflow_x is None else overflow_x),
+        bool(fill.overflow_y if overflow_y is None else overflow_y),
     )
-    return PayloadTransformContext(axis_x=axis_x, axis_y=axis_y)
+    context = _TRANSFORM_CONTEXTS.get(key)
+    if context is None:
+        context = PayloadTransformContext(
+            axis_x=PayloadAxisContext(overflow=key[0], min_bound=0.0, max_bound=BASE_WIDTH),
+            axis_y=PayloadAxisContext(overflow=key[1], min_bound=0.0, max_bound=BASE_HEIGHT),
+        )
+        _TRANSFORM_CONTEXTS[key] = context
+    return context
 
 
 def _clamp_axis(value: float, axis: PayloadAxisContext) -> float:
@@ -62,21 +64,29 @@ def _clamp_axis(value: float, axis: PayloadAxisContext) -> float:
     return value
 
 
-def remap_axis_value(value: float, axis: PayloadAxisContext) -> float:
-    return _clamp_axis(value, axis)
+def _axis_limits(context: Optional[PayloadTransformContext]) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+    """Return the (min, max) clamp bounds per axis, or None where the axis may overflow."""
+    if context is None:
+        return None, None
+    axis_x = context.axis_x
+    axis_y = context.axis_y
+    limits_x = None if axis_x.overflow else (axis_x.min_bound, axis_x.max_bound)
+    limits_y = None if axis_y.overflow else (axis_y.min_bound, axis_y.max_bound)
+    return limits_x, limits_y
 
 
-def _clamp_axis(value: float, axis: PayloadAxisContext) -> float:
+def remap_axis_value(value: float, axis: PayloadAxisContext) -> float:
+    # Overflowing axes are the identity; return before paying for the clamp call.
     if axis.overflow:
         return value
-    if value < axis.min_bound:
-        return axis.min_bound
-    if value > axis.max_bound:
-        return axis.max_bound
-    return value
+    return _clamp_axis(value, axis)
 
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
+    if isinstance(value, float):
+        return value
+    if isinstance(value, int):
+        return float(value)
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -116,13 +126,17 @@ def transform_components(meta: Optional[Mapping[str, Any]]) -> Tuple[float, floa
 
 def logical_mapping(data: Mapping[str, Any]) -> Mapping[str, Any]:
     transform_meta = data.get("__mo_transform__") if isinstance(data, Mapping) else None
+    return _logical_from_meta(data, transform_meta)
+
+
+def _logical_from_meta(data: Mapping[str, Any], transform_meta: Any) -> Mapping[str, Any]:
     if isinstance(transform_meta, Mapping):
         original = transform_meta.get("original")
         if isinstance(original, Mapping):
             points_meta = original.get("points")
             if isinstance(points_meta, list):
                 return original
-            if any(key in original for key in ("x", "y", "w", "h")):
+            if "x" in original or "y" in original or "w" in original or "h" in original:
                 return original
     return data
 
@@ -136,39 +150,17 @@ def apply_transform_meta_to_point(
 ) -> Tuple[float, float]:
     x_adj = x
     y_adj = y
+    fill_x = fill_dx if math.isfinite(fill_dx) else 0.0
+    fill_y = fill_dy if math.isfinite(fill_dy) else 0.0
     if not isinstance(meta, Mapping):
-        fill_x = fill_dx if math.isfinite(fill_dx) else 0.0
-        fill_y = fill_dy if math.isfinite(fill_dy) else 0.0
         return x_adj + fill_x, y_adj + fill_y
 
-    pivot_block = meta.get("pivot")
-    if isinstance(pivot_block, Mapping):
-        pivot_x = _safe_float(pivot_block.get("x"), 0.0)
-        pivot_y = _safe_float(pivot_block.get("y"), 0.0)
-    else:
-        pivot_x = 0.0
-        pivot_y = 0.0
-
-    scale_block = meta.get("scale")
-    if isinstance(scale_block, Mapping):
-        scale_x = _safe_float(scale_block.get("x"), 1.0)
-        scale_y = _safe_float(scale_block.get("y"), 1.0)
-    else:
-        scale_x = 1.0
-        scale_y = 1.0
-
-    offset_block = meta.get("offset")
-    if isinstance(offset_block, Mapping):
-        offset_x = _safe_float(offset_block.get("x"), 0.0)
-        offset_y = _safe_float(offset_block.get("y"), 0.0)
-    else:
-        offset_x = 0.0
-        offset_y = 0.0
-
+    pivot_x, pivot_y, scale_x, scale_y, offset_x, offset_y = transform_components(meta)
+    if scale_x == 1.0 and scale_y == 1.0 and offset_x == 0.0 and offset_y == 0.0:
+        # Identity transform: the pivot has no effect.
+        return x_adj + fill_x, y_adj + fill_y
     scaled_x = pivot_x + (x_adj - pivot_x) * scale_x
     scaled_y = pivot_y + (y_adj - pivot_y) * scale_y
-    fill_x = fill_dx if math.isfinite(fill_dx) else 0.0
-    fill_y = fill_dy if math.isfinite(fill_dy) else 0.0
     return scaled_x + offset_x + fill_x, scaled_y + offset_y + fill_y
 
 
@@ -179,17 +171,23 @@ def remap_point(
     raw_y: float,
     context: Optional[PayloadTransformContext] = None,
 ) -> Tuple[float, float]:
-    pivot_x, pivot_y, scale_x_meta, scale_y_meta, offset_x_meta, offset_y_meta = transform_components(transform_meta)
-    point = fill.remap_point(
-        raw_x,
-        raw_y,
-        pivot_x,
-        pivot_y,
-        scale_x_meta,
-        scale_y_meta,
-        offset_x_meta,
-        offset_y_meta,
-    )
+    if not isinstance(transform_meta, Mapping):
+        # No payload transform: the fill's axis remap is the identity.
+        point = (float(raw_x), float(raw_y))
+    else:
+        pivot_x, pivot_y, scale_x_meta, scale_y_meta, offset_x_meta, offset_y_meta = transform_components(
+            transform_meta
+        )
+        point = fill.remap_point(
+            raw_x,
+            raw_y,
+            pivot_x,
+            pivot_y,
+            scale_x_meta,
+            scale_y_meta,
+            offset_x_meta,
+            offset_y_meta,
+        )
     if context is None:
         return point
     clamped_x = _clamp_axis(point[0], context.axis_x)
@@ -207,18 +205,18 @@ def remap_rect_points(
     context: Optional[PayloadTransformContext] = None,
 ) -> List[Tuple[float, float]]:
     pivot_x, pivot_y, scale_x_meta, scale_y_meta, offset_x_meta, offset_y_meta = transform_components(transform_meta)
-    mapper_x = fill.overlay_mapper_x(pivot_x, scale_x_meta, offset_x_meta)
-    mapper_y = fill.overlay_mapper_y(pivot_y, scale_y_meta, offset_y_meta)
-    corners = [
-        (raw_x, raw_y),
-        (raw_x + raw_w, raw_y),
-        (raw_x, raw_y + raw_h),
-        (raw_x + raw_w, raw_y + raw_h),
-    ]
-    points = [(mapper_x(cx), mapper_y(cy)) for cx, cy in corners]
-    if context is None:
-        return points
-    return [(_clamp_axis(px, context.axis_x), _clamp_axis(py, context.axis_y)) for px, py in points]
+    left, right = fill.axis_x.remap_many((raw_x, raw_x + raw_w), pivot_x, scale_x_meta, offset_x_meta)
+    top, bottom = fill.axis_y.remap_many((raw_y, raw_y + raw_h), pivot_y, scale_y_meta, offset_y_meta)
+    limits_x, limits_y = _axis_limits(context)
+    if limits_x is not None:
+        min_x, max_x = limits_x
+        left = min_x if left < min_x else (max_x if left > max_x else left)
+        right = min_x if right < min_x else (max_x if right > max_x else right)
+    if limits_y is not None:
+        min_y, max_y = limits_y
+        top = min_y if top < min_y else (max_y if top > max_y else top)
+        bottom = min_y if bottom < min_y else (max_y if bottom > max_y else bottom)
+    return [(left, top), (right, top), (left, bottom), (right, bottom)]
 
 
 def remap_vector_points(
@@ -228,9 +226,9 @@ def remap_vector_points(
     context: Optional[PayloadTransformContext] = None,
 ) -> List[Tuple[float, float, Mapping[str, Any]]]:
     pivot_x, pivot_y, scale_x_meta, scale_y_meta, offset_x_meta, offset_y_meta = transform_components(transform_meta)
-    mapper_x = fill.overlay_mapper_x(pivot_x, scale_x_meta, offset_x_meta)
-    mapper_y = fill.overlay_mapper_y(pivot_y, scale_y_meta, offset_y_meta)
-    resolved: List[Tuple[float, float, Mapping[str, Any]]] = []
+    raw_xs: List[float] = []
+    raw_ys: List[float] = []
+    kept: List[Mapping[str, Any]] = []
     for point in points:
         if not isinstance(point, Mapping):
             continue
@@ -239,38 +237,90 @@ def remap_vector_points(
             py = float(point.get("y", 0.0))
         except (TypeError, ValueError):
             continue
-        mapped_x = mapper_x(px)
-        mapped_y = mapper_y(py)
-        if context is not None:
-            mapped_x = _clamp_axis(mapped_x, context.axis_x)
-            mapped_y = _clamp_axis(mapped_y, context.axis_y)
-        resolved.append((mapped_x, mapped_y, point))
-    return resolved
-
-
-def _measure_text_block(metrics: QFontMetrics, text_value: str) -> Tuple[int, int]:
-    """Return the pixel width/height of a potentially multi-line text block."""
+        raw_xs.append(px)
+        raw_ys.append(py)
+        kept.append(point)
+    xs = fill.axis_x.remap_many(raw_xs, pivot_x, scale_x_meta, offset_x_meta)
+    ys = fill.axis_y.remap_many(raw_ys, pivot_y, scale_y_meta, offset_y_meta)
+    limits_x, limits_y = _axis_limits(context)
+    if limits_x is not None:
+        min_x, max_x = limits_x
+        xs = [min_x if value < min_x else (max_x if value > max_x else value) for value in xs]
+    if limits_y is not None:
+        min_y, max_y = limits_y
+        ys = [min_y if value < min_y else (max_y if value > max_y else value) for value in ys]
+    return list(zip(xs, ys, kept))
+
+
+_BOUNDS_METRICS_CACHE_LIMIT = 64
+_BOUNDS_METRICS: Dict[Tuple[str, float, Tuple[str, ...]], Tuple[QFontMetrics, int]] = {}
+
+
+def _bounds_font_metrics(
+    font_family: str,
+    point_size: float,
+    font_fallbacks: Optional[Sequence[str]],
+) -> Tuple[QFontMetrics, int]:
+    """Return metrics and block line spacing for the bounds font, built once per family/size/fallbacks."""
+    key = (font_family, point_size, tuple(font_fallbacks) if font_fallbacks else ())
+    entry = _BOUNDS_METRICS.get(key)
+    if entry is None:
+        font = QFont(font_family)
+        apply_font_fallbacks(font, font_fallbacks)
+        font.setPointSizeF(point_size)
+        metrics = QFontMetrics(font)
+        entry = (metrics, _block_line_spacing(metrics))
+        if len(_BOUNDS_METRICS) >= _BOUNDS_METRICS_CACHE_LIMIT:
+            _BOUNDS_METRICS.clear()
+        _BOUNDS_METRICS[key] = entry
+    return entry
+
+
+def _block_line_spacing(metrics: QFontMetrics) -> int:
+    return max(metrics.lineSpacing(), metrics.height(), 0)
+
+
+def _normalise_newlines(text: str) -> str:
+    """Return ``text`` with CRLF/CR line endings converted to LF."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _measure_text_block(
+    metrics: QFontMetrics,
+    text_value: str,
+    line_spacing: Optional[int] = None,
+) -> Tuple[int, int]:
+    """Return the pixel width/height of a potentially multi-line text block.
+
+    ``line_spacing`` may be passed when the caller already resolved it for ``metrics``.
+    """
     if metrics is None:
         return 0, 0
-    normalised = (
-        str(text_value)
-        .replace("\r\n", "\n")
-        .replace("\r", "\n")
-    )
-    lines = normalised.split("\n")
-    if not lines:
-        lines = [""]
-    max_width = 0
-    for line in lines:
+    if line_spacing is None:
+        line_spacing = _block_line_spacing(metrics)
+    text = _normalise_newlines(str(text_value))
+    if "\n" not in text:
         try:
-            advance = metrics.horizontalAdvance(line)
+            width = metrics.horizontalAdvance(text)
         except Exception:
-            advance = 0
-        if advance > max_width:
-            max_width = advance
-    line_spacing = max(metrics.lineSpacing(), metrics.height(), 0)
-    if line_spacing <= 0:
-        line_spacing = 0
+            width = 0
+        return max(0, width), max(0, line_spacing)
+    # split("\n") rather than splitlines(): the latter also breaks on \v, \f, U+2028 etc.
+    # and drops a trailing empty line, which would change the block height.
+    lines = text.split("\n")
+    try:
+        max_width = max(map(metrics.horizontalAdvance, lines))
+    except Exception:
+        max_width = 0
+        for line in lines:
+            try:
+                advance = metrics.horizontalAdvance(line)
+            except Exception:
+                advance = 0
+            if advance > max_width:
+                max_width = advance
     total_height = line_spacing * max(1, len(lines))
     return max(0, max_width), max(0, total_height)
 
@@ -293,11 +343,11 @@ def accumulate_group_bounds(
     data = item.data
     if not isinstance(data, Mapping):
         return
-    logical = logical_mapping(data)
-    transform_meta = data.get("__mo_transform__") if isinstance(data, Mapping) else None
-
-    def transform_point(x_val: float, y_val: float) -> Tuple[float, float]:
-        return apply_transform_meta_to_point(transform_meta, x_val, y_val)
+    transform_meta = data.get("__mo_transform__")
+    logical = _logical_from_meta(data, transform_meta)
+    # Resolve the transform once per item; the per-point maths below matches
+    # apply_transform_meta_to_point without re-parsing the metadata.
+    p_x, p_y, s_x, s_y, o_x, o_y = transform_components(transform_meta)
 
     kind = item.kind
     if pixels_per_overlay_unit <= 0.0 or not math.isfinite(pixels_per_overlay_unit):
@@ -306,13 +356,9 @@ def accumulate_group_bounds(
         if kind == "message":
             x_val = float(logical.get("x", data.get("x", 0.0)))
             y_val = float(logical.get("y", data.get("y", 0.0)))
-            size_label = str(data.get("size", "normal")) if isinstance(data, Mapping) else "normal"
+            size_label = str(data.get("size", "normal"))
             point_size = preset_point_size(size_label)
-            normalised_text = (
-                str(data.get("text", ""))
-                .replace("\r\n", "\n")
-                .replace("\r", "\n")
-            )
+            normalised_text = _normalise_newlines(str(data.get("text", "")))
             fallback_tuple = tuple(font_fallbacks) if font_fallbacks else ()
             cache_key: Optional[Tuple[str, float, str, Tuple[str, ...], float, int]] = None
             cached_block: Optional[Tuple[int, int]] = None
@@ -325,30 +371,32 @@ def accumulate_group_bounds(
                     round(device_ratio or 1.0, 3),
                     int(cache_generation or 0),
                 )
-                cached_block = text_block_cache.get(cache_key)
-            font = QFont(font_family)
-            apply_font_fallbacks(font, font_fallbacks)
-            font.setPointSizeF(point_size)
-            metrics = QFontMetrics(font)
+                cached_block = text_block_cache.pop(cache_key, None)
+                if cached_block is not None:
+                    # Re-insert so the dict's insertion order tracks recency (LRU eviction below).
+                    text_block_cache[cache_key] = cached_block
             text_value = normalised_text
             if cached_block is not None:
+                # Cached blocks already carry the fallbacks below, so no font is needed.
                 text_width_px, block_height_px = cached_block
             else:
-                text_width_px, block_height_px = _measure_text_block(metrics, text_value)
-            if text_width_px <= 0 and text_value:
-                try:
-                    text_width_px = max(metrics.averageCharWidth() * len(text_value), 0)
-                except Exception:
-                    text_width_px = 0
-            if block_height_px <= 0 and text_value:
-                block_height_px = metrics.height()
-            if cached_block is None and cache_key is not None and text_block_cache is not None:
-                text_block_cache[cache_key] = (text_width_px, block_height_px)
-                if len(text_block_cache) > 512:
-                    text_block_cache.pop(next(iter(text_block_cache)))
+                metrics, line_spacing = _bounds_font_metrics(font_family, point_size, font_fallbacks)
+                text_width_px, block_height_px = _measure_text_block(metrics, text_value, line_spacing)
+                if text_width_px <= 0 and text_value:
+                    try:
+                        text_width_px = max(metrics.averageCharWidth() * len(text_value), 0)
+                    except Exception:
+                        text_width_px = 0
+                if block_height_px <= 0 and text_value:
+                    block_height_px = metrics.height()
+                if cache_key is not None and text_block_cache is not None:
+                    text_block_cache[cache_key] = (text_width_px, block_height_px)
+                    if len(text_block_cache) > 512:
+                        text_block_cache.pop(next(iter(text_block_cache)))
             width_logical = max(0.0, text_width_px / pixels_per_overlay_unit)
             height_logical = max(0.0, block_height_px / pixels_per_overlay_unit)
-            adj_x, adj_y = transform_point(x_val, y_val)
+            adj_x = p_x + (x_val - p_x) * s_x + o_x
+            adj_y = p_y + (y_val - p_y) * s_y + o_y
             bounds.update_rect(
                 adj_x,
                 adj_y,
@@ -360,19 +408,21 @@ def accumulate_group_bounds(
             y_val = float(logical.get("y", data.get("y", 0.0)))
             w_val = float(logical.get("w", data.get("w", 0.0)))
             h_val = float(logical.get("h", data.get("h", 0.0)))
-            corners = [
-                transform_point(x_val, y_val),
-                transform_point(x_val + w_val, y_val),
-                transform_point(x_val, y_val + h_val),
-                transform_point(x_val + w_val, y_val + h_val),
-            ]
-            xs = [pt[0] for pt in corners]
-            ys = [pt[1] for pt in corners]
-            bounds.update_rect(min(xs), min(ys), max(xs), max(ys))
+            left = p_x + (x_val - p_x) * s_x + o_x
+            right = p_x + (x_val + w_val - p_x) * s_x + o_x
+            top = p_y + (y_val - p_y) * s_y + o_y
+            bottom = p_y + (y_val + h_val - p_y) * s_y + o_y
+            # The transform is axis-aligned, so two opposite corners span the rect;
+            # a negative scale or size only swaps them.
+            if right < left:
+                left, right = right, left
+            if bottom < top:
+                top, bottom = bottom, top
+            bounds.update_rect(left, top, right, bottom)
         elif kind == "vector":
-            points = logical.get("points") if isinstance(logical, Mapping) else None
+            points = logical.get("points")
             if not isinstance(points, list):
-                points = data.get("points") if isinstance(data, Mapping) else None
+                points = data.get("points")
             if isinstance(points, list):
                 for point in points:
                     if not isinstance(point, Mapping):
@@ -382,13 +432,11 @@ def accumulate_group_bounds(
                         py = float(point.get("y", 0.0))
                     except (TypeError, ValueError):
                         continue
-                    adj_x, adj_y = transform_point(px, py)
-                    bounds.update_point(adj_x, adj_y)
+                    bounds.update_point(p_x + (px - p_x) * s_x + o_x, p_y + (py - p_y) * s_y + o_y)
         else:
             x_val = float(logical.get("x", data.get("x", 0.0)))
             y_val = float(logical.get("y", data.get("y", 0.0)))
-            adj_x, adj_y = transform_point(x_val, y_val)
-            bounds.update_point(adj_x, adj_y)
+            bounds.update_point(p_x + (x_val - p_x) * s_x + o_x, p_y + (y_val - p_y) * s_y + o_y)
     except (TypeError, ValueError):
         pass
 
@@ -397,20 +445,19 @@ def determine_group_anchor(item: LegacyItem) -> Tuple[float, float]:
     data = item.data
     if not isinstance(data, Mapping):
         return 0.0, 0.0
-    logical = logical_mapping(data)
-    transform_meta = data.get("__mo_transform__") if isinstance(data, Mapping) else None
+    transform_meta = data.get("__mo_transform__")
+    logical = _logical_from_meta(data, transform_meta)
     kind = item.kind
     try:
         if kind == "vector":
-            points = logical.get("points") if isinstance(logical, Mapping) else None
+            points = logical.get("points")
             if not isinstance(points, list) or not points:
-                points = data.get("points") if isinstance(data, Mapping) else None
+                points = data.get("points")
             if isinstance(points, list):
-                for point in points:
-                    if not isinstance(point, Mapping):
-                        continue
-                    px = _safe_float(point.get("x"), 0.0)
-                    py = _safe_float(point.get("y"), 0.0)
+                first = next((point for point in points if isinstance(point, Mapping)), None)
+                if first is not None:
+                    px = _safe_float(first.get("x"), 0.0)
+                    py = _safe_float(first.get("y"), 0.0)
                     return apply_transform_meta_to_point(transform_meta, px, py)
             return 0.0, 0.0
         if kind == "rect":
@@ -3,14 +3,16 @@ from __future__ import annotations
 
 # ruff: noqa: E402
 
+import fnmatch
 import json
+import logging
 import math
+import re
 import time
-from dataclasses import dataclass
-from fnmatch import fnmatchcase
+from dataclasses import dataclass, field
 from pathlib import Path
 import sys
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple
 
 OVERLAY_ROOT = Path(__file__).resolve().parents[1]
 if str(OVERLAY_ROOT) not in sys.path:
@@ -24,16 +26,22 @@ from overlay_plugin.overlay_api import PluginGroupingError, _normalise_backgroun
 
 JsonDict = Dict[str, Any]
 
-_ANCHOR_OPTIONS = {"nw", "ne", "sw", "se", "center", "top", "bottom", "left", "right"}
-_PAYLOAD_JUSTIFICATION_CHOICES = {"left", "center", "right"}
+_ANCHOR_OPTIONS = frozenset({"nw", "ne", "sw", "se", "center", "top", "bottom", "left", "right"})
+_PAYLOAD_JUSTIFICATION_CHOICES = frozenset({"left", "center", "right"})
 _DEFAULT_PAYLOAD_JUSTIFICATION = "left"
-_MARKER_LABEL_POSITION_CHOICES = {"below", "above", "centered"}
+_MARKER_LABEL_POSITION_CHOICES = frozenset({"below", "above", "centered"})
 _DEFAULT_MARKER_LABEL_POSITION = "below"
-_CONTROLLER_PREVIEW_BOX_MODE_CHOICES = {"last", "max"}
+_CONTROLLER_PREVIEW_BOX_MODE_CHOICES = frozenset({"last", "max"})
 _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE = "last"
+_RELOAD_CHECK_INTERVAL = 0.5
+_RESERVED_PLUGIN_KEYS = frozenset({"notes", "grouping", "idPrefixGroups", "matchingPrefixes"})
+_GROUP_SPEC_CACHE_LIMIT = 512
+_OVERRIDE_ALTERNATION_MIN = 3
+_CANONICAL_NAME_CACHE_LIMIT = 256
+_CANONICAL_NAMES: Dict[str, Optional[str]] = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class _GroupSpec:
     label: Optional[str]
     prefixes: Tuple[PrefixEntry, ...]
@@ -47,9 +55,90 @@ class _GroupSpec:
     background_color: Optional[str] = None
     background_border_color: Optional[str] = None
     background_border_width: Optional[int] = None
+    # Exact entries first, then longest prefix first, so the first hit scores best.
+    scored_prefixes: Tuple[PrefixEntry, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.scored_prefixes = tuple(
+            sorted(self.prefixes, key=lambda entry: (entry.match_mode != "exact", -len(entry.value)))
+        )
+
+
+class _OverrideIndex:
+    """Precompiled form of a plugin's ordered ``(pattern, override)`` list.
+
+    Equivalent to scanning the list with ``fnmatchcase``: the first pattern in
+    order that matches the id as-is or casefolded wins. Literal patterns are
+    dict lookups; wildcard patterns are translated and compiled once, and more
+    than a couple of them are fused into one anchored alternation whose first
+    matching branch is the first matching pattern.
+    """
+
+    __slots__ = ("_overrides", "_literals", "_literals_cf", "_wildcards", "_combined", "_combined_cf", "_branches")
+
+    def __init__(self, overrides: Sequence[Tuple[str, JsonDict]]) -> None:
+        self._overrides = overrides
+        self._literals: Dict[str, int] = {}
+        self._literals_cf: Dict[str, int] = {}
+        self._wildcards: List[Tuple[int, Callable[[str], Any], Callable[[str], Any]]] = []
+        self._combined: Optional[Callable[[str], Any]] = None
+        self._combined_cf: Optional[Callable[[str], Any]] = None
+        self._branches: Dict[str, int] = {}
+        wildcard_patterns: List[Tuple[int, str, str]] = []
+        for index, (pattern, _spec) in enumerate(overrides):
+            folded = pattern.casefold()
+            if "*" in pattern or "?" in pattern or "[" in pattern:
+                wildcard_patterns.append((index, pattern, folded))
+            else:
+                self._literals.setdefault(pattern, index)
+                self._literals_cf.setdefault(folded, index)
+        if len(wildcard_patterns) >= _OVERRIDE_ALTERNATION_MIN:
+            self._branches = {f"o{index}": index for index, _pattern, _folded in wildcard_patterns}
+            self._combined = re.compile(
+                "|".join(f"(?P<o{index}>{fnmatch.translate(pattern)})" for index, pattern, _folded in wildcard_patterns)
+            ).match
+            if all(folded == pattern for _index, pattern, folded in wildcard_patterns):
+                self._combined_cf = self._combined
+            else:
+                self._combined_cf = re.compile(
+                    "|".join(f"(?P<o{index}>{fnmatch.translate(folded)})" for index, _pattern, folded in wildcard_patterns)
+                ).match
+            return
+        for index, pattern, folded in wildcard_patterns:
+            match = re.compile(fnmatch.translate(pattern)).match
+            # Already-folded patterns (the usual case) share one matcher.
+            match_folded = match if folded == pattern else re.compile(fnmatch.translate(folded)).match
+            self._wildcards.append((index, match, match_folded))
+
+    def select(self, message_id: str, message_id_cf: Optional[str] = None) -> Optional[Tuple[str, JsonDict]]:
+        if message_id_cf is None:
+            message_id_cf = message_id.casefold()
+        limit = len(self._overrides)
+        folded_id = message_id_cf != message_id
+        best = min(self._literals.get(message_id, limit), self._literals_cf.get(message_id_cf, limit))
+        combined = self._combined
+        if combined is not None:
+            found = combined(message_id)
+            if found is not None:
+                best = min(best, self._branches[found.lastgroup])
+            combined_cf = self._combined_cf
+            if combined_cf is not None and (folded_id or combined_cf is not combined):
+                found = combined_cf(message_id_cf)
+                if found is not None:
+                    best = min(best, self._branches[found.lastgroup])
+        else:
+            for index, match, match_folded in self._wildcards:
+                if index >= best:
+                    break
+                if match(message_id) or ((folded_id or match_folded is not match) and match_folded(message_id_cf)):
+                    best = index
+                    break
+        if best < limit:
+            return self._overrides[best]
+        return None
 
 
-@dataclass
+@dataclass(slots=True)
 class _PluginConfig:
     name: str
     canonical_name: str
@@ -57,6 +146,243 @@ class _PluginConfig:
     overrides: List[Tuple[str, JsonDict]]
     plugin_defaults: Optional[JsonDict]
     group_specs: Tuple[_GroupSpec, ...]
+    override_index: _OverrideIndex = field(init=False, repr=False, compare=False)
+    # Every group prefix, casefolded, paired with its spec label in spec/entry order.
+    group_label_prefixes: Tuple[Tuple[str, Optional[str]], ...] = field(init=False, repr=False, compare=False)
+    # The same prefixes alone, for a single ``str.startswith`` rejection test.
+    group_prefix_tuple: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Casefolded payload id -> selected group spec; discarded with the config on reload.
+    group_spec_cache: Dict[str, Optional[_GroupSpec]] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    # Group label (or first prefix when unlabelled) -> first spec carrying it.
+    spec_by_label: Dict[str, _GroupSpec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.override_index = _OverrideIndex(self.overrides)
+        self.group_label_prefixes = tuple(
+            (entry.value.casefold(), spec.label) for spec in self.group_specs for entry in spec.prefixes
+        )
+        self.group_prefix_tuple = tuple(prefix for prefix, _label in self.group_label_prefixes)
+        self.spec_by_label = {}
+        for spec in self.group_specs:
+            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
+            if label_value is not None:
+                self.spec_by_label.setdefault(label_value, spec)
+
+
+@dataclass(slots=True)
+class _PrefixTrieNode:
+    children: Dict[str, "_PrefixTrieNode"] = field(default_factory=dict)
+    # Registration order of the first plugin whose prefix ends here, plus that plugin.
+    owner: Optional[Tuple[int, _PluginConfig]] = None
+
+
+def _build_prefix_trie(plugins: Mapping[str, _PluginConfig]) -> _PrefixTrieNode:
+    """Index every plugin's casefolded id prefixes by character."""
+
+    root = _PrefixTrieNode()
+    for order, config in enumerate(plugins.values()):
+        for prefix in config.match_id_prefixes:
+            node = root
+            for char in prefix:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _PrefixTrieNode()
+                node = child
+            if node.owner is None:
+                node.owner = (order, config)
+    return root
+
+
+def _match_prefix_trie(root: _PrefixTrieNode, payload_cf: str) -> Optional[_PluginConfig]:
+    """Return the earliest-registered plugin with any prefix of ``payload_cf``."""
+
+    best = root.owner
+    node = root
+    for char in payload_cf:
+        next_node = node.children.get(char)
+        if next_node is None:
+            break
+        node = next_node
+        owner = node.owner
+        if owner is not None and (best is None or owner[0] < best[0]):
+            best = owner
+    return best[1] if best is not None else None
+
+
+def _extend_match_prefixes(match_prefixes: List[str], raw: Any) -> None:
+    if isinstance(raw, str):
+        candidates = [raw]
+    elif isinstance(raw, (list, tuple)):
+        candidates = [entry for entry in raw if isinstance(entry, str)]
+    else:
+        candidates = []
+    for value in candidates:
+        token = value.strip()
+        if not token:
+            continue
+        prefix = token.casefold()
+        if prefix not in match_prefixes:
+            match_prefixes.append(prefix)
+
+
+def _clean_group_prefixes(raw_value: Any) -> Tuple[PrefixEntry, ...]:
+    entries = parse_prefix_entries(raw_value)
+    return tuple(entries)
+
+
+def _parse_anchor(source: Mapping[str, Any]) -> Optional[str]:
+    anchor_field = source.get("idPrefixGroupAnchor") or source.get("anchor")
+    if isinstance(anchor_field, str) and anchor_field.strip():
+        return anchor_field.strip()
+    legacy_block = source.get("preserve_fill_aspect")
+    if isinstance(legacy_block, dict):
+        legacy_anchor = legacy_block.get("anchor")
+        if isinstance(legacy_anchor, str) and legacy_anchor.strip():
+            return legacy_anchor.strip()
+    return None
+
+
+def _parse_offset_value(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        numeric = float(value)
+        if math.isfinite(numeric):
+            return numeric
+    return None
+
+
+def _parse_offsets(source: Mapping[str, Any]) -> Tuple[float, float]:
+    dx = _parse_offset_value(source.get("offsetX") or source.get("offset_x"))
+    dy = _parse_offset_value(source.get("offsetY") or source.get("offset_y"))
+    return (dx if dx is not None else 0.0, dy if dy is not None else 0.0)
+
+
+def _parse_choice(source: Mapping[str, Any], camel_key: str, snake_key: str, choices: frozenset[str], default: str) -> str:
+    raw_value = source.get(camel_key) or source.get(snake_key)
+    if isinstance(raw_value, str):
+        token = raw_value.strip().lower()
+        if token in choices:
+            return token
+    return default
+
+
+def _parse_payload_justification(source: Mapping[str, Any]) -> str:
+    return _parse_choice(
+        source,
+        "payloadJustification",
+        "payload_justification",
+        _PAYLOAD_JUSTIFICATION_CHOICES,
+        _DEFAULT_PAYLOAD_JUSTIFICATION,
+    )
+
+
+def _parse_marker_label_position(source: Mapping[str, Any]) -> str:
+    return _parse_choice(
+        source,
+        "markerLabelPosition",
+        "marker_label_position",
+        _MARKER_LABEL_POSITION_CHOICES,
+        _DEFAULT_MARKER_LABEL_POSITION,
+    )
+
+
+def _parse_controller_preview_box_mode(source: Mapping[str, Any]) -> str:
+    return _parse_choice(
+        source,
+        "controllerPreviewBoxMode",
+        "controller_preview_box_mode",
+        _CONTROLLER_PREVIEW_BOX_MODE_CHOICES,
+        _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE,
+    )
+
+
+def _parse_background_fields(
+    source: Mapping[str, Any],
+) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    color: Optional[str] = None
+    border_color: Optional[str] = None
+    border: Optional[int] = None
+    if "backgroundColor" in source:
+        raw_color = source.get("backgroundColor")
+        if raw_color is None:
+            color = None
+        else:
+            try:
+                color = _normalise_background_color(raw_color)
+            except PluginGroupingError:
+                color = None
+    if "backgroundBorderColor" in source:
+        raw_border_color = source.get("backgroundBorderColor")
+        if raw_border_color is None:
+            border_color = None
+        else:
+            try:
+                border_color = _normalise_background_color(raw_border_color)
+            except PluginGroupingError:
+                border_color = None
+    if "backgroundBorderWidth" in source:
+        raw_border = source.get("backgroundBorderWidth")
+        if raw_border is None:
+            border = None
+        else:
+            try:
+                border = _normalise_border_width(raw_border, "backgroundBorderWidth")
+            except PluginGroupingError:
+                border = None
+    return color, border_color, border
+
+
+def _append_group_spec(
+    grouping_specs: List[_GroupSpec],
+    group_prefix_hints: List[str],
+    label: Optional[str],
+    prefixes: Tuple[str, ...],
+    anchor: Optional[str],
+    offset_x: float,
+    offset_y: float,
+    payload_justification: str,
+    marker_label_position: str,
+    controller_preview_box_mode: str,
+    background_color: Optional[str],
+    background_border_color: Optional[str],
+    background_border_width: Optional[int],
+) -> None:
+    if not prefixes:
+        return
+    grouping_specs.append(
+        _GroupSpec(
+            label=label,
+            prefixes=prefixes,
+            defaults=None,
+            anchor=anchor,
+            offset_x=offset_x,
+            offset_y=offset_y,
+            payload_justification=payload_justification,
+            marker_label_position=marker_label_position,
+            controller_preview_box_mode=controller_preview_box_mode,
+            background_color=background_color,
+            background_border_color=background_border_color,
+            background_border_width=background_border_width,
+        )
+    )
+    for entry in prefixes:
+        value_cf = entry.value.casefold()
+        if value_cf not in group_prefix_hints:
+            group_prefix_hints.append(value_cf)
+
+
+def _intern_override_spec(spec: Mapping[str, Any], interned: Dict[str, JsonDict]) -> JsonDict:
+    """Return a shared copy of ``spec`` so equal override bodies are stored once."""
+
+    try:
+        key = json.dumps(spec, sort_keys=True)
+    except (TypeError, ValueError):
+        return dict(spec)
+    existing = interned.get(key)
+    if existing is None:
+        existing = interned[key] = dict(spec)
+    return existing
 
 
 class PluginOverrideManager:
@@ -74,8 +400,9 @@ class PluginOverrideManager:
         self._groupings_loader = groupings_loader
         self._mtime: Optional[float] = None
         self._plugins: Dict[str, _PluginConfig] = {}
+        self._prefix_trie = _PrefixTrieNode()
         self._debug_config = debug_config or DebugConfig()
-        self._diagnostic_spans: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+        self._diagnostic_spans: Set[Tuple[str, str]] = set()
         self._generation: int = 0
         self._loader_loaded = False
         self._controller_override_frozen: bool = False
@@ -83,6 +410,9 @@ class PluginOverrideManager:
         self._controller_active_nonce_ts: float = 0.0
         self._loaded_override_nonce: str = ""
         self._last_reload_ts: float = 0.0
+        self._last_reload_check_ts: float = float("-inf")
+        self._file_fingerprint: Tuple[int, int] = (0, 0)
+        self._cached_raw: Any = None
         self._load_config()
 
     def apply_override_payload(self, payload: Optional[Mapping[str, Any]], nonce: str) -> None:
@@ -106,10 +436,14 @@ class PluginOverrideManager:
     def _canonical_plugin_name(name: Optional[str]) -> Optional[str]:
         if not isinstance(name, str):
             return None
+        if name in _CANONICAL_NAMES:
+            return _CANONICAL_NAMES[name]
         token = name.strip()
-        if not token:
-            return None
-        return token.casefold()
+        canonical = token.casefold() if token else None
+        if len(_CANONICAL_NAMES) >= _CANONICAL_NAME_CACHE_LIMIT:
+            _CANONICAL_NAMES.clear()
+        _CANONICAL_NAMES[name] = canonical
+        return canonical
 
     def apply(self, payload: MutableMapping[str, Any]) -> None:
         """Apply overrides to the payload in-place when configured."""
@@ -118,8 +452,14 @@ class PluginOverrideManager:
             return
 
         self._reload_if_needed()
+        if not self._plugins:
+            return
 
-        plugin_name = self._determine_plugin_name(payload)
+        # Resolve the id and its casefolded form once for every lookup below.
+        message_id = str(payload.get("id") or "")
+        message_id_cf = message_id.casefold()
+
+        plugin_name = self._determine_plugin_name(payload, message_id_cf)
         if plugin_name is None:
             return
 
@@ -127,7 +467,6 @@ class PluginOverrideManager:
         if config is None:
             return
 
-        message_id = str(payload.get("id") or "")
         display_name = config.name
 
         if config.plugin_defaults:
@@ -145,7 +484,7 @@ class PluginOverrideManager:
             if trace_defaults:
                 self._log_trace(display_name, message_id, "after_defaults", payload)
 
-        group_defaults = self._group_defaults_for(config, message_id)
+        group_defaults = self._group_defaults_for(config, message_id, message_id_cf)
         if group_defaults is not None:
             label, defaults = group_defaults
             trace_group = self._should_trace(display_name, message_id)
@@ -165,7 +504,7 @@ class PluginOverrideManager:
         if not message_id:
             return
 
-        selected = self._select_override(config, message_id)
+        selected = self._select_override(config, message_id, message_id_cf)
         if selected is None:
             return
 
@@ -174,25 +513,33 @@ class PluginOverrideManager:
             return
 
         if payload.get("shape") == "vect":
+            # The span is only logged once per plugin/id family; skip the scan after that.
+            key = (config.canonical_name, message_id.partition("-")[0])
             points = payload.get("vector")
-            if isinstance(points, list):
-                xs = [float(pt.get("x", 0)) for pt in points if isinstance(pt, Mapping) and isinstance(pt.get("x"), (int, float))]
-                if xs:
-                    min_x = min(xs)
-                    max_x = max(xs)
+            if key not in self._diagnostic_spans and isinstance(points, list):
+                min_x = math.inf
+                max_x = -math.inf
+                for pt in points:
+                    if isinstance(pt, Mapping):
+                        x_val = pt.get("x")
+                        if isinstance(x_val, (int, float)):
+                            x_float = float(x_val)
+                            if x_float < min_x:
+                                min_x = x_float
+                            if x_float > max_x:
+                                max_x = x_float
+                if min_x <= max_x:
                     center_x = (min_x + max_x) / 2.0
-                    key = (config.canonical_name, message_id.split("-")[0])
-                    if key not in self._diagnostic_spans:
-                        self._logger.info(
-                            "override-diagnostic plugin=%s id=%s min_x=%.2f max_x=%.2f center=%.2f span=%.2f",
-                            display_name,
-                            message_id,
-                            min_x,
-                            max_x,
-                            center_x,
-                            max_x - min_x,
-                        )
-                        self._diagnostic_spans[key] = (min_x, max_x, center_x)
+                    self._logger.info(
+                        "override-diagnostic plugin=%s id=%s min_x=%.2f max_x=%.2f center=%.2f span=%.2f",
+                        display_name,
+                        message_id,
+                        min_x,
+                        max_x,
+                        center_x,
+                        max_x - min_x,
+                    )
+                    self._diagnostic_spans.add(key)
 
         trace_active = self._should_trace(display_name, message_id)
         if trace_active:
@@ -212,6 +559,13 @@ class PluginOverrideManager:
     # Internal helpers
 
     def _reload_if_needed(self) -> None:
+        # Overrides are consulted for every payload; only stat the config files
+        # once per interval. Controller pushes still apply immediately.
+        now = time.monotonic()
+        if self._groupings_loader is None or self._loader_loaded:
+            if now - self._last_reload_check_ts < _RELOAD_CHECK_INTERVAL:
+                return
+        self._last_reload_check_ts = now
         if self._groupings_loader is not None:
             try:
                 if not self._loader_loaded:
@@ -235,6 +589,7 @@ class PluginOverrideManager:
                 self._logger.info("Plugin override file %s no longer present; disabling overrides.", self._path)
             self._mtime = None
             self._plugins.clear()
+            self._prefix_trie = _PrefixTrieNode()
             return
 
         if self._mtime is not None and stat.st_mtime <= self._mtime:
@@ -244,17 +599,28 @@ class PluginOverrideManager:
 
     def _load_config(self) -> None:
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            stat = self._path.stat()
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            if fingerprint == self._file_fingerprint and self._cached_raw is not None:
+                # Unchanged file (e.g. a forced reload): reuse the last parse.
+                raw = self._cached_raw
+            else:
+                raw = json.loads(self._path.read_text(encoding="utf-8"))
+                self._file_fingerprint = fingerprint
+                self._cached_raw = raw
         except FileNotFoundError:
             self._plugins.clear()
+            self._prefix_trie = _PrefixTrieNode()
             self._mtime = None
+            self._file_fingerprint = (0, 0)
+            self._cached_raw = None
             self._logger.debug("Plugin override file %s not found; continuing without overrides.", self._path)
             return
         except json.JSONDecodeError as exc:
             self._logger.warning("Failed to parse plugin override file %s: %s", self._path, exc)
             return
 
-        self._load_config_data(raw, mtime=self._path.stat().st_mtime if self._path.exists() else None)
+        self._load_config_data(raw, mtime=stat.st_mtime)
 
     def _load_config_from_loader(self) -> None:
         try:
@@ -282,166 +648,29 @@ class PluginOverrideManager:
                 return
 
         plugins: Dict[str, _PluginConfig] = {}
+        interned_specs: Dict[str, JsonDict] = {}
         for plugin_name, plugin_payload in raw.items():
-            if not isinstance(plugin_name, str) or not isinstance(plugin_payload, Mapping):
+            if not isinstance(plugin_name, str) or not isinstance(plugin_payload, dict):
                 continue
             canonical_name = self._canonical_plugin_name(plugin_name)
             if canonical_name is None:
                 continue
 
             match_prefixes: List[str] = []
-
-            def _extend_match_prefixes(raw: Any) -> None:
-                if isinstance(raw, str):
-                    candidates = [raw]
-                elif isinstance(raw, Iterable):
-                    candidates = [entry for entry in raw if isinstance(entry, str)]
-                else:
-                    candidates = []
-                for value in candidates:
-                    token = value.strip()
-                    if not token:
-                        continue
-                    prefix = token.casefold()
-                    if prefix not in match_prefixes:
-                        match_prefixes.append(prefix)
-
-            _extend_match_prefixes(plugin_payload.get("matchingPrefixes"))
+            _extend_match_prefixes(match_prefixes, plugin_payload.get("matchingPrefixes"))
 
             if not match_prefixes:
                 match_section = plugin_payload.get("__match__")
-                if isinstance(match_section, Mapping):
-                    _extend_match_prefixes(match_section.get("id_prefixes"))
+                if isinstance(match_section, dict):
+                    _extend_match_prefixes(match_prefixes, match_section.get("id_prefixes"))
 
             grouping_specs: List[_GroupSpec] = []
             group_prefix_hints: List[str] = []
 
-            def _clean_group_prefixes(raw_value: Any) -> Tuple[PrefixEntry, ...]:
-                entries = parse_prefix_entries(raw_value)
-                return tuple(entries)
-
-            def _parse_anchor(source: Mapping[str, Any]) -> Optional[str]:
-                anchor_field = source.get("idPrefixGroupAnchor") or source.get("anchor")
-                if isinstance(anchor_field, str) and anchor_field.strip():
-                    return anchor_field.strip()
-                legacy_block = source.get("preserve_fill_aspect")
-                if isinstance(legacy_block, Mapping):
-                    legacy_anchor = legacy_block.get("anchor")
-                    if isinstance(legacy_anchor, str) and legacy_anchor.strip():
-                        return legacy_anchor.strip()
-                return None
-
-            def _parse_offset_value(value: Any) -> Optional[float]:
-                if isinstance(value, (int, float)):
-                    numeric = float(value)
-                    if math.isfinite(numeric):
-                        return numeric
-                return None
-
-            def _parse_offsets(source: Mapping[str, Any]) -> Tuple[float, float]:
-                dx = _parse_offset_value(source.get("offsetX") or source.get("offset_x"))
-                dy = _parse_offset_value(source.get("offsetY") or source.get("offset_y"))
-                return (dx if dx is not None else 0.0, dy if dy is not None else 0.0)
-
-            def _parse_payload_justification(source: Mapping[str, Any]) -> str:
-                raw_value = source.get("payloadJustification") or source.get("payload_justification")
-                if isinstance(raw_value, str):
-                    token = raw_value.strip().lower()
-                    if token in _PAYLOAD_JUSTIFICATION_CHOICES:
-                        return token
-                return _DEFAULT_PAYLOAD_JUSTIFICATION
-
-            def _parse_marker_label_position(source: Mapping[str, Any]) -> str:
-                raw_value = source.get("markerLabelPosition") or source.get("marker_label_position")
-                if isinstance(raw_value, str):
-                    token = raw_value.strip().lower()
-                    if token in _MARKER_LABEL_POSITION_CHOICES:
-                        return token
-                return _DEFAULT_MARKER_LABEL_POSITION
-
-            def _parse_controller_preview_box_mode(source: Mapping[str, Any]) -> str:
-                raw_value = source.get("controllerPreviewBoxMode") or source.get("controller_preview_box_mode")
-                if isinstance(raw_value, str):
-                    token = raw_value.strip().lower()
-                    if token in _CONTROLLER_PREVIEW_BOX_MODE_CHOICES:
-                        return token
-                return _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
-
-            def _parse_background_fields(
-                source: Mapping[str, Any],
-            ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
-                color: Optional[str] = None
-                border_color: Optional[str] = None
-                border: Optional[int] = None
-                if "backgroundColor" in source:
-                    raw_color = source.get("backgroundColor")
-                    if raw_color is None:
-                        color = None
-                    else:
-                        try:
-                            color = _normalise_background_color(raw_color)
-                        except PluginGroupingError:
-                            color = None
-                if "backgroundBorderColor" in source:
-                    raw_border_color = source.get("backgroundBorderColor")
-                    if raw_border_color is None:
-                        border_color = None
-                    else:
-                        try:
-                            border_color = _normalise_background_color(raw_border_color)
-                        except PluginGroupingError:
-                            border_color = None
-                if "backgroundBorderWidth" in source:
-                    raw_border = source.get("backgroundBorderWidth")
-                    if raw_border is None:
-                        border = None
-                    else:
-                        try:
-                            border = _normalise_border_width(raw_border, "backgroundBorderWidth")
-                        except PluginGroupingError:
-                            border = None
-                return color, border_color, border
-
-            def _append_group_spec(
-                label: Optional[str],
-                prefixes: Tuple[str, ...],
-                anchor: Optional[str],
-                offset_x: float,
-                offset_y: float,
-                payload_justification: str,
-                marker_label_position: str,
-                controller_preview_box_mode: str,
-                background_color: Optional[str],
-                background_border_color: Optional[str],
-                background_border_width: Optional[int],
-            ) -> None:
-                if not prefixes:
-                    return
-                grouping_specs.append(
-                    _GroupSpec(
-                        label=label,
-                        prefixes=prefixes,
-                        defaults=None,
-                        anchor=anchor,
-                        offset_x=offset_x,
-                        offset_y=offset_y,
-                        payload_justification=payload_justification,
-                        marker_label_position=marker_label_position,
-                        controller_preview_box_mode=controller_preview_box_mode,
-                        background_color=background_color,
-                        background_border_color=background_border_color,
-                        background_border_width=background_border_width,
-                    )
-                )
-                for entry in prefixes:
-                    value_cf = entry.value.casefold()
-                    if value_cf not in group_prefix_hints:
-                        group_prefix_hints.append(value_cf)
-
             id_prefix_groups = plugin_payload.get("idPrefixGroups")
-            if isinstance(id_prefix_groups, Mapping):
+            if isinstance(id_prefix_groups, dict):
                 for label, group_value in id_prefix_groups.items():
-                    if not isinstance(group_value, Mapping):
+                    if not isinstance(group_value, dict):
                         continue
                     cleaned_prefixes = _clean_group_prefixes(
                         group_value.get("idPrefixes") or group_value.get("id_prefixes")
@@ -456,6 +685,8 @@ class PluginOverrideManager:
                         group_value
                     )
                     _append_group_spec(
+                        grouping_specs,
+                        group_prefix_hints,
                         label_value,
                         cleaned_prefixes,
                         anchor_token,
@@ -470,11 +701,11 @@ class PluginOverrideManager:
                     )
 
             grouping_section = plugin_payload.get("grouping")
-            if isinstance(grouping_section, Mapping):
+            if isinstance(grouping_section, dict):
                 groups_spec = grouping_section.get("groups")
-                if isinstance(groups_spec, Mapping):
+                if isinstance(groups_spec, dict):
                     for label, group_value in groups_spec.items():
-                        if not isinstance(group_value, Mapping):
+                        if not isinstance(group_value, dict):
                             continue
                         cleaned_prefixes = _clean_group_prefixes(group_value.get("id_prefixes"))
                         if not cleaned_prefixes:
@@ -489,6 +720,8 @@ class PluginOverrideManager:
                             group_value
                         )
                         _append_group_spec(
+                            grouping_specs,
+                            group_prefix_hints,
                             label_value,
                             cleaned_prefixes,
                             anchor_token,
@@ -503,7 +736,7 @@ class PluginOverrideManager:
                         )
 
                 prefixes_spec = grouping_section.get("prefixes")
-                if isinstance(prefixes_spec, Mapping):
+                if isinstance(prefixes_spec, dict):
                     for label, prefix_value in prefixes_spec.items():
                         prefixes: Tuple[str, ...] = ()
                         anchor_token: Optional[str] = None
@@ -519,7 +752,7 @@ class PluginOverrideManager:
                             background_color, background_border_color, background_border_width = _parse_background_fields(
                                 {}
                             )
-                        elif isinstance(prefix_value, Mapping):
+                        elif isinstance(prefix_value, dict):
                             prefixes = _clean_group_prefixes(prefix_value.get("prefix"))
                             label_value = str(label).strip() if isinstance(label, str) and label else None
                             anchor_token = _parse_anchor(prefix_value)
@@ -538,6 +771,8 @@ class PluginOverrideManager:
                                 {}
                             )
                         _append_group_spec(
+                            grouping_specs,
+                            group_prefix_hints,
                             label_value,
                             prefixes,
                             anchor_token,
@@ -550,7 +785,7 @@ class PluginOverrideManager:
                             background_border_color,
                             background_border_width,
                         )
-                elif isinstance(prefixes_spec, Iterable):
+                elif isinstance(prefixes_spec, (list, tuple)):
                     for entry in prefixes_spec:
                         if isinstance(entry, str) and entry:
                             cleaned_entry = entry.casefold()
@@ -558,6 +793,8 @@ class PluginOverrideManager:
                                 {}
                             )
                             _append_group_spec(
+                                grouping_specs,
+                                group_prefix_hints,
                                 entry,
                                 (cleaned_entry,),
                                 None,
@@ -579,17 +816,9 @@ class PluginOverrideManager:
             overrides: List[Tuple[str, JsonDict]] = []
             plugin_defaults: JsonDict = {}
             for key, spec in plugin_payload.items():
-                if key == "notes":
+                if key in _RESERVED_PLUGIN_KEYS or key.startswith("__") or not isinstance(spec, dict):
                     continue
-                if key == "grouping":
-                    continue
-                if key == "idPrefixGroups":
-                    continue
-                if key == "matchingPrefixes":
-                    continue
-                if not isinstance(spec, Mapping) or key.startswith("__"):
-                    continue
-                overrides.append((str(key), dict(spec)))
+                overrides.append((str(key), _intern_override_spec(spec, interned_specs)))
 
             plugins[canonical_name] = _PluginConfig(
                 name=plugin_name,
@@ -601,6 +830,7 @@ class PluginOverrideManager:
             )
 
         self._plugins = plugins
+        self._prefix_trie = _build_prefix_trie(plugins)
         self._diagnostic_spans.clear()
         self._mtime = mtime if mtime is not None else (self._path.stat().st_mtime if self._path.exists() else None)
         if controller_nonce:
@@ -652,29 +882,25 @@ class PluginOverrideManager:
     def _config_for_payload_id(self, payload_id: str) -> Optional[_PluginConfig]:
         if not isinstance(payload_id, str) or not payload_id:
             return None
-        payload_cf = payload_id.casefold()
-        for config in self._plugins.values():
-            if not config.match_id_prefixes:
-                continue
-            if any(payload_cf.startswith(prefix) for prefix in config.match_id_prefixes):
-                return config
-        return None
+        return _match_prefix_trie(self._prefix_trie, payload_id.casefold())
 
     def grouping_label_for_id(self, payload_id: str) -> Optional[str]:
         """Return the first matching grouping label for a payload id, if any."""
 
+        if not self._plugins:
+            return None
         config = self._config_for_payload_id(payload_id)
         if config is None:
             return None
         payload_cf = payload_id.casefold()
-        for spec in config.group_specs:
-            for entry in spec.prefixes:
-                prefix = entry.value.casefold()
-                if payload_cf.startswith(prefix):
-                    return spec.label
+        if not payload_cf.startswith(config.group_prefix_tuple):
+            return None
+        for prefix, label in config.group_label_prefixes:
+            if payload_cf.startswith(prefix):
+                return label
         return None
 
-    def _determine_plugin_name(self, payload: Mapping[str, Any]) -> Optional[str]:
+    def _determine_plugin_name(self, payload: Mapping[str, Any], item_id_cf: Optional[str] = None) -> Optional[str]:
         for key in ("plugin", "plugin_name", "source_plugin"):
             value = payload.get(key)
             canonical = self._canonical_plugin_name(value)
@@ -695,35 +921,33 @@ class PluginOverrideManager:
                 if canonical:
                     return canonical
 
-        item_id = str(payload.get("id") or "")
-        if not item_id:
+        if item_id_cf is None:
+            item_id_cf = str(payload.get("id") or "").casefold()
+        if not item_id_cf:
             return None
 
-        item_id_cf = item_id.casefold()
-
-        for name, config in self._plugins.items():
-            if not config.match_id_prefixes:
-                continue
-            if any(item_id_cf.startswith(prefix) for prefix in config.match_id_prefixes):
-                return name
+        config = _match_prefix_trie(self._prefix_trie, item_id_cf)
+        return config.canonical_name if config is not None else None
 
-        return None
-
-    def _select_override(self, config: _PluginConfig, message_id: str) -> Optional[Tuple[str, JsonDict]]:
-        message_id_cf = message_id.casefold()
-        for pattern, spec in config.overrides:
-            if fnmatchcase(message_id, pattern):
-                return pattern, spec
-            if fnmatchcase(message_id_cf, pattern.casefold()):
-                return pattern, spec
-        return None
+    def _select_override(
+        self,
+        config: _PluginConfig,
+        message_id: str,
+        message_id_cf: Optional[str] = None,
+    ) -> Optional[Tuple[str, JsonDict]]:
+        return config.override_index.select(message_id, message_id_cf)
 
-    def _group_defaults_for(self, config: _PluginConfig, message_id: str) -> Optional[Tuple[str, JsonDict]]:
+    def _group_defaults_for(
+        self,
+        config: _PluginConfig,
+        message_id: str,
+        message_id_cf: Optional[str] = None,
+    ) -> Optional[Tuple[str, JsonDict]]:
         if not config.group_specs:
             return None
         if not message_id:
             return None
-        spec = self._select_group_spec(config, message_id)
+        spec = self._select_group_spec(config, message_id, message_id_cf)
         if spec is None:
             return None
         label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else "")
@@ -733,34 +957,42 @@ class PluginOverrideManager:
 
     @staticmethod
     def _match_prefix_score(prefixes: Sequence[PrefixEntry], payload_cf: str) -> Optional[Tuple[int, int]]:
-        best: Optional[Tuple[int, int]] = None
+        """Score the best entry; ``prefixes`` must be in ``_GroupSpec.scored_prefixes`` order."""
+
         for entry in prefixes:
             if entry.match_mode == "exact":
-                if payload_cf != entry.value_cf:
-                    continue
-                score = (2, len(entry.value))
-            else:
-                if not payload_cf.startswith(entry.value_cf):
-                    continue
-                score = (1, len(entry.value))
-            if best is None or score > best:
-                best = score
-        return best
+                if payload_cf == entry.value_cf:
+                    return (2, len(entry.value))
+            elif payload_cf.startswith(entry.value_cf):
+                return (1, len(entry.value))
+        return None
 
-    def _select_group_spec(self, config: _PluginConfig, payload_id: str) -> Optional[_GroupSpec]:
+    def _select_group_spec(
+        self,
+        config: _PluginConfig,
+        payload_id: str,
+        payload_cf: Optional[str] = None,
+    ) -> Optional[_GroupSpec]:
         if not config.group_specs or not payload_id:
             return None
-        payload_cf = payload_id.casefold()
+        if payload_cf is None:
+            payload_cf = payload_id.casefold()
+        cache = config.group_spec_cache
+        if payload_cf in cache:
+            return cache[payload_cf]
         best: Optional[Tuple[int, int, int]] = None
         selected: Optional[_GroupSpec] = None
         for order, spec in enumerate(config.group_specs):
-            score = self._match_prefix_score(spec.prefixes, payload_cf)
+            score = self._match_prefix_score(spec.scored_prefixes, payload_cf)
             if score is None:
                 continue
             candidate = (score[0], score[1], -order)
             if best is None or candidate > best:
                 best = candidate
                 selected = spec
+        if len(cache) >= _GROUP_SPEC_CACHE_LIMIT:
+            cache.clear()
+        cache[payload_cf] = selected
         return selected
 
     def grouping_key_for(self, plugin: Optional[str], payload_id: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
@@ -791,128 +1023,77 @@ class PluginOverrideManager:
         label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
         return plugin_label, label_value
 
-    def group_is_configured(self, plugin: Optional[str], suffix: Optional[str]) -> bool:
+    def _group_spec_for_label(self, plugin: Optional[str], suffix: Optional[str]) -> Optional[_GroupSpec]:
         self._reload_if_needed()
+        if suffix is None:
+            return None
         canonical = self._canonical_plugin_name(plugin)
         if canonical is None:
-            return False
+            return None
         config = self._plugins.get(canonical)
-        if config is None or not config.group_specs:
-            return False
-        if suffix is None:
-            return False
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                return True
-        return False
+        if config is None:
+            return None
+        return config.spec_by_label.get(suffix)
+
+    def group_is_configured(self, plugin: Optional[str], suffix: Optional[str]) -> bool:
+        return self._group_spec_for_label(plugin, suffix) is not None
 
     def group_offsets(self, plugin: Optional[str], suffix: Optional[str]) -> Tuple[float, float]:
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        if canonical is None:
-            return 0.0, 0.0
-        config = self._plugins.get(canonical)
-        if config is None or not config.group_specs or suffix is None:
+        spec = self._group_spec_for_label(plugin, suffix)
+        if spec is None:
             return 0.0, 0.0
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                return spec.offset_x, spec.offset_y
-        return 0.0, 0.0
+        return spec.offset_x, spec.offset_y
 
     def group_background(
         self, plugin: Optional[str], suffix: Optional[str]
     ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        if canonical is None or suffix is None:
-            return None, None, None
-        config = self._plugins.get(canonical)
-        if config is None or not config.group_specs:
+        spec = self._group_spec_for_label(plugin, suffix)
+        if spec is None:
             return None, None, None
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                border = spec.background_border_width
-                if isinstance(border, bool):
-                    border = int(bool(border))
-                if isinstance(border, (int, float)):
-                    try:
-                        border_int = int(border)
-                    except Exception:
-                        border_int = None
-                else:
-                    border_int = None
-                return spec.background_color, spec.background_border_color, border_int
-        return None, None, None
+        border = spec.background_border_width
+        if isinstance(border, bool):
+            border = int(bool(border))
+        if isinstance(border, (int, float)):
+            try:
+                border_int = int(border)
+            except Exception:
+                border_int = None
+        else:
+            border_int = None
+        return spec.background_color, spec.background_border_color, border_int
 
     def group_payload_justification(self, plugin: Optional[str], suffix: Optional[str]) -> str:
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        if canonical is None:
+        spec = self._group_spec_for_label(plugin, suffix)
+        if spec is None:
             return _DEFAULT_PAYLOAD_JUSTIFICATION
-        config = self._plugins.get(canonical)
-        if config is None or not config.group_specs or suffix is None:
+        token = spec.payload_justification or _DEFAULT_PAYLOAD_JUSTIFICATION
+        if token not in _PAYLOAD_JUSTIFICATION_CHOICES:
             return _DEFAULT_PAYLOAD_JUSTIFICATION
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                token = spec.payload_justification or _DEFAULT_PAYLOAD_JUSTIFICATION
-                if token not in _PAYLOAD_JUSTIFICATION_CHOICES:
-                    return _DEFAULT_PAYLOAD_JUSTIFICATION
-                return token
-        return _DEFAULT_PAYLOAD_JUSTIFICATION
+        return token
 
     def group_marker_label_position(self, plugin: Optional[str], suffix: Optional[str]) -> str:
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        if canonical is None:
+        spec = self._group_spec_for_label(plugin, suffix)
+        if spec is None:
             return _DEFAULT_MARKER_LABEL_POSITION
-        config = self._plugins.get(canonical)
-        if config is None or not config.group_specs or suffix is None:
+        token = spec.marker_label_position or _DEFAULT_MARKER_LABEL_POSITION
+        if token not in _MARKER_LABEL_POSITION_CHOICES:
             return _DEFAULT_MARKER_LABEL_POSITION
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                token = spec.marker_label_position or _DEFAULT_MARKER_LABEL_POSITION
-                if token not in _MARKER_LABEL_POSITION_CHOICES:
-                    return _DEFAULT_MARKER_LABEL_POSITION
-                return token
-        return _DEFAULT_MARKER_LABEL_POSITION
+        return token
 
     def group_controller_preview_box_mode(self, plugin: Optional[str], suffix: Optional[str]) -> str:
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        if canonical is None:
+        spec = self._group_spec_for_label(plugin, suffix)
+        if spec is None:
             return _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
-        config = self._plugins.get(canonical)
-        if config is None or not config.group_specs or suffix is None:
+        token = spec.controller_preview_box_mode or _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
+        if token not in _CONTROLLER_PREVIEW_BOX_MODE_CHOICES:
             return _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
-        for spec in config.group_specs:
-            label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-            if label_value == suffix:
-                token = spec.controller_preview_box_mode or _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
-                if token not in _CONTROLLER_PREVIEW_BOX_MODE_CHOICES:
-                    return _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
-                return token
-        return _DEFAULT_CONTROLLER_PREVIEW_BOX_MODE
+        return token
 
     def group_preserve_fill_aspect(self, plugin: Optional[str], suffix: Optional[str]) -> Tuple[bool, str]:
         """Fill-mode preservation is always enabled; anchor selection is derived from overrides."""
 
-        self._reload_if_needed()
-        canonical = self._canonical_plugin_name(plugin)
-        anchor_token: Optional[str] = None
-        if canonical is not None:
-            config = self._plugins.get(canonical)
-            if config is not None and suffix is not None:
-                for spec in config.group_specs:
-                    label_value = spec.label or (spec.prefixes[0].value if spec.prefixes else None)
-                    if label_value == suffix:
-                        anchor_token = spec.anchor
-                        break
-        return True, self._normalise_anchor_token(anchor_token)
+        spec = self._group_spec_for_label(plugin, suffix)
+        return True, self._normalise_anchor_token(spec.anchor if spec is not None else None)
 
     @staticmethod
     def _normalise_anchor_token(anchor: Optional[str]) -> str:
@@ -936,13 +1117,15 @@ class PluginOverrideManager:
         if cfg.trace_payload_ids:
             if not message_id:
                 return False
-            return any(message_id.startswith(prefix) for prefix in cfg.trace_payload_ids)
+            return message_id.startswith(cfg.trace_payload_ids)
         return True
 
     def _log_trace(self, plugin: str, message_id: str, stage: str, payload: Mapping[str, Any]) -> None:
         cfg = self._debug_config
         if not cfg.trace_enabled:
             return
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         trace_id = payload.get("__mo_trace_id")
         trace_id_token = trace_id if isinstance(trace_id, str) else ""
         shape = str(payload.get("shape") or "").lower()
@@ -23,6 +23,7 @@ from overlay_client.paint_commands import (
     _VectorPaintCommand,
 )
 from overlay_client.payload_builders import build_group_context
+from overlay_client.payload_transform import _normalise_newlines
 from overlay_client.render_pipeline import PayloadSnapshot, RenderContext, RenderSettings
 from overlay_client.viewport_transform import (
     LegacyMapper,
@@ -216,7 +217,7 @@ class RenderSurfaceMixin:
         if cfg.trace_payload_ids:
             if not message_id:
                 return False
-            if not any(message_id.startswith(prefix) for prefix in cfg.trace_payload_ids):
+            if not message_id.startswith(cfg.trace_payload_ids):
                 return False
         return True
 
@@ -364,7 +365,7 @@ class RenderSurfaceMixin:
             self._request_repaint("ingest", immediate=self._should_bypass_debounce(payload))
 
     def _purge_legacy(self) -> None:
-        now = time.monotonic()
+        now = time.monotonic_ns()
         previous_count = len(self._payload_model)
         if self._payload_model.purge_expired(now):
             if self._cycle_payload_enabled:
@@ -402,7 +403,7 @@ class RenderSurfaceMixin:
             ),
             grouping=self._grouping_adapter,
         )
-        snapshot = PayloadSnapshot(items_count=len(list(self._payload_model.store.items())))
+        snapshot = PayloadSnapshot(items_count=len(self._payload_model.store))
         self._render_pipeline.paint(painter, context, snapshot)
         payload_results = getattr(self._render_pipeline, "_last_payload_results", None)
         if payload_results:
@@ -610,6 +611,9 @@ class RenderSurfaceMixin:
             translated_bounds_by_group,
             translations,
         )
+        painter_state = getattr(self, "_painter_state", None)
+        if painter_state is not None:
+            painter_state.reset()
         vertex_points: List[Tuple[int, int]] = []
         for command in commands:
             key_tuple = command.group_key.as_tuple()
@@ -763,6 +767,8 @@ class RenderSurfaceMixin:
         overlay_bounds_by_group: Dict[Tuple[str, Optional[str]], _OverlayBounds] = {}
         effective_anchor_by_group: Dict[Tuple[str, Optional[str]], Tuple[float, float]] = {}
         transform_by_group: Dict[Tuple[str, Optional[str]], Optional[GroupTransform]] = {}
+        # Cycle anchors only feed the payload-cycling overlay; skip computing them when cycling is off.
+        cycle_enabled = self._cycle_payload_enabled
         for item_id, legacy_item in self._payload_model.store.items():
             group_key = self._group_coordinator.resolve_group_key(
                 item_id,
@@ -787,6 +793,7 @@ class RenderSurfaceMixin:
                     group_transform,
                     overlay_hint,
                     collect_only=collect_only,
+                    cycle_enabled=cycle_enabled,
                 )
             elif legacy_item.kind == "rect":
                 command = self._build_rect_command(
@@ -796,6 +803,7 @@ class RenderSurfaceMixin:
                     group_transform,
                     overlay_hint,
                     collect_only=collect_only,
+                    cycle_enabled=cycle_enabled,
                 )
             elif legacy_item.kind == "vector":
                 command = self._build_vector_command(
@@ -805,6 +813,7 @@ class RenderSurfaceMixin:
                     group_transform,
                     overlay_hint,
                     collect_only=collect_only,
+                    cycle_enabled=cycle_enabled,
                 )
             else:
                 command = None
@@ -1120,10 +1129,8 @@ class RenderSurfaceMixin:
             stats["calls"] = stats.get("calls", 0) + 1
         cache = getattr(self, "_text_cache", None)
         family = font_family or self._font_family
-        normalised = str(text)
-        has_newline = "\n" in normalised or "\r" in normalised
-        if has_newline:
-            normalised = normalised.replace("\r\n", "\n").replace("\r", "\n")
+        normalised = _normalise_newlines(str(text))
+        has_newline = "\n" in normalised
         try:
             ensure_context = getattr(self, "_ensure_text_cache_context", None)
             if callable(ensure_context):
@@ -1203,6 +1210,7 @@ class RenderSurfaceMixin:
         group_transform: Optional[GroupTransform],
         overlay_bounds_hint: Optional[_OverlayBounds],
         collect_only: bool = False,
+        cycle_enabled: bool = True,
     ) -> Optional[_MessagePaintCommand]:
         item = legacy_item.data
         item_id = legacy_item.item_id
@@ -1290,10 +1298,11 @@ class RenderSurfaceMixin:
         x = int(round(fill.screen_x(adjusted_left)))
         payload_point_y = int(round(fill.screen_y(adjusted_top)))
         baseline = int(round(payload_point_y + ascent))
-        center_x = x + text_width // 2
         top = baseline - ascent
         bottom = baseline + descent
-        center_y = int(round((top + bottom) / 2.0))
+        cycle_anchor: Optional[Tuple[int, int]] = None
+        if cycle_enabled:
+            cycle_anchor = (x + text_width // 2, int(round((top + bottom) / 2.0)))
         bounds = (x, top, x + text_width, bottom)
         overlay_bounds: Optional[Tuple[float, float, float, float]] = None
         base_overlay_bounds: Optional[Tuple[float, float, float, float]] = None
@@ -1355,7 +1364,7 @@ class RenderSurfaceMixin:
             ascent=ascent,
             descent=descent,
             line_spacing=line_spacing,
-            cycle_anchor=(center_x, center_y),
+            cycle_anchor=cycle_anchor,
             trace_fn=trace_fn,
             base_overlay_bounds=base_overlay_bounds,
             debug_vertices=[(x, payload_point_y)],
@@ -1372,6 +1381,7 @@ class RenderSurfaceMixin:
         group_transform: Optional[GroupTransform],
         overlay_bounds_hint: Optional[_OverlayBounds],
         collect_only: bool = False,
+        cycle_enabled: bool = True,
     ) -> Optional[_RectPaintCommand]:
         item = legacy_item.data
         item_id = legacy_item.item_id
@@ -1460,8 +1470,9 @@ class RenderSurfaceMixin:
         y = int(round(fill.screen_y(min_y_overlay)))
         w = max(1, int(round(max(0.0, max_x_overlay - min_x_overlay) * scale)))
         h = max(1, int(round(max(0.0, max_y_overlay - min_y_overlay) * scale)))
-        center_x = x + w // 2
-        center_y = y + h // 2
+        cycle_anchor: Optional[Tuple[int, int]] = None
+        if cycle_enabled:
+            cycle_anchor = (x + w // 2, y + h // 2)
         bounds = (x, y, x + w, y + h)
         overlay_bounds = (min_x_overlay, min_y_overlay, max_x_overlay, max_y_overlay)
         base_overlay_bounds: Optional[Tuple[float, float, float, float]] = None
@@ -1487,7 +1498,7 @@ class RenderSurfaceMixin:
             y=y,
             width=w,
             height=h,
-            cycle_anchor=(center_x, center_y),
+            cycle_anchor=cycle_anchor,
             base_overlay_bounds=base_overlay_bounds,
             reference_overlay_bounds=reference_overlay_bounds,
             debug_vertices=[
@@ -1527,6 +1538,7 @@ class RenderSurfaceMixin:
         group_transform: Optional[GroupTransform],
         overlay_bounds_hint: Optional[_OverlayBounds],
         collect_only: bool = False,
+        cycle_enabled: bool = True,
     ) -> Optional[_VectorPaintCommand]:
         item_id = legacy_item.item_id
         item = legacy_item.data
@@ -1586,19 +1598,17 @@ class RenderSurfaceMixin:
         )
         if vector_payload is None:
             return None
-        bounds: Optional[Tuple[int, int, int, int]]
-        cycle_anchor: Optional[Tuple[int, int]]
+        bounds: Optional[Tuple[int, int, int, int]] = None
+        cycle_anchor: Optional[Tuple[int, int]] = None
         if screen_points:
             xs = [pt[0] for pt in screen_points]
             ys = [pt[1] for pt in screen_points]
             bounds = (min(xs), min(ys), max(xs), max(ys))
-            cycle_anchor = (
-                int(round((min(xs) + max(xs)) / 2.0)),
-                int(round((min(ys) + max(ys)) / 2.0)),
-            )
-        else:
-            bounds = None
-            cycle_anchor = None
+            if cycle_enabled:
+                cycle_anchor = (
+                    int(round((bounds[0] + bounds[2]) / 2.0)),
+                    int(round((bounds[1] + bounds[3]) / 2.0)),
+                )
         command = _VectorPaintCommand(
             group_key=group_key,
             group_transform=group_transform,
@@ -2532,11 +2542,19 @@ class RenderSurfaceMixin:
         return
 
     def _payload_opacity_percent(self) -> int:
-        return coerce_percent(getattr(self, "_payload_opacity", 100), 100)
+        value = getattr(self, "_payload_opacity", 100)
+        # set_payload_opacity and setup already store a clamped int; paint reads this per command.
+        if isinstance(value, int) and 0 <= value <= 100:
+            return value
+        return coerce_percent(value, 100)
 
     def _apply_payload_opacity_color(self, color: QColor) -> QColor:
         return apply_global_payload_opacity(color, self._payload_opacity_percent())
 
     def _line_width(self, key: str) -> int:
+        # The loader already coerces and clamps config values, so a plain int is final.
+        width = self._line_widths.get(key)
+        if isinstance(width, int) and width >= 0:
+            return width
         defaults = getattr(self, "_line_width_defaults", _LINE_WIDTH_DEFAULTS_FALLBACK)
         return util_line_width(self._line_widths, defaults, key)
@@ -26,6 +26,7 @@ from overlay_client.grouping_helper import FillGroupingHelper
 from overlay_client.platform_context import _initial_platform_context
 from overlay_client.platform_integration import PlatformController
 from overlay_client.plugin_overrides import PluginOverrideManager
+from overlay_client.paint_commands import _PainterState
 from overlay_client.render_pipeline import LegacyRenderPipeline
 from overlay_client.render_surface import _GroupDebugState, _OverlayBounds
 from overlay_client.status_presenter import StatusPresenter
@@ -34,6 +35,7 @@ from overlay_client.interaction_controller import InteractionController
 from overlay_client.window_controller import WindowController
 from overlay_client.window_tracking import WindowState, WindowTracker
 from overlay_client.viewport_helper import BASE_HEIGHT, BASE_WIDTH
+from overlay_client.viewport_transform import LegacyMapper, ViewportState
 from overlay_plugin.groupings_loader import GroupingsLoader
 
 _CLIENT_LOGGER = logging.getLogger("EDMC.ModernOverlay.Client")
@@ -185,7 +187,13 @@ class SetupSurfaceMixin:
         self._cycle_anchor_points: Dict[str, Tuple[int, int]] = {}
         self._cycle_copy_clipboard: bool = bool(getattr(initial, "copy_payload_id_on_cycle", False))
         self._last_font_notice: Optional[Tuple[float, float]] = None
+        self._font_refresh_pending: bool = False
         self._scale_mode: str = "fit"
+        self._legacy_mapper_cache: Optional[Tuple[Tuple[float, float, str], LegacyMapper]] = None
+        self._viewport_state_cache: Optional[Tuple[Tuple[float, float, float], ViewportState]] = None
+        self._cached_dpr: Optional[float] = None
+        self._dpr_window_connected: bool = False
+        self._dpr_screen: Any = None
         self._line_widths: Dict[str, int] = load_line_width_config()
         self._line_width_defaults: Dict[str, int] = line_width_defaults
         self._payload_nudge_enabled: bool = False
@@ -221,7 +229,8 @@ class SetupSurfaceMixin:
         self._paint_log_timer.timeout.connect(self._emit_paint_stats)
         if self._repaint_debounce_log:
             self._paint_log_timer.start()
-        self._paint_stats = {"paint_count": 0}
+        self._paint_count: int = 0
+        self._painter_state = _PainterState()
         self._paint_log_state = {"last_ingest": 0, "last_purge": 0, "last_total": 0}
         self._measure_stats = {"calls": 0}
         self._text_cache: Dict[Tuple[str, float, str], Tuple[int, int, int]] = {}
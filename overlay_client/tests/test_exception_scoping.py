@@ -27,7 +27,10 @@ def test_current_physical_size_defaults_ratio_and_logs(monkeypatch):
         (),
         {
             "frameGeometry": lambda self: _StubFrame(100, 50),
-            "windowHandle": lambda self: type("WH", (), {"devicePixelRatio": lambda self: (_ for _ in ()).throw(RuntimeError("fail"))})(),
+            "devicePixelRatioF": lambda self: (_ for _ in ()).throw(RuntimeError("fail")),
+            "_cached_dpr": None,
+            "_dpr_window_connected": False,
+            "_device_pixel_ratio": OverlayWindow._device_pixel_ratio,
             "_current_physical_size": OverlayWindow._current_physical_size,
         },
     )()
@@ -52,6 +55,10 @@ def test_viewport_state_defaults_ratio_and_logs(monkeypatch):
             "width": lambda self: 200,
             "height": lambda self: 100,
             "devicePixelRatioF": lambda self: (_ for _ in ()).throw(AttributeError("no dpr")),
+            "_cached_dpr": None,
+            "_dpr_window_connected": False,
+            "_device_pixel_ratio": OverlayWindow._device_pixel_ratio,
+            "_viewport_state_cache": None,
             "_viewport_state": OverlayWindow._viewport_state,
         },
     )()
@@ -195,3 +202,29 @@ def test_update_auto_legacy_scale_logs_ratio_failure(monkeypatch):
     window._update_auto_legacy_scale(100, 50)  # type: ignore[attr-defined]
 
     assert any("devicePixelRatioF unavailable" in msg for msg in logs)
+
+
+def test_viewport_state_reuses_cached_state_until_geometry_changes():
+    size = {"w": 200, "h": 100}
+    window = type(
+        "Stub",
+        (),
+        {
+            "width": lambda self: size["w"],
+            "height": lambda self: size["h"],
+            "devicePixelRatioF": lambda self: 1.0,
+            "_cached_dpr": None,
+            "_dpr_window_connected": False,
+            "_device_pixel_ratio": OverlayWindow._device_pixel_ratio,
+            "_viewport_state_cache": None,
+            "_viewport_state": OverlayWindow._viewport_state,
+        },
+    )()
+
+    first = window._viewport_state()  # type: ignore[attr-defined]
+    assert window._viewport_state() is first  # type: ignore[attr-defined]
+
+    size["w"] = 400
+    resized = window._viewport_state()  # type: ignore[attr-defined]
+    assert resized is not first
+    assert resized.width == 400.0
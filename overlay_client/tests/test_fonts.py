@@ -69,3 +69,28 @@ def test_resolve_emoji_font_families_reads_marker(tmp_fonts_dir, monkeypatch):
 
     assert ("EmojiFamily" in fallbacks)
     assert str(bundled_font) in added
+
+
+def test_apply_font_fallbacks_dedupes_and_memoises_family_chain():
+    from overlay_client import font_utils
+
+    class StubFont:
+        def __init__(self, family: str) -> None:
+            self._family = family
+            self.families = None
+
+        def family(self) -> str:
+            return self._family
+
+        def setFamilies(self, families) -> None:  # noqa: N802 - Qt naming
+            self.families = families
+
+    font_utils._composite_families.cache_clear()
+    first = StubFont("Base")
+    font_utils.apply_font_fallbacks(first, ("Emoji", "base", " ", "emoji", "Symbols"))
+    second = StubFont("Base")
+    font_utils.apply_font_fallbacks(second, ("Emoji", "base", " ", "emoji", "Symbols"))
+
+    assert first.families == ["Base", "Emoji", "Symbols"]
+    assert second.families == first.families
+    assert font_utils._composite_families.cache_info().hits == 1
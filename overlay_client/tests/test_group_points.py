@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import math
+
+from overlay_client.group_transform import GroupTransform
+from overlay_client.overlay_client import OverlayWindow
+from overlay_client.payload_transform import PayloadAxisContext, PayloadTransformContext
+
+
+def _context(overflow: bool = True) -> PayloadTransformContext:
+    return PayloadTransformContext(
+        axis_x=PayloadAxisContext(overflow=overflow, min_bound=0.0, max_bound=1280.0),
+        axis_y=PayloadAxisContext(overflow=overflow, min_bound=0.0, max_bound=960.0),
+    )
+
+
+def test_group_anchor_point_applies_offsets():
+    transform = GroupTransform(dx=5.0, dy=-2.0, band_anchor_x=0.5, band_anchor_y=0.25)
+    point = OverlayWindow._group_anchor_point(transform, _context())
+    assert point == (640.0 + 5.0, 240.0 - 2.0)
+
+
+def test_group_anchor_point_rejects_non_finite_coordinates():
+    transform = GroupTransform(band_anchor_x=math.nan, band_anchor_y=0.25)
+    assert OverlayWindow._group_anchor_point(transform, _context()) is None
+
+
+def test_group_base_point_rejects_non_finite_coordinates():
+    transform = GroupTransform(bounds_min_x=10.0, bounds_min_y=math.inf)
+    assert OverlayWindow._group_base_point(transform, _context()) is None
+    transform = GroupTransform(bounds_min_x=10.0, bounds_min_y=20.0, dx=1.0, dy=2.0)
+    assert OverlayWindow._group_base_point(transform, _context()) == (11.0, 22.0)
+
+
+def test_group_offsets_fast_path_and_coercion():
+    assert OverlayWindow._group_offsets(None) == (0.0, 0.0)
+    assert OverlayWindow._group_offsets(GroupTransform(dx=3.5, dy=-1.0)) == (3.5, -1.0)
+    legacy = GroupTransform(dx=4, dy=None)  # type: ignore[arg-type]
+    assert OverlayWindow._group_offsets(legacy) == (4.0, 0.0)
+    broken = GroupTransform(dx="bad", dy="2")  # type: ignore[arg-type]
+    assert OverlayWindow._group_offsets(broken) == (0.0, 2.0)
+
+
+def test_group_points_clamp_only_non_overflowing_axes():
+    transform = GroupTransform(band_anchor_x=1.5, band_anchor_y=-0.5, bounds_min_x=-10.0, bounds_min_y=2000.0)
+    assert OverlayWindow._group_anchor_point(transform, _context(overflow=False)) == (1280.0, 0.0)
+    assert OverlayWindow._group_anchor_point(transform, _context(overflow=True)) == (1920.0, -480.0)
+    assert OverlayWindow._group_base_point(transform, _context(overflow=False)) == (0.0, 960.0)
+    assert OverlayWindow._group_base_point(transform, _context(overflow=True)) == (-10.0, 2000.0)
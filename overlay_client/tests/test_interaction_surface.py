@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Optional, Tuple
 
 import pytest
@@ -169,7 +170,8 @@ def test_drag_events_toggle_state_and_offsets(qt_app):
 
 
 @pytest.mark.pyqt_required
-def test_move_event_records_override_for_geometry_delta(qt_app):
+def test_move_event_records_override_for_geometry_delta(qt_app, caplog):
+    caplog.set_level(logging.DEBUG, logger="EDMC.ModernOverlay.Client")
     window = _InteractionStubWindow()
     window._follow_enabled = True
     window._last_set_geometry = (0, 0, 20, 20)
@@ -182,3 +184,19 @@ def test_move_event_records_override_for_geometry_delta(qt_app):
     assert window._override_calls == [((10, 10, 20, 20), None, "moveEvent delta", "wm_intervention")]
     assert window._last_move_log == (10, 10)
     assert window._describe_calls == [None]
+
+
+@pytest.mark.pyqt_required
+def test_move_event_skips_debug_details_when_debug_disabled(qt_app, caplog):
+    caplog.set_level(logging.INFO, logger="EDMC.ModernOverlay.Client")
+    window = _InteractionStubWindow()
+    window._follow_enabled = True
+    window._last_set_geometry = (0, 0, 20, 20)
+    window.setGeometry(10, 10, 20, 20)
+    window._last_move_log = None
+
+    window.moveEvent(QMoveEvent(QPoint(10, 10), QPoint(0, 0)))
+
+    assert window._override_calls == [((10, 10, 20, 20), None, "moveEvent delta", "wm_intervention")]
+    assert window._last_move_log == (10, 10)
+    assert window._describe_calls == []
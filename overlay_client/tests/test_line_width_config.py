@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import overlay_client.overlay_client as overlay_module
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(overlay_module, "CLIENT_DIR", tmp_path)
+    monkeypatch.setattr(overlay_module, "_LINE_WIDTHS_CACHE", None)
+    return tmp_path
+
+
+def _write_config(path, payload, mtime_ns):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cached_line_width_config_reuses_parse_until_mtime_changes(config_dir, monkeypatch):
+    config_path = config_dir / "render_config.json"
+    _write_config(config_path, {"grid": 3}, 1_000_000_000)
+
+    calls = []
+    original = overlay_module._load_line_width_config
+
+    def _counting_loader():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(overlay_module, "_load_line_width_config", _counting_loader)
+
+    first = overlay_module._cached_line_width_config()
+    first["grid"] = 99  # callers get their own copy
+    second = overlay_module._cached_line_width_config()
+    assert second["grid"] == 3
+    assert len(calls) == 1
+
+    _write_config(config_path, {"grid": 5}, 2_000_000_000)
+    third = overlay_module._cached_line_width_config()
+    assert third["grid"] == 5
+    assert len(calls) == 2
+
+
+def test_cached_line_width_config_defaults_when_missing(config_dir):
+    config = overlay_module._cached_line_width_config()
+    assert config == overlay_module._LINE_WIDTH_DEFAULTS
+
+
+def test_load_line_width_config_falls_back_on_invalid_json(config_dir, monkeypatch):
+    monkeypatch.setattr(overlay_module, "_orjson", None)
+    (config_dir / "render_config.json").write_text("{not json", encoding="utf-8")
+    assert overlay_module._load_line_width_config() == overlay_module._LINE_WIDTH_DEFAULTS
+
+
+def test_load_line_width_config_uses_orjson_when_available(config_dir, monkeypatch):
+    seen = []
+
+    class _StubOrjson:
+        @staticmethod
+        def loads(raw):
+            seen.append(raw)
+            return json.loads(raw)
+
+    monkeypatch.setattr(overlay_module, "_orjson", _StubOrjson)
+    (config_dir / "render_config.json").write_text(json.dumps({"vector_line": 4}), encoding="utf-8")
+    config = overlay_module._load_line_width_config()
+    assert config["vector_line"] == 4
+    assert seen and isinstance(seen[0], bytes)
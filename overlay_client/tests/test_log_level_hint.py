@@ -105,3 +105,9 @@ def test_diagnostics_enabled_in_dev_mode(monkeypatch):
     monkeypatch.setattr(launcher, "DEBUG_CONFIG_ENABLED", True, raising=False)
     settings = SimpleNamespace(edmc_log_level=None)
     assert launcher._diagnostics_enabled(settings) is True
+
+
+def test_apply_log_level_hint_removes_release_filter(client_module):
+    client_module._CLIENT_LOGGER.addFilter(client_module._RELEASE_FILTER)
+    client_module.apply_log_level_hint(logging.INFO, source="test")
+    assert client_module._RELEASE_FILTER not in client_module._CLIENT_LOGGER.filters
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +12,7 @@ OVERLAY_ROOT = Path(__file__).resolve().parents[1]
 if str(OVERLAY_ROOT) not in sys.path:
     sys.path.append(str(OVERLAY_ROOT))
 
+from overlay_client.debug_config import DebugConfig  # noqa: E402
 from overlay_client.plugin_overrides import PluginOverrideManager  # noqa: E402
 
 
@@ -367,3 +369,312 @@ def test_legacy_preserve_anchor_mapping(override_file: Path) -> None:
     )
     manager = _make_manager(override_file)
     assert manager.group_preserve_fill_aspect("Legacy", "payload") == (True, "center")
+
+
+def test_payload_id_prefix_lookup_prefers_first_registered_plugin(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "Broad": {"matchingPrefixes": ["shared-"]},
+                "Narrow": {"matchingPrefixes": ["shared-narrow-", "Other-"]},
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+
+    assert manager.infer_plugin_name({"id": "shared-narrow-1"}) == "Broad"
+    assert manager.infer_plugin_name({"id": "OTHER-thing"}) == "Narrow"
+    assert manager.infer_plugin_name({"id": "shar"}) is None
+    assert manager.grouping_key_for(None, "other-thing") is None
+    assert manager._config_for_payload_id("shared-x").name == "Broad"
+
+
+def test_override_index_matches_ordered_fnmatch_scan() -> None:
+    from fnmatch import fnmatchcase
+
+    from overlay_client.plugin_overrides import _OverrideIndex
+
+    overrides = [
+        ("exact-id", {"n": 0}),
+        ("Alert-*", {"n": 1}),
+        ("alert-red", {"n": 2}),
+        ("tile-?", {"n": 3}),
+        ("Mixed-Case", {"n": 4}),
+        ("grid-[ab]*", {"n": 5}),
+        ("*", {"n": 6}),
+    ]
+
+    def scan(entries, message_id: str):
+        for pattern, spec in entries:
+            if fnmatchcase(message_id, pattern) or fnmatchcase(message_id.casefold(), pattern.casefold()):
+                return pattern, spec
+        return None
+
+    # Two wildcards use the per-pattern loop; more are fused into one alternation.
+    for entries in (overrides[:4], overrides):
+        index = _OverrideIndex(entries)
+        for message_id in (
+            "exact-id", "EXACT-ID", "alert-red", "ALERT-blue", "tile-7", "tile-77", "mixed-case", "grid-b1", "x"
+        ):
+            assert index.select(message_id) == scan(entries, message_id)
+    assert _OverrideIndex(overrides[:6]).select("unmatched") is None
+
+
+def test_apply_selects_override_for_casefolded_id_without_plugin_name(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps({"Example": {"matchingPrefixes": ["example."], "example.alert.*": {"color": "red"}}}),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    applied: list[str] = []
+    manager._apply_override = lambda plugin, pattern, *args, **kwargs: applied.append(pattern)  # type: ignore[method-assign]
+
+    manager.apply({"type": "message", "id": "EXAMPLE.Alert.1", "text": "x"})
+
+    assert applied == ["example.alert.*"]
+
+
+def test_grouping_label_for_id_uses_first_matching_group_prefix(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "Example": {
+                    "matchingPrefixes": ["example."],
+                    "idPrefixGroups": {
+                        "metrics": {"idPrefixes": ["Example.Metric."]},
+                        "everything": {"idPrefixes": ["example."]},
+                    },
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+
+    assert manager.grouping_label_for_id("EXAMPLE.metric.rate") == "metrics"
+    assert manager.grouping_label_for_id("example.other") == "everything"
+    assert manager.grouping_label_for_id("unrelated") is None
+
+
+def test_reload_checks_are_throttled_between_payloads(override_file: Path) -> None:
+    override_file.write_text(json.dumps({"Example": {"matchingPrefixes": ["example."]}}), encoding="utf-8")
+    manager = _make_manager(override_file)
+    manager._reload_if_needed()
+    generation = manager.generation
+
+    override_file.write_text(json.dumps({"Other": {"matchingPrefixes": ["other."]}}), encoding="utf-8")
+    mtime = override_file.stat().st_mtime + 5
+    os.utime(override_file, (mtime, mtime))
+    manager._reload_if_needed()
+    assert manager.generation == generation
+
+    manager._last_reload_check_ts = float("-inf")
+    manager._reload_if_needed()
+    assert manager.generation == generation + 1
+    assert manager.infer_plugin_name({"id": "other.1"}) == "Other"
+
+
+def test_apply_without_configured_plugins_leaves_payload_untouched(override_file: Path) -> None:
+    manager = _make_manager(override_file)
+    manager._determine_plugin_name = None  # type: ignore[assignment]
+    payload = {"type": "message", "id": "example.alert.1", "plugin": "Example", "text": "x"}
+
+    manager.apply(payload)
+
+    assert payload == {"type": "message", "id": "example.alert.1", "plugin": "Example", "text": "x"}
+    assert manager.grouping_label_for_id("example.alert.1") is None
+
+
+def test_loaded_plugin_configs_use_slots(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps({"Example": {"idPrefixGroups": {"metrics": {"idPrefixes": ["example.metric."]}}}}),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    config = manager._plugins["example"]
+
+    assert not hasattr(config, "__dict__")
+    assert not hasattr(config.group_specs[0], "__dict__")
+    assert config.group_label_prefixes == (("example.metric.", "metrics"),)
+
+
+def test_vector_diagnostic_span_is_recorded_once_per_id_family(
+    override_file: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    override_file.write_text(
+        json.dumps({"Example": {"matchingPrefixes": ["shape"], "shape-*": {"color": "red"}}}),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    manager._apply_override = lambda *args, **kwargs: None  # type: ignore[method-assign]
+
+    vector = [{"x": 40, "y": 0}, {"x": "bad"}, None, {"x": -10.5, "y": 1}, {"x": 5}]
+    caplog.set_level(logging.INFO)
+    manager.apply({"type": "shape", "shape": "vect", "id": "shape-1", "vector": vector})
+    manager.apply({"type": "shape", "shape": "vect", "id": "shape-2", "vector": [{"x": 900}]})
+
+    assert manager._diagnostic_spans == {("example", "shape")}
+    spans = [record.getMessage() for record in caplog.records if "override-diagnostic" in record.getMessage()]
+    assert spans == [
+        "override-diagnostic plugin=Example id=shape-1 min_x=-10.50 max_x=40.00 center=14.75 span=50.50"
+    ]
+
+
+def test_equal_override_specs_share_one_dict(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "Example": {"example.a": {"color": "red", "size": 2}, "example.b": {"size": 2, "color": "red"}},
+                "Other": {"other.*": {"color": "red", "size": 2}, "other.x": {"color": "blue"}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    example = manager._plugins["example"].overrides
+    other = manager._plugins["other"].overrides
+
+    assert example[0][1] is example[1][1] is other[0][1]
+    assert other[1][1] == {"color": "blue"}
+    assert other[1][1] is not other[0][1]
+
+
+def test_group_prefix_tuple_and_trace_prefixes(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "Example": {
+                    "matchingPrefixes": ["example."],
+                    "idPrefixGroups": {"metrics": {"idPrefixes": ["Example.Metric.", "example.rate."]}},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    manager._debug_config = DebugConfig(trace_enabled=True, trace_payload_ids=("example.metric.", "other-"))
+
+    assert manager._plugins["example"].group_prefix_tuple == ("example.metric.", "example.rate.")
+    assert manager.grouping_label_for_id("example.rate.1") == "metrics"
+    assert manager.grouping_label_for_id("example.misc") is None
+    assert manager._should_trace("Example", "other-1")
+    assert not manager._should_trace("Example", "example.rate.1")
+
+
+def test_force_reload_reuses_parse_of_unchanged_file(override_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    override_file.write_text(json.dumps({"Example": {"matchingPrefixes": ["example."]}}), encoding="utf-8")
+    manager = _make_manager(override_file)
+    parses: list[str] = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        "overlay_client.plugin_overrides.json.loads", lambda text: parses.append(text) or real_loads(text)
+    )
+
+    manager.force_reload()
+    assert parses == []
+    assert manager.infer_plugin_name({"id": "example.1"}) == "Example"
+
+    override_file.write_text(json.dumps({"Example": {"matchingPrefixes": ["changed.prefix."]}}), encoding="utf-8")
+    manager.force_reload()
+    assert len(parses) == 1
+    assert manager._plugins["example"].match_id_prefixes == ("changed.prefix.",)
+
+
+def test_reserved_plugin_keys_are_not_overrides(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "_edit_nonce": "abc",
+                "notes": {"matchingPrefixes": ["notes."]},
+                "Example": {
+                    "notes": {"text": "ignored"},
+                    "matchingPrefixes": ["example."],
+                    "__match__": {"id_prefixes": ["ignored."]},
+                    "example.alert": {"color": "red"},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+
+    # ``notes`` is only reserved inside a plugin block; a plugin named ``notes`` still loads.
+    assert sorted(manager._plugins) == ["example", "notes"]
+    assert [pattern for pattern, _spec in manager._plugins["example"].overrides] == ["example.alert"]
+
+
+def test_group_spec_selection_is_memoised_per_config(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps({"Example": {"idPrefixGroups": {"metrics": {"idPrefixes": ["example.metric."]}}}}),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+    config = manager._plugins["example"]
+
+    assert manager.grouping_key_for("Example", "Example.Metric.rate") == ("Example", "metrics")
+    assert manager.grouping_key_for(" example ", "other") == ("Example", None)
+    assert config.group_spec_cache == {"example.metric.rate": config.group_specs[0], "other": None}
+
+    config.group_spec_cache["other"] = config.group_specs[0]
+    assert manager.grouping_key_for("Example", "other") == ("Example", "metrics")
+
+    manager.force_reload()
+    assert manager.grouping_key_for("Example", "other") == ("Example", None)
+
+
+def test_group_accessors_use_first_spec_for_label(override_file: Path) -> None:
+    override_file.write_text(
+        json.dumps(
+            {
+                "Example": {
+                    "idPrefixGroups": {"metrics": {"idPrefixes": ["example.metric."], "offsetX": 4, "offsetY": 2}},
+                    "grouping": {"groups": {"metrics": {"id_prefixes": ["example.dup."], "offsetX": 99}}},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = _make_manager(override_file)
+
+    assert manager.group_offsets("Example", "metrics") == (4.0, 2.0)
+    assert manager.group_is_configured("example", "metrics")
+    assert not manager.group_is_configured("Example", "missing")
+    assert not manager.group_is_configured("Example", None)
+    assert manager.group_payload_justification("Unknown", "metrics") == "left"
+
+
+def test_prefix_score_uses_exact_then_longest_entry_first() -> None:
+    from prefix_entries import PrefixEntry
+
+    from overlay_client.plugin_overrides import _GroupSpec
+
+    prefixes = (
+        PrefixEntry("ex."),
+        PrefixEntry("ex.long."),
+        PrefixEntry("ex.long.id", "exact"),
+    )
+    spec = _GroupSpec(label=None, prefixes=prefixes, defaults=None)
+    score = PluginOverrideManager._match_prefix_score
+
+    assert spec.prefixes == prefixes
+    assert [entry.value for entry in spec.scored_prefixes] == ["ex.long.id", "ex.long.", "ex."]
+    assert score(spec.scored_prefixes, "ex.long.id") == (2, 10)
+    assert score(spec.scored_prefixes, "ex.long.other") == (1, 8)
+    assert score(spec.scored_prefixes, "ex.short") == (1, 3)
+    assert score(spec.scored_prefixes, "other") is None
+
+
+def test_log_trace_skips_payload_walk_when_debug_is_off(override_file: Path) -> None:
+    manager = _make_manager(override_file)
+    manager._debug_config = DebugConfig(trace_enabled=True)
+
+    class _Vector(list):
+        def __iter__(self):
+            raise AssertionError("vector should not be walked")
+
+    manager._log_trace("Example", "shape-1", "before_override", {"shape": "vect", "vector": _Vector()})
+
+    manager._logger.setLevel(logging.DEBUG)
+    with pytest.raises(AssertionError):
+        manager._log_trace("Example", "shape-1", "before_override", {"shape": "vect", "vector": _Vector()})
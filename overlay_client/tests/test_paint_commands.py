@@ -1,8 +1,11 @@
 from typing import Any, Dict, Tuple
 
-from PyQt6.QtGui import QColor
+import pytest
+from PyQt6.QtGui import QColor, QFontMetrics
+from PyQt6.QtWidgets import QApplication
 
 from overlay_client.paint_commands import (
+    _message_font,
     _MessagePaintCommand,
     _RectPaintCommand,
     _VectorPaintCommand,
@@ -10,6 +13,14 @@ from overlay_client.paint_commands import (
 )
 
 
+@pytest.fixture
+def qt_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
 class _StubLegacyItem:
     def __init__(self, item_id: str) -> None:
         self.item_id = item_id
@@ -62,17 +73,24 @@ class _RecordingPainter:
     def drawText(self, x: int, y: int, text: str) -> None:  # noqa: N802
         self.calls.append(("drawText", x, y, text))
 
+    def drawStaticText(self, x: int, y: int, static) -> None:  # noqa: N802
+        self.calls.append(("drawStaticText", x, y, static.text()))
+
     def drawRect(self, x: int, y: int, w: int, h: int) -> None:  # noqa: N802
         self.calls.append(("drawRect", x, y, w, h))
 
     def drawLine(self, x1: int, y1: int, x2: int, y2: int) -> None:  # noqa: N802
         self.calls.append(("drawLine", x1, y1, x2, y2))
 
+    def drawLines(self, lines) -> None:  # noqa: N802
+        self.calls.append(("drawLines", [(ln.x1(), ln.y1(), ln.x2(), ln.y2()) for ln in lines]))
+
     def drawEllipse(self, *args) -> None:  # noqa: N802
         self.calls.append(("drawEllipse",) + args)
 
 
-def test_message_paint_draws_and_registers_anchor():
+@pytest.mark.pyqt_required
+def test_message_paint_draws_and_registers_anchor(qt_app):
     window = _StubWindow()
     painter = _RecordingPainter()
     cmd = _MessagePaintCommand(
@@ -88,7 +106,8 @@ def test_message_paint_draws_and_registers_anchor():
         cycle_anchor=(2, 3),
     )
     cmd.paint(window, painter, offset_x=5, offset_y=7)
-    assert ("drawText", 15, 12, "hello") in painter.calls
+    ascent = QFontMetrics(_message_font(window, 12.0)).ascent()
+    assert ("drawStaticText", 15, 12 - ascent, "hello") in painter.calls
     assert window._registered["item-1"] == (7, 10)
 
 
@@ -197,7 +216,8 @@ def test_vector_adapter_draw_text_multiline_splits_lines(monkeypatch):
     assert draw_calls[1] == ("drawText", 10, baseline + 12, "Two")
 
 
-def test_message_paint_draws_multiline_text():
+@pytest.mark.pyqt_required
+def test_message_paint_draws_multiline_text(qt_app):
     window = _StubWindow()
     painter = _RecordingPainter()
     cmd = _MessagePaintCommand(
@@ -216,8 +236,238 @@ def test_message_paint_draws_multiline_text():
 
     cmd.paint(window, painter, offset_x=0, offset_y=0)
 
-    draw_calls = [call for call in painter.calls if call[0] == "drawText"]
+    top = 100 - QFontMetrics(_message_font(window, 12.0)).ascent()
+    draw_calls = [call for call in painter.calls if call[0] == "drawStaticText"]
     assert draw_calls == [
-        ("drawText", 10, 100, "Hello"),
-        ("drawText", 10, 105, "World"),
+        ("drawStaticText", 10, top, "Hello"),
+        ("drawStaticText", 10, top + 5, "World"),
+    ]
+
+
+@pytest.mark.pyqt_required
+def test_message_paint_reuses_font_and_split_lines(monkeypatch, qt_app):
+    import overlay_client.paint_commands as paint_commands
+
+    monkeypatch.setattr(paint_commands, "_MESSAGE_FONTS", {})
+    fallback_calls = []
+
+    class _CountingWindow(_StubWindow):
+        def _apply_font_fallbacks(self, font) -> None:  # noqa: ANN001
+            fallback_calls.append(font.family())
+
+    window = _CountingWindow()
+    cmd = _MessagePaintCommand(
+        group_key=("g", None),
+        group_transform=None,
+        legacy_item=_StubLegacyItem("item-cache"),
+        bounds=None,
+        text="A\rB",
+        color=QColor("white"),
+        point_size=11.0,
+        line_spacing=4,
+    )
+
+    first = _RecordingPainter()
+    cmd.paint(window, first, offset_x=0, offset_y=0)
+    second = _RecordingPainter()
+    cmd.paint(window, second, offset_x=0, offset_y=0)
+
+    assert fallback_calls == ["StubFont"]
+    assert cmd._lines == ("A", "B")
+    statics = cmd._static_lines
+    cmd.paint(window, _RecordingPainter(), offset_x=0, offset_y=0)
+    assert cmd._static_lines is statics
+    top = -QFontMetrics(_message_font(window, 11.0)).ascent()
+    assert [c for c in second.calls if c[0] == "drawStaticText"] == [
+        ("drawStaticText", 0, top, "A"),
+        ("drawStaticText", 0, top + 4, "B"),
     ]
+
+
+def test_vector_adapter_reuses_pens_until_opacity_changes(monkeypatch):
+    import overlay_client.paint_commands as paint_commands
+
+    monkeypatch.setattr(paint_commands, "_VECTOR_COLORS", {})
+    monkeypatch.setattr(paint_commands, "_VECTOR_PENS", {})
+    monkeypatch.setattr(paint_commands, "_VECTOR_BRUSHES", {})
+
+    class _FadingWindow(_StubWindow):
+        opacity = 100
+
+        def _payload_opacity_percent(self) -> int:
+            return self.opacity
+
+        def _apply_payload_opacity_color(self, color):
+            return QColor(color.red(), color.green(), color.blue(), int(255 * self.opacity / 100))
+
+    window = _FadingWindow()
+    painter = _RecordingPainter()
+    adapter = _QtVectorPainterAdapter(window, painter)
+
+    adapter.set_pen("#ff0000")
+    adapter.set_pen("#ff0000")
+    window.opacity = 50
+    adapter.set_pen("#ff0000")
+
+    pens = [call[1] for call in painter.calls if call[0] == "setPen"]
+    assert pens[0] is pens[1]
+    assert pens[2] is not pens[0]
+    assert pens[0].width() == 2
+    assert pens[2].color().alpha() == 127
+
+
+@pytest.mark.pyqt_required
+def test_painter_state_skips_repeated_font_and_pen_between_messages(qt_app):
+    from overlay_client.paint_commands import _PainterState
+
+    window = _StubWindow()
+    window._painter_state = _PainterState()
+    painter = _RecordingPainter()
+    commands = [
+        _MessagePaintCommand(
+            group_key=("g", None),
+            group_transform=None,
+            legacy_item=_StubLegacyItem(f"item-{idx}"),
+            bounds=None,
+            text=f"line {idx}",
+            color=QColor("#00ff00"),
+            point_size=9.0,
+        )
+        for idx in range(3)
+    ]
+
+    for cmd in commands:
+        cmd.paint(window, painter, offset_x=0, offset_y=0)
+
+    kinds = [call[0] for call in painter.calls]
+    assert kinds.count("setFont") == 1
+    assert kinds.count("setPen") == 1
+    assert kinds.count("drawStaticText") == 3
+
+    window._painter_state.reset()
+    commands[0].paint(window, painter, offset_x=0, offset_y=0)
+    kinds = [call[0] for call in painter.calls]
+    assert kinds.count("setFont") == 2
+
+
+def test_vector_adapter_memoises_text_block_measurements(monkeypatch):
+    import overlay_client.paint_commands as paint_commands
+
+    created = []
+
+    class _FakeMetrics:
+        def __init__(self, font) -> None:  # noqa: ANN001
+            created.append(font.pointSizeF())
+
+        def horizontalAdvance(self, line: str) -> int:  # noqa: N802
+            return 4 * len(line)
+
+        def lineSpacing(self) -> int:  # noqa: N802
+            return 9
+
+        def height(self) -> int:
+            return 8
+
+    monkeypatch.setattr(paint_commands, "_TEXT_BLOCK_SIZES", {})
+    monkeypatch.setattr(paint_commands, "QFontMetrics", _FakeMetrics)
+    adapter = _QtVectorPainterAdapter(_StubWindow(), _RecordingPainter())
+
+    assert adapter.measure_text_block("ab\r\nabc") == (12, 18)
+    assert adapter.measure_text_block("ab\r\nabc") == (12, 18)
+    assert created == [10.0]
+
+
+def test_vector_adapter_reuses_font_and_metrics_across_labels(monkeypatch):
+    import overlay_client.paint_commands as paint_commands
+
+    class _FakeMetrics:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def lineSpacing(self) -> int:  # noqa: N802
+            return 12
+
+        def height(self) -> int:
+            return 12
+
+        def ascent(self) -> int:
+            return 7
+
+        def descent(self) -> int:
+            return 3
+
+    mapper_calls = []
+
+    class _CountingWindow(_StubWindow):
+        def _compute_legacy_mapper(self):
+            mapper_calls.append("mapper")
+            return object()
+
+    monkeypatch.setattr(paint_commands, "QFontMetrics", _FakeMetrics)
+    adapter = _QtVectorPainterAdapter(_CountingWindow(), _RecordingPainter())
+
+    adapter.draw_text(0, 0, "A", "white")
+    adapter.draw_text(5, 5, "B", "white")
+    adapter.draw_text(5, 5, "C", "white", text_size="large")
+
+    assert mapper_calls == ["mapper", "mapper"]
+    assert len(adapter._fonts) == 1
+
+
+def test_vector_adapter_shares_text_fonts_across_paints(monkeypatch):
+    import overlay_client.paint_commands as paint_commands
+
+    monkeypatch.setattr(paint_commands, "_MESSAGE_FONTS", {})
+    fallback_calls = []
+
+    class _CountingWindow(_StubWindow):
+        def _apply_font_fallbacks(self, font) -> None:  # noqa: ANN001
+            fallback_calls.append(font.family())
+
+    window = _CountingWindow()
+    first = _QtVectorPainterAdapter(window, _RecordingPainter())._text_font()
+    second = _QtVectorPainterAdapter(window, _RecordingPainter())._text_font()
+
+    assert first is second
+    assert fallback_calls == ["StubFont"]
+
+
+def test_paint_commands_use_slots():
+    cmd = _RectPaintCommand(
+        group_key=("g", None),
+        group_transform=None,
+        legacy_item=_StubLegacyItem("item-slots"),
+        bounds=None,
+    )
+    assert not hasattr(cmd, "__dict__")
+    cmd.justification_dx = 2.5
+    assert cmd.justification_dx == 2.5
+
+
+def test_vector_adapter_batches_segments_into_one_draw_call():
+    painter = _RecordingPainter()
+    adapter = _QtVectorPainterAdapter(_StubWindow(), painter)
+    adapter.draw_lines([(0, 0, 5, 5), (5, 5, 9, 1)])
+    adapter.draw_cross_marker(10, 10, 2, "red")
+
+    batches = [call[1] for call in painter.calls if call[0] == "drawLines"]
+    assert batches == [[(0, 0, 5, 5), (5, 5, 9, 1)], [(8, 8, 12, 12), (8, 12, 12, 8)]]
+
+
+def test_message_command_single_line_text_is_not_split():
+    cmd = _MessagePaintCommand(
+        group_key=("g", None),
+        group_transform=None,
+        legacy_item=_StubLegacyItem("item-single"),
+        bounds=None,
+        text="plain text",
+    )
+    multi = _MessagePaintCommand(
+        group_key=("g", None),
+        group_transform=None,
+        legacy_item=_StubLegacyItem("item-multi"),
+        bounds=None,
+        text="a\r\nb\rc\n",
+    )
+    assert cmd._lines == ("plain text",)
+    assert multi._lines == ("a", "b", "c", "")
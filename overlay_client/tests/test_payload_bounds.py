@@ -13,12 +13,22 @@ OVERLAY_ROOT = Path(__file__).resolve().parents[1]
 if str(OVERLAY_ROOT) not in sys.path:
     sys.path.append(str(OVERLAY_ROOT))
 
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
 from overlay_client.group_transform import GroupBounds  # noqa: E402
 from overlay_client.legacy_store import LegacyItem  # noqa: E402
 import payload_transform  # noqa: E402
 from overlay_client.overlay_client import _OverlayBounds  # type: ignore  # noqa: E402
 
 
+@pytest.fixture
+def qt_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
 def _make_message(text: str, scale: float) -> LegacyItem:
     return LegacyItem(
         item_id="msg",
@@ -35,11 +45,11 @@ def _make_message(text: str, scale: float) -> LegacyItem:
     )
 
 
-def test_message_bounds_fit_mode_scales_with_viewport(monkeypatch) -> None:
+def test_message_bounds_fit_mode_scales_with_viewport(monkeypatch, qt_app) -> None:
     fake_width = 200
     fake_height = 40
 
-    def fake_measure(_metrics, _text):
+    def fake_measure(_metrics, _text, _line_spacing=None):
         return fake_width, fake_height
 
     monkeypatch.setattr(payload_transform, "_measure_text_block", fake_measure)
@@ -61,11 +71,11 @@ def test_message_bounds_fit_mode_scales_with_viewport(monkeypatch) -> None:
     assert height == pytest.approx(fake_height / 2.0)
 
 
-def test_message_bounds_fill_mode_uses_text_measurements(monkeypatch) -> None:
+def test_message_bounds_fill_mode_uses_text_measurements(monkeypatch, qt_app) -> None:
     fake_width = 240
     fake_height = 30
 
-    def fake_measure(_metrics, _text):
+    def fake_measure(_metrics, _text, _line_spacing=None):
         return fake_width, fake_height
 
     monkeypatch.setattr(payload_transform, "_measure_text_block", fake_measure)
@@ -95,3 +105,90 @@ def test_overlay_bounds_dataclass_tracks_min_max() -> None:
     assert bounds.max_x == pytest.approx(30.0)
     assert bounds.min_y == pytest.approx(10.0)
     assert bounds.max_y == pytest.approx(60.0)
+
+
+def test_rect_and_vector_bounds_match_transform_meta_helper() -> None:
+    meta = {"pivot": {"x": 10, "y": 5}, "scale": {"x": -2.0, "y": 0.5}, "offset": {"x": 3, "y": -1}}
+    rect = LegacyItem(
+        item_id="rect",
+        kind="rect",
+        data={"x": 4, "y": 6, "w": 8, "h": 10, "__mo_transform__": meta},
+        plugin="test",
+    )
+    vector = LegacyItem(
+        item_id="vec",
+        kind="vector",
+        data={"points": [{"x": 4, "y": 6}, {"x": "bad"}, {"x": 12, "y": 16}], "__mo_transform__": meta},
+        plugin="test",
+    )
+    expected = [
+        payload_transform.apply_transform_meta_to_point(meta, x, y) for x, y in ((4, 6), (12, 6), (4, 16), (12, 16))
+    ]
+
+    for item in (rect, vector):
+        bounds = GroupBounds()
+        payload_transform.accumulate_group_bounds(
+            bounds,
+            item,
+            pixels_per_overlay_unit=1.0,
+            font_family="Eurostile",
+            preset_point_size=lambda _label: 12.0,
+        )
+        assert bounds.min_x == pytest.approx(min(x for x, _ in expected))
+        assert bounds.max_x == pytest.approx(max(x for x, _ in expected))
+        assert bounds.min_y == pytest.approx(min(y for _, y in expected))
+        assert bounds.max_y == pytest.approx(max(y for _, y in expected))
+
+
+def test_text_block_cache_hit_moves_entry_to_most_recent(monkeypatch) -> None:
+    def fail_measure(_metrics, _text, _line_spacing=None):
+        raise AssertionError("cached block should be reused")
+
+    monkeypatch.setattr(payload_transform, "_measure_text_block", fail_measure)
+    hit_key = ("sample", 12.0, "Eurostile", (), 1.0, 0)
+    cache = {hit_key: (50, 10), ("other", 12.0, "Eurostile", (), 1.0, 0): (5, 5)}
+
+    payload_transform.accumulate_group_bounds(
+        GroupBounds(),
+        _make_message("sample", scale=1.0),
+        pixels_per_overlay_unit=1.0,
+        font_family="Eurostile",
+        preset_point_size=lambda _label: 12.0,
+        text_block_cache=cache,
+    )
+
+    assert list(cache)[-1] == hit_key
+    assert cache[hit_key] == (50, 10)
+
+
+def test_text_block_cache_hit_skips_font_metrics(monkeypatch) -> None:
+    def fail_font(*_args, **_kwargs):
+        raise AssertionError("font metrics should not be built on a cache hit")
+
+    monkeypatch.setattr(payload_transform, "QFont", fail_font)
+    cache = {("sample", 12.0, "Eurostile", (), 1.0, 0): (40, 8)}
+    bounds = GroupBounds()
+
+    payload_transform.accumulate_group_bounds(
+        bounds,
+        _make_message("sample", scale=1.0),
+        pixels_per_overlay_unit=2.0,
+        font_family="Eurostile",
+        preset_point_size=lambda _label: 12.0,
+        text_block_cache=cache,
+    )
+
+    assert (bounds.max_x - bounds.min_x) == pytest.approx(20.0)
+    assert (bounds.max_y - bounds.min_y) == pytest.approx(4.0)
+
+
+def test_bounds_font_metrics_are_reused_per_font_key(monkeypatch, qt_app) -> None:
+    monkeypatch.setattr(payload_transform, "_BOUNDS_METRICS", {})
+
+    first = payload_transform._bounds_font_metrics("Eurostile", 12.0, ["Arial"])
+    again = payload_transform._bounds_font_metrics("Eurostile", 12.0, ("Arial",))
+    other = payload_transform._bounds_font_metrics("Eurostile", 14.0, ["Arial"])
+
+    assert first is again
+    assert other is not first
+    assert first[1] == max(first[0].lineSpacing(), first[0].height(), 0)
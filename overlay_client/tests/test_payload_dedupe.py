@@ -45,6 +45,35 @@ def test_message_dedupe_detects_changed_position() -> None:
     assert model.ingest(moved, override_generation=1, group_label="group-a") is True
 
 
+def test_dedupe_distinguishes_hash_colliding_positions() -> None:
+    # CPython hashes -1 and -2 identically; the snapshots must still compare unequal.
+    assert hash(-1) == hash(-2)
+    model = PayloadModel(_trace_logger)
+    payload = {"type": "message", "id": "a", "text": "hi", "color": "red", "x": -1, "y": 2, "ttl": 10}
+    assert model.ingest(payload.copy()) is True
+    moved = dict(payload, x=-2)
+    assert model.ingest(moved) is True
+    item = model.store.get("a")
+    assert item is not None
+    assert item.data["x"] == -2
+
+
+def test_dedupe_handles_unhashable_transform_meta() -> None:
+    model = PayloadModel(_trace_logger)
+    payload = {
+        "id": "msg-t",
+        "type": "message",
+        "text": "hi",
+        "x": 1,
+        "y": 2,
+        "__mo_transform__": {"scale": {"x": 1.0}},
+    }
+    assert model.ingest(payload.copy()) is True
+    assert model.ingest(payload.copy()) is False
+    changed = dict(payload, __mo_transform__={"scale": {"x": 2.0}})
+    assert model.ingest(changed) is True
+
+
 def test_message_dedupe_detects_changed_text() -> None:
     model = PayloadModel(_trace_logger)
     payload = {
@@ -90,16 +119,67 @@ def test_dedupe_refresh_respects_ttl_zero(monkeypatch: pytest.MonkeyPatch) -> No
         "size": "normal",
         "ttl": 0,
     }
-    base_time = 1000.0
-    monkeypatch.setattr("overlay_client.payload_model.time.monotonic", lambda: base_time)
+    base_time = 1_000_000_000_000
+    monkeypatch.setattr("overlay_client.payload_model.time.monotonic_ns", lambda: base_time)
     assert model.ingest(payload.copy(), override_generation=1, group_label="group-a") is True
     item = model.store.get("msg-ttl-zero")
     assert item is not None
     assert item.expiry == base_time
 
-    later_time = 1000.5
-    monkeypatch.setattr("overlay_client.payload_model.time.monotonic", lambda: later_time)
+    later_time = 1_000_500_000_000
+    monkeypatch.setattr("overlay_client.payload_model.time.monotonic_ns", lambda: later_time)
     assert model.ingest(payload.copy(), override_generation=1, group_label="group-a") is False
     item = model.store.get("msg-ttl-zero")
     assert item is not None
     assert item.expiry == later_time
+
+
+def test_len_reports_store_size() -> None:
+    model = PayloadModel(_trace_logger)
+    assert len(model) == 0
+    model.ingest({"id": "a", "type": "message", "text": "x", "ttl": 5})
+    model.ingest({"id": "b", "type": "message", "text": "y", "ttl": 5})
+    assert len(model) == 2
+    assert len(model.store) == 2
+
+
+def test_dedupe_trace_flags_controller_heartbeat() -> None:
+    model = PayloadModel(_trace_logger)
+    payload = {"id": "Overlay-Controller-Status", "type": "message", "text": "ok", "ttl": 5}
+    assert model.ingest(payload.copy(), override_generation=1) is True
+    seen = []
+
+    def _trace(stage, _payload, details):  # noqa: ANN001
+        seen.append((stage, dict(details)))
+
+    assert model.ingest(payload.copy(), trace_fn=_trace, override_generation=1) is False
+    assert seen and seen[0][0] == "payload_model:dedupe_skipped"
+    assert seen[0][1]["reason"] == "controller_heartbeat"
+
+
+def test_dedupe_refresh_extends_expiry_with_coerced_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = PayloadModel(_trace_logger)
+    payload = {"id": "msg-ttl-str", "type": "message", "text": "hello", "ttl": "3"}
+    clock = [1_000_000_000_000]
+    monkeypatch.setattr("overlay_client.payload_model.time.monotonic_ns", lambda: clock[0])
+    monkeypatch.setattr("overlay_client.legacy_processor.time.monotonic_ns", lambda: clock[0])
+    assert model.ingest(payload.copy(), override_generation=1) is True
+    clock[0] += 2_000_000_000
+    assert model.ingest(payload.copy(), override_generation=1) is False
+    item = model.store.get("msg-ttl-str")
+    assert item is not None
+    assert item.expiry == clock[0] + 3_000_000_000
+
+
+def test_purge_expired_drops_dedupe_state_for_removed_items() -> None:
+    model = PayloadModel(_trace_logger)
+    model.ingest({"id": "short", "type": "message", "text": "a", "ttl": 1})
+    model.ingest({"id": "long", "type": "message", "text": "b", "ttl": 60})
+    short_item = model.store.get("short")
+    assert short_item is not None and short_item.expiry is not None
+
+    assert model.purge_expired(short_item.expiry + 1) is True
+    assert model.store.get("short") is None
+    assert "short" not in model._last_snapshots
+    assert "long" in model._last_snapshots
+    assert model.purge_expired(short_item.expiry + 1) is False
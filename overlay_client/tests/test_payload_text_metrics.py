@@ -13,7 +13,7 @@ OVERLAY_ROOT = Path(__file__).resolve().parents[1]
 if str(OVERLAY_ROOT) not in sys.path:
     sys.path.append(str(OVERLAY_ROOT))
 
-from overlay_client.payload_transform import _measure_text_block  # noqa: E402
+from overlay_client.payload_transform import _measure_text_block, _normalise_newlines  # noqa: E402
 
 
 class _FakeMetrics:
@@ -53,3 +53,47 @@ def test_measure_text_block_normalises_windows_line_endings() -> None:
 
     assert width == 9  # "bbb" is widest
     assert height == 24  # 3 lines * 8
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("plain", "plain"), ("a\r\nb", "a\nb"), ("a\rb\nc", "a\nb\nc"), ("a\r\r\nb", "a\n\nb")],
+)
+def test_normalise_newlines_converts_cr_and_crlf(raw: str, expected: str) -> None:
+    assert _normalise_newlines(raw) == expected
+
+
+def test_normalise_newlines_returns_input_without_carriage_returns() -> None:
+    text = "line one\nline two"
+    assert _normalise_newlines(text) is text
+
+
+def test_measure_text_block_skips_lines_that_fail_to_measure() -> None:
+    class _FlakyMetrics(_FakeMetrics):
+        def horizontalAdvance(self, text: str) -> int:  # noqa: N802
+            if text == "boom":
+                raise RuntimeError("unmeasurable")
+            return super().horizontalAdvance(text)
+
+    width, height = _measure_text_block(_FlakyMetrics(advance_per_char=2, line_spacing=5), "abc\nboom\nab")
+
+    assert width == 6
+    assert height == 15
+
+
+def test_measure_text_block_uses_supplied_line_spacing() -> None:
+    class _NoSpacingMetrics(_FakeMetrics):
+        def lineSpacing(self) -> int:  # noqa: N802
+            raise AssertionError("line spacing was supplied by the caller")
+
+    width, height = _measure_text_block(_NoSpacingMetrics(advance_per_char=2), "ab\nabc", 9)
+
+    assert width == 6
+    assert height == 18
+
+
+def test_measure_text_block_keeps_trailing_empty_line() -> None:
+    width, height = _measure_text_block(_FakeMetrics(advance_per_char=2, line_spacing=10), "abc\n")
+
+    assert width == 6
+    assert height == 20
@@ -256,6 +256,16 @@ def test_line_width_respects_override_defaults() -> None:
     assert surface._line_width("custom") == 3
 
 
+def test_mixin_line_width_returns_loaded_ints_and_coerces_raw_values() -> None:
+    surface = _StubSurface()
+    surface._line_widths = {"grid": 5, "vector_line": "3.6", "group_outline": -2}
+    surface._line_width_defaults = {"grid": 1, "vector_line": 2, "group_outline": 1}
+    assert RenderSurfaceMixin._line_width(surface, "grid") == 5
+    assert RenderSurfaceMixin._line_width(surface, "vector_line") == 4
+    assert RenderSurfaceMixin._line_width(surface, "group_outline") == 0
+    assert RenderSurfaceMixin._line_width(surface, "missing") == 1
+
+
 def test_update_auto_legacy_scale_uses_overlay_module_scale_fn(monkeypatch: pytest.MonkeyPatch) -> None:
     import overlay_client.overlay_client as overlay_module
 
@@ -353,3 +363,38 @@ def test_rect_command_valid_border_color_uses_pen(monkeypatch: pytest.MonkeyPatc
     assert cmd.pen.style() == Qt.PenStyle.SolidLine
     assert cmd.pen.color().name() == QColor("#ff00ff").name()
     assert cmd.pen.width() == surface._line_width("legacy_rect")
+
+
+@pytest.mark.parametrize(
+    ("stored", "expected"),
+    [(100, 100), (35, 35), (0, 0), (140, 100), (-5, 0), ("55", 55), (None, 100), (72.6, 73)],
+)
+def test_payload_opacity_percent_returns_clamped_int(stored: object, expected: int) -> None:
+    surface = _StubSurface()
+    surface._payload_opacity = stored
+    assert surface._payload_opacity_percent() == expected
+
+
+@pytest.mark.parametrize("cycle_enabled", [False, True])
+def test_legacy_pass_keeps_cycle_anchor_only_when_cycling(monkeypatch: pytest.MonkeyPatch, cycle_enabled: bool) -> None:
+    surface = _RectSurface()
+    monkeypatch.setattr(
+        "overlay_client.render_surface.build_group_context",
+        lambda *args, **kwargs: _StubGroupContext(),
+    )
+    legacy_item = LegacyItem(
+        item_id="rect-1",
+        kind="rect",
+        data={"color": "#ff00ff", "fill": "#112233", "x": 1.0, "y": 2.0, "w": 3.0, "h": 4.0},
+        plugin="plugin",
+    )
+    surface._cycle_payload_enabled = cycle_enabled
+    surface._payload_model = SimpleNamespace(store={"rect-1": legacy_item})
+    surface._group_coordinator = SimpleNamespace(resolve_group_key=lambda *args: GroupKey("plugin"))
+    surface._grouping_helper = SimpleNamespace(get_transform=lambda key: None)
+    surface._override_manager = None
+
+    commands, *_ = surface._build_legacy_commands_for_pass(_RectStubMapper(), None)
+
+    assert len(commands) == 1
+    assert (commands[0].cycle_anchor is not None) is cycle_enabled
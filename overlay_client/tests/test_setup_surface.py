@@ -71,3 +71,117 @@ def test_paint_event_calls_mixin(monkeypatch, qt_app):
         window._modifier_timer.stop()
         window._tracking_timer.stop()
         window.close()
+
+
+@pytest.mark.pyqt_required
+def test_paint_event_increments_paint_count(monkeypatch, qt_app):
+    window = OverlayWindow(InitialClientSettings(), DebugConfig())
+    try:
+        monkeypatch.setattr(window, "_paint_overlay", lambda painter: None)
+        assert window._paint_count == 0
+
+        window.paintEvent(QPaintEvent(window.rect()))
+        window.paintEvent(QPaintEvent(window.rect()))
+
+        assert window._paint_count == 2
+    finally:
+        window._legacy_timer.stop()
+        window._modifier_timer.stop()
+        window._tracking_timer.stop()
+        window.close()
+
+
+@pytest.mark.pyqt_required
+def test_device_pixel_ratio_is_cached_until_invalidated(qt_app):
+    window = OverlayWindow(InitialClientSettings(), DebugConfig())
+    try:
+        actual = window.devicePixelRatioF()
+        window.show()
+        assert window._dpr_window_connected
+        assert window._dpr_screen is window.windowHandle().screen()
+        assert window._current_physical_size() is not None
+        assert window._cached_dpr == actual
+
+        window._cached_dpr = actual + 1.0
+        assert window._viewport_state().device_ratio == actual + 1.0
+
+        window._invalidate_dpr()
+
+        assert window._viewport_state().device_ratio == actual
+        assert window._cached_dpr == actual
+
+        # Without connected watchers nothing could invalidate it, so it is not cached.
+        window._dpr_window_connected = False
+        window._invalidate_dpr()
+        assert window._viewport_state().device_ratio == actual
+        assert window._cached_dpr is None
+    finally:
+        window._legacy_timer.stop()
+        window._modifier_timer.stop()
+        window._tracking_timer.stop()
+        window.close()
+
+
+class _FakeSignal:
+    def __init__(self) -> None:
+        self.slots: list = []
+
+    def connect(self, slot) -> None:
+        self.slots.append(slot)
+
+    def disconnect(self, slot) -> None:
+        self.slots.remove(slot)
+
+
+class _FakeScreen:
+    def __init__(self) -> None:
+        self.logicalDotsPerInchChanged = _FakeSignal()
+        self.physicalDotsPerInchChanged = _FakeSignal()
+
+
+@pytest.mark.pyqt_required
+def test_dpr_watch_follows_only_the_current_screen(qt_app):
+    window = OverlayWindow(InitialClientSettings(), DebugConfig())
+    try:
+        first, second = _FakeScreen(), _FakeScreen()
+        window._cached_dpr = 2.0
+
+        window._handle_dpr_screen_changed(first)
+        window._watch_screen_dpi(first)
+        assert window._cached_dpr is None
+        assert len(first.logicalDotsPerInchChanged.slots) == 1
+
+        window._handle_dpr_screen_changed(second)
+        assert window._dpr_screen is second
+        assert first.logicalDotsPerInchChanged.slots == []
+        assert first.physicalDotsPerInchChanged.slots == []
+        assert len(second.physicalDotsPerInchChanged.slots) == 1
+    finally:
+        window._legacy_timer.stop()
+        window._modifier_timer.stop()
+        window._tracking_timer.stop()
+        window.close()
+
+
+@pytest.mark.pyqt_required
+def test_font_bound_changes_coalesce_into_one_refresh(monkeypatch, qt_app):
+    window = OverlayWindow(InitialClientSettings(), DebugConfig())
+    try:
+        calls = []
+        monkeypatch.setattr(window, "_update_label_fonts", lambda: calls.append("labels"))
+        monkeypatch.setattr(window, "_notify_font_bounds_changed", lambda: calls.append("notice"))
+
+        window.set_font_bounds(8.0, 30.0)
+        window.set_font_bounds(9.0, 31.0)
+        assert calls == []
+
+        qt_app.processEvents()
+
+        assert calls == ["labels", "notice"]
+        assert window._font_min_point == 9.0
+        assert window._font_refresh_pending is False
+    finally:
+        window._legacy_timer.stop()
+        window._modifier_timer.stop()
+        window._tracking_timer.stop()
+        window.close()
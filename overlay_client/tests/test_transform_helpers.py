@@ -9,8 +9,18 @@ from overlay_client.transform_helpers import (
     compute_vector_transform,
 )
 from overlay_client.payload_builders import build_group_context
-from overlay_client.payload_transform import build_payload_transform_context
+from overlay_client.payload_transform import (
+    apply_transform_meta_to_point,
+    build_payload_transform_context,
+    determine_group_anchor,
+    logical_mapping,
+    remap_point,
+    remap_rect_points,
+    remap_vector_points,
+    transform_components,
+)
 from overlay_client.group_transform import GroupTransform
+from overlay_client.legacy_store import LegacyItem
 from overlay_client.viewport_helper import ScaleMode, ViewportTransform
 from overlay_client.viewport_transform import FillAxisMapping, FillViewport, LegacyMapper, ViewportState
 
@@ -445,3 +455,96 @@ def test_compute_vector_transform_with_anchor_translation_and_bounds():
     assert raw_min_x == 1.0
     assert trace_cb is not None
     assert any(stage == "paint:raw_points" for stage, _ in calls)
+
+
+def test_remap_rect_points_clamps_only_non_overflowing_axes():
+    fill = _fill(overflow_x=True)
+    context = build_payload_transform_context(fill)
+
+    points = remap_rect_points(fill, None, -20.0, -30.0, 2000.0, 2000.0, context)
+
+    assert points == [(-20.0, 0.0), (1980.0, 0.0), (-20.0, 960.0), (1980.0, 960.0)]
+
+
+def test_remap_vector_points_clamps_and_skips_invalid_points():
+    fill = _fill()
+    context = build_payload_transform_context(fill)
+    raw = [{"x": -5, "y": 10}, {"x": "bad"}, "skip", {"x": 5000, "y": 5000}]
+
+    points = remap_vector_points(fill, None, raw, context)  # type: ignore[arg-type]
+
+    assert [(x, y) for x, y, _ in points] == [(0.0, 10.0), (1280.0, 960.0)]
+    assert [point for _, _, point in points] == [raw[0], raw[3]]
+
+
+def test_fill_axis_remap_many_matches_scalar_remap():
+    axis = FillAxisMapping()
+    values = [-3.5, 0.1, 12.25, 640.3]
+
+    batched = axis.remap_many(values, 10.7, 1.3, -2.1)
+
+    assert batched == [axis.remap(value, 10.7, 1.3, -2.1) for value in values]
+
+
+def test_fill_axis_remap_keeps_pivot_expression():
+    axis = FillAxisMapping()
+
+    for raw in (-3.5, 0.1, 12.25, 640.3):
+        assert axis.remap(raw, 10.7, 1.3, -2.1) == 10.7 + (raw - 10.7) * 1.3 + -2.1
+
+
+def test_transform_components_accepts_numbers_strings_and_junk():
+    meta = {"pivot": {"x": 2, "y": "3.5"}, "scale": {"x": 1.5, "y": None}, "offset": {"x": True, "y": "bad"}}
+
+    assert transform_components(meta) == (2.0, 3.5, 1.5, 1.0, 1.0, 0.0)
+
+
+def test_logical_mapping_prefers_original_geometry_when_present():
+    with_points = {"x": 5, "__mo_transform__": {"original": {"points": [{"x": 1, "y": 2}]}}}
+    with_height = {"x": 5, "__mo_transform__": {"original": {"h": 10}}}
+    without_geometry = {"x": 5, "__mo_transform__": {"original": {"label": "n/a"}}}
+
+    assert logical_mapping(with_points) is with_points["__mo_transform__"]["original"]
+    assert logical_mapping(with_height) is with_height["__mo_transform__"]["original"]
+    assert logical_mapping(without_geometry) is without_geometry
+
+
+def test_apply_transform_meta_identity_ignores_pivot():
+    meta = {"pivot": {"x": 1e16, "y": -3.0}, "scale": {"x": 1, "y": 1}, "offset": {"x": 0, "y": 0}}
+
+    assert apply_transform_meta_to_point(meta, 0.1, 0.2, 1.0, 2.0) == (1.1, 2.2)
+    assert apply_transform_meta_to_point(meta, 0.1, 0.2, float("nan"), float("inf")) == (0.1, 0.2)
+
+
+def test_determine_group_anchor_uses_first_mapping_vector_point():
+    item = LegacyItem(
+        item_id="vec",
+        kind="vector",
+        data={"points": ["skip", {"x": 4, "y": "6"}, {"x": 100, "y": 100}], "__mo_transform__": {"offset": {"x": 1}}},
+    )
+    empty = LegacyItem(item_id="empty", kind="vector", data={"points": ["skip"]})
+
+    assert determine_group_anchor(item) == (5.0, 6.0)
+    assert determine_group_anchor(empty) == (0.0, 0.0)
+
+
+def test_remap_point_without_meta_matches_identity_fill_remap():
+    fill = _fill()
+    context = build_payload_transform_context(fill)
+
+    assert remap_point(fill, None, 12.5, -4.0) == fill.remap_point(12.5, -4.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0)
+    assert remap_point(fill, None, 12.5, -4.0, context) == (12.5, 0.0)
+    assert remap_point(fill, {"scale": {"x": 2.0}}, 12.5, 3.0, context) == (25.0, 3.0)
+
+
+def test_build_payload_transform_context_reuses_instances_per_overflow_state():
+    fill = _fill()
+
+    first = build_payload_transform_context(fill)
+    again = build_payload_transform_context(_fill())
+    overflowing = build_payload_transform_context(fill, overflow_x=True)
+
+    assert first is again
+    assert overflowing is not first
+    assert overflowing.axis_x.overflow is True
+    assert overflowing.axis_y == first.axis_y
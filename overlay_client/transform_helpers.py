@@ -196,8 +196,9 @@ def compute_rect_transform(
     reference_overlay_bounds: Optional[Tuple[float, float, float, float]] = None
     effective_anchor: Optional[Tuple[float, float]] = None
     if mapper.transform.mode is ScaleMode.FILL:
+        inverse_base = base_anchor_point or anchor_for_transform
         transformed_overlay = [
-            apply_inverse_group_scale(px, py, anchor_for_transform, base_anchor_point or anchor_for_transform, fill)
+            apply_inverse_group_scale(px, py, anchor_for_transform, inverse_base, fill)
             for px, py in transformed_overlay
         ]
         base_overlay_points = [tuple(pt) for pt in transformed_overlay]
@@ -327,13 +328,16 @@ def compute_vector_transform(
     base_overlay_min_y = float("inf")
     base_overlay_max_x = float("-inf")
     base_overlay_max_y = float("-inf")
+    # Resolve the per-item invariants once instead of per point.
+    is_fill = mapper.transform.mode is ScaleMode.FILL
+    inverse_base = base_anchor_point or anchor_for_transform
     for ox, oy, original_point in remapped:
-        if mapper.transform.mode is ScaleMode.FILL:
+        if is_fill:
             ox, oy = apply_inverse_group_scale(
                 ox,
                 oy,
                 anchor_for_transform,
-                base_anchor_point or anchor_for_transform,
+                inverse_base,
                 fill,
             )
             base_ox = ox
@@ -364,12 +368,12 @@ def compute_vector_transform(
             base_overlay_max_y = base_oy
         transformed_points.append(new_point)
     effective_anchor: Optional[Tuple[float, float]] = None
-    if mapper.transform.mode is ScaleMode.FILL and selected_anchor is not None:
+    if is_fill and selected_anchor is not None:
         transformed_anchor = apply_inverse_group_scale(
             selected_anchor[0],
             selected_anchor[1],
             anchor_for_transform,
-            base_anchor_point or anchor_for_transform,
+            inverse_base,
             fill,
         )
         effective_anchor = (
@@ -385,10 +389,11 @@ def compute_vector_transform(
     trace_cb = trace_fn if trace_fn is not None and not collect_only else None
 
     screen_points: List[Tuple[int, int]] = []
+    fill_scale = fill.scale
     for point in transformed_points:
         try:
-            mapped_x = float(point.get("x", 0.0)) * fill.scale + base_offset_x
-            mapped_y = float(point.get("y", 0.0)) * fill.scale + base_offset_y
+            mapped_x = float(point.get("x", 0.0)) * fill_scale + base_offset_x
+            mapped_y = float(point.get("y", 0.0)) * fill_scale + base_offset_y
         except (TypeError, ValueError):
             continue
         px = int(round(mapped_x))
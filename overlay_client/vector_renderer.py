@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Callable, List, Mapping, Optional
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
 
 
 class VectorPainterAdapter:
     def set_pen(self, color: str, *, width: Optional[int] = None) -> None: ...
     def draw_line(self, x1: int, y1: int, x2: int, y2: int) -> None: ...
+
+    def draw_lines(self, segments: Sequence[Tuple[int, int, int, int]]) -> None:
+        """Draw several segments with the current pen; adapters may batch this."""
+        for x1, y1, x2, y2 in segments:
+            self.draw_line(x1, y1, x2, y2)
+
     def draw_circle_marker(self, x: int, y: int, radius: int, color: str) -> None: ...
     def draw_cross_marker(self, x: int, y: int, size: int, color: str) -> None: ...
     def draw_text(self, x: int, y: int, text: str, color: str, *, text_size: Optional[str] = None) -> None: ...
@@ -117,11 +123,13 @@ def render_vector(
         )
 
     if len(points) >= 2:
-        for idx in range(len(points) - 1):
-            adapter.set_pen(base_color)
-            x1, y1 = scaled_points[idx]
-            x2, y2 = scaled_points[idx + 1]
-            adapter.draw_line(x1, y1, x2, y2)
+        adapter.set_pen(base_color)
+        adapter.draw_lines(
+            [
+                (x1, y1, x2, y2)
+                for (x1, y1), (x2, y2) in zip(scaled_points, scaled_points[1:])
+            ]
+        )
 
     for idx, point in enumerate(points):
         marker = (point.get("marker") or "").lower()
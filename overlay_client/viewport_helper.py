@@ -15,7 +15,7 @@ class ScaleMode(str, Enum):
     FILL = "fill"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewportTransform:
     """Resolved scale/offset details for rendering the legacy canvas."""
 
@@ -3,20 +3,20 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from overlay_client.group_transform import GroupTransform
 from overlay_client.viewport_helper import ViewportTransform
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewportState:
     width: float
     height: float
     device_ratio: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LegacyMapper:
     scale_x: float
     scale_y: float
@@ -25,13 +25,17 @@ class LegacyMapper:
     transform: ViewportTransform
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FillAxisMapping:
     def remap(self, raw: float, pivot: float, scale_meta: float, offset_meta: float) -> float:
         return pivot + (raw - pivot) * scale_meta + offset_meta
 
+    def remap_many(self, values: Sequence[float], pivot: float, scale_meta: float, offset_meta: float) -> List[float]:
+        """Remap a batch of raw values with the same expression as :meth:`remap`."""
+        return [pivot + (raw - pivot) * scale_meta + offset_meta for raw in values]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FillViewport:
     scale: float
     base_offset_x: float
@@ -49,22 +53,6 @@ class FillViewport:
     band_anchor_x: float = 0.0
     band_anchor_y: float = 0.0
 
-    def overlay_mapper_x(self, pivot: float, scale_meta: float, offset_meta: float) -> Callable[[float], float]:
-        axis = self.axis_x
-
-        def mapper(raw: float) -> float:
-            return axis.remap(raw, pivot, scale_meta, offset_meta)
-
-        return mapper
-
-    def overlay_mapper_y(self, pivot: float, scale_meta: float, offset_meta: float) -> Callable[[float], float]:
-        axis = self.axis_y
-
-        def mapper(raw: float) -> float:
-            return axis.remap(raw, pivot, scale_meta, offset_meta)
-
-        return mapper
-
     def remap_point(
         self,
         raw_x: float,
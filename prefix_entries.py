@@ -33,7 +33,8 @@ class PrefixEntry:
 
     @property
     def value_cf(self) -> str:
-        return self.value.casefold()
+        # ``value`` is casefolded in ``__post_init__`` and casefolding is idempotent.
+        return self.value
 
     @property
     def key(self) -> Tuple[str, str]:
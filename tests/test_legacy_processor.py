@@ -143,8 +143,8 @@ def test_process_vector_single_point_without_marker_is_dropped():
 def test_ttl_purge(monkeypatch: pytest.MonkeyPatch):
     store = LegacyItemStore()
 
-    base_time = 1000.0
-    monkeypatch.setattr("legacy_processor.time.monotonic", lambda: base_time)
+    base_time = 1_000_000_000_000
+    monkeypatch.setattr("legacy_processor.time.monotonic_ns", lambda: base_time)
 
     process_legacy_payload(
         store,
@@ -157,18 +157,18 @@ def test_ttl_purge(monkeypatch: pytest.MonkeyPatch):
     )
     item = store.get("msg-ttl")
     assert item is not None
-    assert item.expiry is not None
+    assert item.expiry == base_time + 1_000_000_000
 
     # Advance beyond expiry and purge
-    assert store.purge_expired(base_time + 2.0) is True
+    assert store.purge_expired(base_time + 2_000_000_000) is True
     assert store.get("msg-ttl") is None
 
 
 def test_ttl_zero_expires_next_purge(monkeypatch: pytest.MonkeyPatch):
     store = LegacyItemStore()
 
-    base_time = 1000.0
-    monkeypatch.setattr("legacy_processor.time.monotonic", lambda: base_time)
+    base_time = 1_000_000_000_000
+    monkeypatch.setattr("legacy_processor.time.monotonic_ns", lambda: base_time)
 
     process_legacy_payload(
         store,
@@ -185,15 +185,15 @@ def test_ttl_zero_expires_next_purge(monkeypatch: pytest.MonkeyPatch):
 
     assert store.purge_expired(base_time) is False
     assert store.get("msg-ttl-zero") is not None
-    assert store.purge_expired(base_time + 0.01) is True
+    assert store.purge_expired(base_time + 10_000_000) is True
     assert store.get("msg-ttl-zero") is None
 
 
 def test_negative_ttl_expires_next_purge(monkeypatch: pytest.MonkeyPatch):
     store = LegacyItemStore()
 
-    base_time = 2000.0
-    monkeypatch.setattr("legacy_processor.time.monotonic", lambda: base_time)
+    base_time = 2_000_000_000_000
+    monkeypatch.setattr("legacy_processor.time.monotonic_ns", lambda: base_time)
 
     process_legacy_payload(
         store,
@@ -208,5 +208,68 @@ def test_negative_ttl_expires_next_purge(monkeypatch: pytest.MonkeyPatch):
     assert item is not None
     assert item.expiry == base_time
 
-    assert store.purge_expired(base_time + 0.01) is True
+    assert store.purge_expired(base_time + 10_000_000) is True
     assert store.get("msg-ttl-negative") is None
+
+
+def test_process_vector_coerces_non_int_points_and_skips_invalid():
+    store = LegacyItemStore()
+    changed = process_legacy_payload(
+        store,
+        {
+            "type": "shape",
+            "shape": "vect",
+            "id": "vect-mixed",
+            "color": "white",
+            "vector": [
+                {"x": 1.7, "y": "4"},
+                {"x": "bad", "y": 0},
+                {"x": 5, "y": 6},
+            ],
+            "ttl": 6,
+        },
+    )
+    assert changed is True
+    item = store.get("vect-mixed")
+    assert item is not None
+    assert [(point["x"], point["y"]) for point in item.data["points"]] == [(1, 4), (5, 6)]
+
+
+@pytest.mark.parametrize(
+    "raw, removed",
+    [
+        ({"id": "raw1"}, True),
+        ({}, True),
+        ({"id": "raw1", "text": "   ", "x": 0}, True),
+        ({"id": "raw1", "text": "Hello"}, False),
+        ({"id": "raw1", "shape": "rect"}, False),
+        ({"id": "raw1", "Vector": [{"x": 1, "y": 2}]}, False),
+        ({"id": "raw1", "X": 5}, False),
+    ],
+)
+def test_raw_payload_clears_only_when_id_only(raw, removed):
+    store = LegacyItemStore()
+    process_legacy_payload(store, {"type": "message", "id": "raw1", "text": "Existing"})
+    changed = process_legacy_payload(store, {"type": "raw", "id": "raw1", "raw": raw})
+    assert changed is removed
+    assert (store.get("raw1") is None) is removed
+
+
+def test_process_vector_stores_bool_points_as_ints():
+    store = LegacyItemStore()
+    process_legacy_payload(
+        store,
+        {
+            "type": "shape",
+            "shape": "vect",
+            "id": "vect-bool",
+            "color": "white",
+            "vector": [{"x": True, "y": False}, {"x": 3, "y": 4}],
+            "ttl": 6,
+        },
+    )
+    item = store.get("vect-bool")
+    assert item is not None
+    point = item.data["points"][0]
+    assert (point["x"], point["y"]) == (1, 0)
+    assert type(point["x"]) is int and type(point["y"]) is int  # noqa: E721
@@ -96,6 +96,14 @@ def test_render_vector_generates_lines_and_markers():
     assert any(op == "cross" for op, _ in adapter.operations)
 
 
+def test_render_vector_sets_line_pen_once_for_the_polyline():
+    adapter = FakeAdapter()
+    data = {"base_color": "#ffffff", "points": [{"x": 0, "y": 0}, {"x": 1, "y": 0}, {"x": 1, "y": 1}, {"x": 0, "y": 1}]}
+    render_vector(adapter, data, scale_x=1.0, scale_y=1.0)
+
+    assert [op for op, _ in adapter.operations] == ["pen", "line", "line", "line"]
+
+
 def test_render_vector_lines_use_base_color_markers_use_point_color():
     adapter = FakeAdapter()
     data = {